@@ -20,11 +20,13 @@ RESOURCE_MAP = {
 OP_MAP = {"=": "eq", ">=": "gte", "<=": "lte", ">": "gt", "<": "lt", "!=": "not"}
 
 DB_QUEUE_NAME = "db_q"
+DELAYED_QUEUE_NAME = "inventory:collecting-delayed-tasks"
 
 NOT_COUNT = 0
 CREATED = 1
 UPDATED = 2
 ERROR = 3
+UNCHANGED = 4
 
 JOB_TASK_STAT_EXPIRE_TIME = 3600  # 1 hour
 WATCHDOG_WAITING_TIME = 30  # wait 30 seconds, before watchdog works
@@ -26,6 +26,8 @@ CACHES = {
 JOB_TIMEOUT = 2  # 2 Hours
 JOB_TERMINATION_TIME = 2 * 30  # 2 Months
 RESOURCE_TERMINATION_TIME = 3 * 30  # 3 Months
+RESOURCE_TERMINATION_CHUNK_SIZE = 1000  # Cloud services per bulk delete
+RESOURCE_TERMINATION_CHUNK_INTERVAL = 1  # Seconds between chunks
 DEFAULT_DELETE_POLICIES = {
     "inventory.CloudService": 48,  # 2 Days
     "inventory.CloudServiceType": 72,  # 3 Days
@@ -34,6 +36,34 @@ DEFAULT_DELETE_POLICIES = {
 DEFAULT_DISCONNECTED_STATE_DELETE_POLICY = 3  # 3 Count
 DELETE_EXCLUDE_DOMAINS = []
 
+# Collecting Settings
+COLLECTING_BATCH_SIZE = 100  # Number of cloud services upserted per bulk write
+COLLECTING_WRITER_COUNT = 0  # Number of writer threads per job task (0: write in the plugin reading thread)
+COLLECTING_QUEUE_SIZE = 1000  # Max number of resources buffered between plugin reader and writers
+COLLECTING_LEASE_TIMEOUT = 300  # Seconds until a concurrency lease expires without heartbeat
+COLLECTING_RETRY_DELAY = 60  # Seconds before a job task waiting for concurrency is retried
+COLLECTION_STATE_CHUNK_SIZE = 1000  # Number of collection states reconciled per bulk write
+CHANGE_HISTORY_BATCH_SIZE = 500  # Number of change history records inserted per bulk write
+COLLECTING_ROLLBACK_ENABLED = False  # Register rollbacks of collector writes (collecting is idempotent on re-run)
+JOB_TASK_ERROR_LIMIT = 100  # Max number of errors saved per job task (others are counted as overflow)
+JOB_TASK_ERROR_SAMPLE_SIZE = 5  # Number of sample payloads saved per aggregated error
+JOB_TASK_ERROR_FLUSH_INTERVAL = 10  # Seconds between saving buffered errors of a job task
+COLLECTING_MATCH_INDEX_KEYS = [  # Match rule keys of the workspace loaded in memory per job task
+    "reference.resource_id",
+    "name",
+    "provider",
+    "cloud_service_group",
+    "cloud_service_type",
+    "account",
+    "region_code",
+]
+COLLECTING_MATCH_INDEX_LIMIT = 300000  # Skip match index over this number of cloud services in the workspace
+IDENTITY_SNAPSHOT_TTL = 300  # Seconds until projects and service accounts for collector rules are reloaded
+IDENTITY_SNAPSHOT_PAGE_SIZE = 1000  # Number of projects or service accounts loaded per identity call
+COLLECT_TASK_WORKER_COUNT = 10  # Number of threads resolving secrets and sub tasks of a collect request
+COLLECT_TASK_TIMEOUT = 60  # Seconds to wait for the secrets and sub tasks of all secrets
+PLUGIN_ENDPOINT_CACHE_TTL = 60  # Seconds to cache plugin endpoints for collecting (0: disable)
+
 # Cloud Service Stats Schedule Settings
 STATS_SCHEDULE_HOUR = 15  # Hour (UTC)
 
@@ -41,6 +71,12 @@ STATS_SCHEDULE_HOUR = 15  # Hour (UTC)
 METRIC_SCHEDULE_HOUR = 0  # Hour (UTC)
 METRIC_QUERY_TTL = 3  # Days
 
+# Query Plan Settings
+QUERY_PLAN_CACHE_TTL = 300  # Seconds to reuse rewritten cloud service queries (0: disable)
+QUERY_PLAN_CACHE_SIZE = 1000  # Max number of rewritten queries cached per process
+QUERY_PLAN_PROJECT_GROUP_TTL = 30  # Seconds to reuse queries with expanded project groups
+PROJECT_GROUP_TREE_CACHE_TTL = 300  # Seconds to cache projects of each project group
+
 # Handler Settings
 HANDLERS = {
     # "authentication": [{
@@ -20,51 +20,59 @@ def CollectionInfo(vo):
         return None
 
 
-def CloudServiceInfo(cloud_svc_vo: CloudService, minimal=False, include_metadata=True):
-    info = {
-        "cloud_service_id": cloud_svc_vo.cloud_service_id,
-        "name": cloud_svc_vo.name,
-        "state": cloud_svc_vo.state,
-        "cloud_service_group": cloud_svc_vo.cloud_service_group,
-        "cloud_service_type": cloud_svc_vo.cloud_service_type,
-        "provider": cloud_svc_vo.provider,
-        "region_code": cloud_svc_vo.region_code,
-        "reference": cloud_service_pb2.CloudServiceReference(
-            **cloud_svc_vo.reference.to_dict()
-        )
-        if cloud_svc_vo.reference
-        else None,
-        "project_id": cloud_svc_vo.project_id,
-    }
-
-    if not minimal:
-        info.update(
-            {
-                "account": cloud_svc_vo.account,
-                "instance_type": cloud_svc_vo.instance_type,
-                "instance_size": cloud_svc_vo.instance_size,
-                "ip_addresses": cloud_svc_vo.ip_addresses,
-                "data": change_struct_type(cloud_svc_vo.data),
-                "tags": change_struct_type(
-                    _change_tags_without_hash(cloud_svc_vo.tags)
-                ),
-                "tag_keys": change_struct_type(cloud_svc_vo.tag_keys),
-                "collection_info": CollectionInfo(cloud_svc_vo.collection_info),
-                "workspace_id": cloud_svc_vo.workspace_id,
-                "domain_id": cloud_svc_vo.domain_id,
-                "created_at": utils.datetime_to_iso8601(cloud_svc_vo.created_at),
-                "updated_at": utils.datetime_to_iso8601(cloud_svc_vo.updated_at),
-                "deleted_at": utils.datetime_to_iso8601(cloud_svc_vo.deleted_at),
-            }
-        )
-
-        if include_metadata:
-            info.update(
-                {
-                    "metadata": change_struct_type(cloud_svc_vo.metadata),
-                }
-            )
+def CloudServiceReferenceInfo(vo):
+    if vo:
+        return cloud_service_pb2.CloudServiceReference(**vo.to_dict())
+    else:
+        return None
+
+
+# field converters of CloudServiceInfo, minimal fields first
+_FIELD_CONVERTERS = {
+    "cloud_service_id": lambda vo: vo.cloud_service_id,
+    "name": lambda vo: vo.name,
+    "state": lambda vo: vo.state,
+    "cloud_service_group": lambda vo: vo.cloud_service_group,
+    "cloud_service_type": lambda vo: vo.cloud_service_type,
+    "provider": lambda vo: vo.provider,
+    "region_code": lambda vo: vo.region_code,
+    "reference": lambda vo: CloudServiceReferenceInfo(vo.reference),
+    "project_id": lambda vo: vo.project_id,
+    "account": lambda vo: vo.account,
+    "instance_type": lambda vo: vo.instance_type,
+    "instance_size": lambda vo: vo.instance_size,
+    "ip_addresses": lambda vo: vo.ip_addresses,
+    "data": lambda vo: change_struct_type(vo.data),
+    "tags": lambda vo: change_struct_type(_change_tags_without_hash(vo.tags)),
+    "tag_keys": lambda vo: change_struct_type(vo.tag_keys),
+    "collection_info": lambda vo: CollectionInfo(vo.collection_info),
+    "workspace_id": lambda vo: vo.workspace_id,
+    "domain_id": lambda vo: vo.domain_id,
+    "created_at": lambda vo: utils.datetime_to_iso8601(vo.created_at),
+    "updated_at": lambda vo: utils.datetime_to_iso8601(vo.updated_at),
+    "deleted_at": lambda vo: utils.datetime_to_iso8601(vo.deleted_at),
+    "metadata": lambda vo: change_struct_type(vo.metadata),
+}
+
+_MINIMAL_FIELDS = [
+    "cloud_service_id",
+    "name",
+    "state",
+    "cloud_service_group",
+    "cloud_service_type",
+    "provider",
+    "region_code",
+    "reference",
+    "project_id",
+]
+
 
+def CloudServiceInfo(
+    cloud_svc_vo: CloudService, minimal=False, include_metadata=True, only=None
+):
+    fields = _get_info_fields(minimal, include_metadata, tuple(only or []))
+
+    info = {field: _FIELD_CONVERTERS[field](cloud_svc_vo) for field in fields}
     return cloud_service_pb2.CloudServiceInfo(**info)
 
 
@@ -75,6 +83,24 @@ def CloudServicesInfo(cloud_svc_vos, total_count, **kwargs):
     )
 
 
+@functools.lru_cache(maxsize=128)
+def _get_info_fields(minimal: bool, include_metadata: bool, only: tuple) -> list:
+    if minimal:
+        fields = list(_MINIMAL_FIELDS)
+    else:
+        fields = list(_FIELD_CONVERTERS.keys())
+        if not include_metadata:
+            fields.remove("metadata")
+
+    if only:
+        # fields which are not projected are not loaded, so they are not converted
+        # e.g. only = ['name', 'data.size'] -> fields = ['name', 'data']
+        projected_fields = set([key.split(".", 1)[0] for key in only])
+        fields = [field for field in fields if field in projected_fields]
+
+    return fields
+
+
 def _change_tags_without_hash(tags) -> dict:
     changed_tags = {}
     for provider, hashed_tags in tags.items():
@@ -9,7 +9,7 @@ __all__ = ["JobInfo", "JobsInfo"]
 def JobInfo(job_vo: Job, minimal=False):
     info = {
         "job_id": job_vo.job_id,
-        "status": job_vo.status,
+        "status": _get_job_status(job_vo.status),
         "collector_id": job_vo.collector_id,
         "plugin_id": job_vo.plugin_id,
         "created_at": utils.datetime_to_iso8601(job_vo.created_at),
@@ -35,6 +35,14 @@ def JobInfo(job_vo: Job, minimal=False):
     return job_pb2.JobInfo(**info)
 
 
+def _get_job_status(status: str) -> str:
+    # a planning job is exposed as IN_PROGRESS (JobInfo.Status has no PLANNING)
+    if status == "PLANNING":
+        return "IN_PROGRESS"
+
+    return status
+
+
 def JobsInfo(vos, total_count, **kwargs):
     return job_pb2.JobsInfo(
         results=list(map(functools.partial(JobInfo, **kwargs), vos)),
@@ -41,13 +41,16 @@ class CloudService(BaseAPI, cloud_service_pb2_grpc.CloudServiceServicer):
     def list(self, request, context):
         params, metadata = self.parse_request(request, context)
 
+        only = self.get_only(params)
+
         with self.locator.get_service('CloudServiceService', metadata) as cloud_svc_service:
             cloud_svc_vos, total_count = cloud_svc_service.list(params)
             return self.locator.get_info('CloudServicesInfo',
                                          cloud_svc_vos,
                                          total_count,
                                          minimal=self.get_minimal(params),
-                                         include_metadata=False)
+                                         include_metadata=False,
+                                         only=only)
 
     def export(self, request, context):
         params, metadata = self.parse_request(request, context)
@@ -66,3 +69,8 @@ class CloudService(BaseAPI, cloud_service_pb2_grpc.CloudServiceServicer):
 
         with self.locator.get_service('CloudServiceService', metadata) as cloud_svc_service:
             return self.locator.get_info('StatisticsInfo', cloud_svc_service.stat(params))
+
+    @staticmethod
+    def get_only(params: dict) -> list:
+        # copied before the service, because the query is changed while listing
+        return list(params.get('query', {}).get('only', []))
@@ -0,0 +1,34 @@
+import json
+import logging
+from spaceone.core.scheduler import IntervalScheduler
+from spaceone.inventory.lib.concurrency import DelayedQueue, get_redis_connection
+from spaceone.inventory.conf.collector_conf import DELAYED_QUEUE_NAME
+
+__all__ = ["CollectingScheduler"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CollectingScheduler(IntervalScheduler):
+    """
+    Push delayed collecting tasks (waiting for a concurrency lease) back to the queue when they are due.
+    """
+
+    def create_task(self):
+        try:
+            conn = get_redis_connection()
+            if conn is None:
+                return []
+
+            delayed_queue = DelayedQueue(conn, DELAYED_QUEUE_NAME)
+            json_tasks = delayed_queue.pop_due_items()
+
+            if len(json_tasks) > 0:
+                _LOGGER.debug(
+                    f"[create_task] delayed collecting tasks: {len(json_tasks)}"
+                )
+
+            return [json.loads(json_task) for json_task in json_tasks]
+        except Exception as e:
+            _LOGGER.error(f"[create_task] failed to get delayed tasks: {e}")
+            return []
@@ -0,0 +1,249 @@
+import logging
+import threading
+from typing import Callable, List
+from spaceone.core import cache, utils
+
+_LOGGER = logging.getLogger(__name__)
+
+_COMPILED_COLLECTOR_RULES = {}
+_LOCAL_VERSIONS = {}
+_LOCK = threading.Lock()
+
+
+class CompiledCollectorRule(object):
+    """
+    Collector rule compiled into a match function
+    The rule does not refer to the CollectorRule document, so it can be shared by all job tasks.
+    """
+
+    def __init__(
+        self,
+        collector_rule_id: str,
+        actions: dict,
+        stop_processing: bool,
+        match: Callable[[dict], bool],
+    ):
+        self.collector_rule_id = collector_rule_id
+        self.actions = actions
+        self.stop_processing = stop_processing
+        self.match = match
+
+
+class CompiledCollectorRules(object):
+    def __init__(
+        self,
+        version: tuple,
+        managed_rules: List[CompiledCollectorRule],
+        custom_rules: List[CompiledCollectorRule],
+        collector_rule_hash: str,
+    ):
+        self.version = version
+        self.managed_rules = managed_rules
+        self.custom_rules = custom_rules
+        self.collector_rule_hash = collector_rule_hash
+
+
+def get_compiled_collector_rules(
+    collector_id: str, domain_id: str, version: tuple
+) -> CompiledCollectorRules:
+    """
+    get compiled collector rules of the process
+    :param collector_id: collector id
+    :param domain_id: domain id
+    :param version: current version from get_collector_rule_version()
+    :return: compiled collector rules, None if not compiled or the version is changed
+    """
+    compiled_rules = _COMPILED_COLLECTOR_RULES.get((domain_id, collector_id))
+
+    if compiled_rules and compiled_rules.version == version:
+        return compiled_rules
+
+    return None
+
+
+def set_compiled_collector_rules(
+    collector_id: str, domain_id: str, compiled_rules: CompiledCollectorRules
+) -> None:
+    with _LOCK:
+        _COMPILED_COLLECTOR_RULES[(domain_id, collector_id)] = compiled_rules
+
+
+def get_collector_rule_version(collector_id: str, domain_id: str) -> tuple:
+    """
+    get version of collector rules
+    :return: (local version, shared version)
+        local version is changed by this process, shared version is changed by any process through the cache.
+    """
+    local_version = _LOCAL_VERSIONS.get((domain_id, collector_id), 0)
+    shared_version = None
+
+    if cache.is_set():
+        try:
+            shared_version = cache.get(_make_version_key(collector_id, domain_id))
+        except Exception as e:
+            _LOGGER.warning(
+                f"[get_collector_rule_version] failed to get version: {e}"
+            )
+
+    return local_version, shared_version
+
+
+def increase_collector_rule_version(collector_id: str, domain_id: str) -> None:
+    with _LOCK:
+        key = (domain_id, collector_id)
+        _LOCAL_VERSIONS[key] = _LOCAL_VERSIONS.get(key, 0) + 1
+        _COMPILED_COLLECTOR_RULES.pop(key, None)
+
+    if cache.is_set():
+        try:
+            cache.increment(_make_version_key(collector_id, domain_id))
+        except Exception as e:
+            _LOGGER.warning(
+                f"[increase_collector_rule_version] failed to increase version: {e}"
+            )
+
+
+def compile_collector_rule(collector_rule_vo) -> CompiledCollectorRule:
+    conditions_policy = collector_rule_vo.conditions_policy
+
+    if conditions_policy == "ALWAYS":
+        match = _match_always
+    else:
+        checks = [
+            _compile_condition(condition.key, condition.value, condition.operator)
+            for condition in collector_rule_vo.conditions
+        ]
+
+        if conditions_policy == "ALL":
+            match = _make_match_all(checks)
+        else:
+            match = _make_match_any(checks)
+
+    return CompiledCollectorRule(
+        collector_rule_vo.collector_rule_id,
+        collector_rule_vo.actions or {},
+        bool(collector_rule_vo.options.stop_processing),
+        match,
+    )
+
+
+def make_collector_rule_hash(collector_rule_vos: list) -> str:
+    collector_rules = []
+    for collector_rule_vo in collector_rule_vos:
+        collector_rules.append(
+            {
+                "collector_rule_id": collector_rule_vo.collector_rule_id,
+                "order": collector_rule_vo.order,
+                "conditions": [
+                    dict(condition.to_mongo())
+                    for condition in collector_rule_vo.conditions
+                ],
+                "conditions_policy": collector_rule_vo.conditions_policy,
+                "actions": collector_rule_vo.actions,
+                "options": dict(collector_rule_vo.options.to_mongo()),
+            }
+        )
+
+    return utils.dict_to_hash({"collector_rules": collector_rules})
+
+
+def _compile_condition(key: str, value: any, operator: str) -> Callable[[dict], bool]:
+    get_value = _compile_key(key)
+
+    if operator == "eq":
+
+        def _check(data: dict) -> bool:
+            data_value = get_value(data)
+            return data_value is not None and data_value == value
+
+    elif operator == "not":
+
+        def _check(data: dict) -> bool:
+            data_value = get_value(data)
+            return data_value is not None and data_value != value
+
+    elif operator in ["contain", "not_contain"]:
+        lower_value = _to_lower(value)
+        is_contain = operator == "contain"
+
+        def _check(data: dict) -> bool:
+            data_value = get_value(data)
+            if data_value is None:
+                return False
+
+            return (_to_lower(data_value).find(lower_value) >= 0) == is_contain
+
+    else:
+
+        def _check(data: dict) -> bool:
+            return False
+
+    return _check
+
+
+def _to_lower(value: any) -> str:
+    # condition values and cloud service values are not always strings (e.g. numbers)
+    if not isinstance(value, str):
+        value = str(value)
+
+    return value.lower()
+
+
+def _compile_key(dotted_key: str) -> Callable[[dict], any]:
+    # same as utils.get_dict_value(), but the key is split only once
+    keys = dotted_key.split(".")
+
+    if len(keys) == 1:
+        key = keys[0]
+
+        def _get_value(data: dict) -> any:
+            if isinstance(data, dict):
+                return data.get(key)
+            return None
+
+        return _get_value
+
+    def _get_nested_value(data: any, index: int) -> any:
+        last_index = len(keys) - 1
+
+        while index < last_index:
+            key = keys[index]
+            if not (isinstance(data, dict) and key in data):
+                return None
+
+            data = data[key]
+            index += 1
+
+            if isinstance(data, list):
+                return [_get_nested_value(item, index) for item in data]
+
+        if isinstance(data, dict):
+            return data.get(keys[last_index])
+        return None
+
+    def _get_value(data: dict) -> any:
+        return _get_nested_value(data, 0)
+
+    return _get_value
+
+
+def _make_match_all(checks: list) -> Callable[[dict], bool]:
+    def _match(data: dict) -> bool:
+        return all([check(data) for check in checks])
+
+    return _match
+
+
+def _make_match_any(checks: list) -> Callable[[dict], bool]:
+    def _match(data: dict) -> bool:
+        return any([check(data) for check in checks])
+
+    return _match
+
+
+def _match_always(data: dict) -> bool:
+    return True
+
+
+def _make_version_key(collector_id: str, domain_id: str) -> str:
+    return f"inventory:collector-rule-version:{domain_id}:{collector_id}"
@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+from typing import List, Union
+from spaceone.core import cache, queue
+from spaceone.core.cache.redis_cache import RedisCache
+from spaceone.core.queue.redis_queue import RedisQueue
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@cache.connect
+def _get_cache_connection(cache_cls):
+    return cache_cls
+
+
+def get_redis_connection():
+    """
+    get redis connection of the default cache
+    :return: redis connection, None if the default cache is not a RedisCache
+    """
+    if not cache.is_set():
+        return None
+
+    try:
+        cache_cls = _get_cache_connection()
+    except Exception as e:
+        _LOGGER.warning(f"[get_redis_connection] failed to connect cache: {e}")
+        return None
+
+    if isinstance(cache_cls, RedisCache):
+        return cache_cls.conn
+
+    return None
+
+
+@queue.connection
+def _get_queue_connection(queue_cls):
+    return queue_cls
+
+
+def put_queue_items(topic: str, items: List[str], chunk_size: int = 1000) -> None:
+    """
+    put items to the queue, in pipelined chunks if the queue is a RedisQueue
+    :param topic: queue name, e.g. 'collector_q'
+    :param items: serialized items
+    :param chunk_size: number of items sent per round trip
+    """
+    queue_cls = _get_queue_connection(topic)
+
+    if not isinstance(queue_cls, RedisQueue):
+        for item in items:
+            queue.put(topic, item)
+        return
+
+    for index in range(0, len(items), chunk_size):
+        pipe = queue_cls.conn.pipeline(transaction=False)
+        for item in items[index : index + chunk_size]:
+            pipe.rpush(queue_cls.channel, item)
+        pipe.execute()
+
+
+# leased time in milliseconds from the clock of redis, not of each worker
+_LEASE_NOW_SCRIPT = """
+redis.replicate_commands()
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+"""
+
+# KEYS[1]: semaphore name, ARGV: holder, limit, lease timeout (seconds)
+_LEASE_ACQUIRE_SCRIPT = (
+    _LEASE_NOW_SCRIPT
+    + """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - tonumber(ARGV[3]) * 1000)
+if redis.call('ZSCORE', KEYS[1], ARGV[1])
+    or redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[1])
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    return 1
+end
+return 0
+"""
+)
+
+# KEYS[1]: semaphore name, ARGV: holder, lease timeout (seconds)
+_LEASE_REFRESH_SCRIPT = (
+    _LEASE_NOW_SCRIPT
+    + """
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[1])
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+)
+
+
+class LeaseSemaphore(object):
+    """
+    Distributed semaphore with expiring leases (sorted set of holder => leased time).
+    A lease that is not refreshed within lease_timeout is released automatically.
+    Leases are checked and scored in lua scripts with the time of redis,
+    so the clock skew of workers does not expire or admit leases.
+    """
+
+    def __init__(self, conn, name: str, limit: int, lease_timeout: int):
+        self.conn = conn
+        self.name = name
+        self.limit = limit
+        self.lease_timeout = lease_timeout
+        self._heartbeats = {}
+        self._acquire_script = conn.register_script(_LEASE_ACQUIRE_SCRIPT)
+        self._refresh_script = conn.register_script(_LEASE_REFRESH_SCRIPT)
+
+    def acquire(self, holder: str) -> bool:
+        is_acquired = self._acquire_script(
+            keys=[self.name], args=[holder, self.limit, self.lease_timeout]
+        )
+
+        if is_acquired:
+            self._start_heartbeat(holder)
+            return True
+
+        return False
+
+    def release(self, holder: str) -> None:
+        if heartbeat := self._heartbeats.pop(holder, None):
+            heartbeat.set()
+
+        self.conn.zrem(self.name, holder)
+
+    def refresh(self, holder: str) -> None:
+        self._refresh_script(keys=[self.name], args=[holder, self.lease_timeout])
+
+    def _start_heartbeat(self, holder: str) -> None:
+        stopped = threading.Event()
+        self._heartbeats[holder] = stopped
+
+        thread = threading.Thread(
+            target=self._run_heartbeat, args=(holder, stopped), daemon=True
+        )
+        thread.start()
+
+    def _run_heartbeat(self, holder: str, stopped: threading.Event) -> None:
+        interval = max(self.lease_timeout / 3, 1)
+
+        while not stopped.wait(interval):
+            try:
+                self.refresh(holder)
+            except Exception as e:
+                _LOGGER.warning(f"[_run_heartbeat] failed to refresh lease: {e}")
+
+
+class DelayedQueue(object):
+    """
+    Queue of items that become available after a delay (sorted set of item => due time).
+    """
+
+    def __init__(self, conn, name: str):
+        self.conn = conn
+        self.name = name
+
+    def put(self, item: str, delay: Union[int, float]) -> None:
+        self.conn.zadd(self.name, {item: time.time() + delay})
+
+    def pop_due_items(self, limit: int = 100) -> List[str]:
+        due_items = []
+        items = self.conn.zrangebyscore(self.name, "-inf", time.time(), 0, limit)
+
+        for item in items:
+            # only one consumer gets the item
+            if self.conn.zrem(self.name, item):
+                if isinstance(item, bytes):
+                    item = item.decode()
+
+                due_items.append(item)
+
+        return due_items
@@ -0,0 +1,128 @@
+import threading
+import time
+from typing import Callable, List, Tuple
+
+
+class ErrorBuffer(object):
+    """
+    Buffer of job task errors which are aggregated by error_code and message and flushed periodically.
+    Errors over max_errors are not saved but counted as overflow, and the final flush saves
+    the number of truncated errors as an error.
+    The flush interval is checked on add() and flush_if_due(), which the collector calls
+    after each batch, so errors are saved even if no more errors are added.
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[List[dict], int], None],
+        max_errors: int,
+        sample_size: int,
+        flush_interval: int,
+        saved_error_count: int = 0,
+    ):
+        self.flush_func = flush_func
+        self.max_errors = max_errors
+        self.sample_size = sample_size
+        self.flush_interval = flush_interval
+        self._error_count = saved_error_count
+        self._error_groups = {}
+        self._overflow_count = 0
+        self._truncated_count = 0
+        self._flushed_at = time.time()
+        self._lock = threading.Lock()
+
+    def add(self, error_code: str, message: str, additional: dict = None) -> None:
+        with self._lock:
+            if self._error_count < self.max_errors:
+                self._error_count += 1
+                self._add_error(error_code, message, additional)
+            else:
+                self._overflow_count += 1
+                self._truncated_count += 1
+
+        self.flush_if_due()
+
+    def flush_if_due(self) -> None:
+        with self._lock:
+            if time.time() - self._flushed_at < self.flush_interval:
+                return
+
+            errors, overflow_count = self._pop_errors()
+
+        if len(errors) > 0 or overflow_count > 0:
+            self.flush_func(errors, overflow_count)
+
+    def flush(self) -> None:
+        with self._lock:
+            errors, overflow_count = self._pop_errors()
+
+            if self._truncated_count > 0:
+                errors.append(self._make_truncated_error(self._truncated_count))
+                self._truncated_count = 0
+
+        if len(errors) > 0 or overflow_count > 0:
+            self.flush_func(errors, overflow_count)
+
+    def _add_error(self, error_code: str, message: str, additional: dict) -> None:
+        error_group = self._error_groups.get((error_code, message))
+
+        if error_group:
+            error_group["count"] += 1
+            if len(error_group["samples"]) < self.sample_size:
+                error_group["samples"].append(self._make_sample(message, additional))
+        else:
+            self._error_groups[(error_code, message)] = {
+                "error_code": error_code,
+                "message": message,
+                "additional": additional,
+                "count": 1,
+                "samples": [],
+            }
+
+    def _pop_errors(self) -> Tuple[List[dict], int]:
+        errors = [
+            self._make_error(error_group)
+            for error_group in self._error_groups.values()
+        ]
+        overflow_count = self._overflow_count
+
+        self._error_groups = {}
+        self._overflow_count = 0
+        self._flushed_at = time.time()
+
+        return errors, overflow_count
+
+    @staticmethod
+    def _make_error(error_group: dict) -> dict:
+        error_info = {
+            "error_code": error_group["error_code"],
+            "message": error_group["message"],
+        }
+        additional = error_group["additional"]
+
+        if error_group["count"] > 1:
+            additional = dict(additional or {})
+            additional["error_count"] = error_group["count"]
+            additional["samples"] = error_group["samples"]
+
+        if additional:
+            error_info["additional"] = additional
+
+        return error_info
+
+    @staticmethod
+    def _make_truncated_error(truncated_count: int) -> dict:
+        return {
+            "error_code": "ERROR_TRUNCATED",
+            "message": f"{truncated_count} more errors were truncated.",
+            "additional": {"truncated_count": truncated_count},
+        }
+
+    @staticmethod
+    def _make_sample(message: str, additional: dict = None) -> dict:
+        sample = {"message": message}
+
+        if additional:
+            sample["additional"] = additional
+
+        return sample
@@ -0,0 +1,72 @@
+import threading
+import time
+from typing import List, Union
+from spaceone.core import utils
+
+_IDENTITY_SNAPSHOTS = {}
+_LOCK = threading.Lock()
+
+
+class IdentitySnapshot(object):
+    """
+    Projects or service accounts of a domain indexed by the target keys of collector rule actions
+    e.g. index['tags.account_id']['123456789012'] = {'project_id': 'project-123', ...}
+    """
+
+    def __init__(self, results: List[dict], target_keys: List[str]):
+        self.target_keys = set(target_keys)
+        self.created_at = time.time()
+        self._index = {target_key: {} for target_key in self.target_keys}
+
+        for result in results:
+            for target_key in self.target_keys:
+                values = utils.get_dict_value(result, target_key)
+
+                if not isinstance(values, list):
+                    values = [values]
+
+                for value in values:
+                    if value is not None and _is_hashable(value):
+                        # the first result is matched, same as identity list query
+                        self._index[target_key].setdefault(value, result)
+
+    def is_indexed(self, target_key: str) -> bool:
+        return target_key in self.target_keys
+
+    def is_expired(self, ttl: Union[int, float]) -> bool:
+        return time.time() - self.created_at > ttl
+
+    def find(self, target_key: str, target_value: any) -> Union[dict, None]:
+        if not _is_hashable(target_value):
+            return None
+
+        return self._index.get(target_key, {}).get(target_value)
+
+
+def get_identity_snapshot(
+    resource_type: str, domain_id: str, ttl: Union[int, float]
+) -> Union[IdentitySnapshot, None]:
+    """
+    get identity snapshot of the process
+    :param resource_type: 'project' | 'service_account'
+    :param domain_id: domain id
+    :param ttl: seconds until the snapshot expires
+    :return: identity snapshot, None if not loaded or expired
+    """
+    snapshot = _IDENTITY_SNAPSHOTS.get((domain_id, resource_type))
+
+    if snapshot and not snapshot.is_expired(ttl):
+        return snapshot
+
+    return None
+
+
+def set_identity_snapshot(
+    resource_type: str, domain_id: str, snapshot: IdentitySnapshot
+) -> None:
+    with _LOCK:
+        _IDENTITY_SNAPSHOTS[(domain_id, resource_type)] = snapshot
+
+
+def _is_hashable(value: any) -> bool:
+    return not isinstance(value, (list, dict))
@@ -0,0 +1,155 @@
+import threading
+from typing import Callable, Union
+from spaceone.inventory.lib.rule_matcher import find_data
+
+_MATCH_INDEXES = {}
+_LOCK = threading.Lock()
+
+
+class MatchIndex(object):
+    """
+    In-memory map of match rule values to cloud_service_id for a collecting scope.
+    This is used by collector to resolve match rules without querying the database.
+    e.g. index['reference.resource_id']['arn:aws:ec2:...'] = {'cloud-svc-abcde12345'}
+    """
+
+    def __init__(self, keys: list):
+        self.keys = list(keys)
+        self._index = {key: {} for key in self.keys}
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, cloud_service_id: str, resource: dict) -> None:
+        """
+        add or refresh the values of a cloud service
+        :param cloud_service_id: e.g. 'cloud-svc-abcde12345'
+        :param resource: cloud service data, only the index keys that have a value are changed
+        """
+        with self._lock:
+            self._add(cloud_service_id, resource)
+
+    def lookup(self, keys: tuple, values: tuple) -> Union[str, None]:
+        """
+        find a cloud service matched with all values of the rule keys
+        :param keys: e.g. ('reference.resource_id', 'provider')
+        :param values: e.g. ('arn:aws:ec2:...', 'aws')
+        :return: cloud_service_id if only one cloud service is matched, otherwise, None.
+        """
+        with self._lock:
+            return self._lookup(keys, values)
+
+    def _add(self, cloud_service_id: str, resource: dict) -> None:
+        values = self._values.setdefault(cloud_service_id, {})
+
+        for key in self.keys:
+            value = find_data(resource, key)
+            if value is None or not self._is_hashable(value):
+                continue
+
+            old_value = values.get(key)
+            if old_value == value:
+                continue
+
+            if old_value is not None:
+                self._discard(key, old_value, cloud_service_id)
+
+            values[key] = value
+            self._index[key].setdefault(value, set()).add(cloud_service_id)
+
+    def _lookup(self, keys: tuple, values: tuple) -> Union[str, None]:
+        if not keys or not all(key in self._index for key in keys):
+            return None
+
+        id_sets = []
+        for key, value in zip(keys, values):
+            if not self._is_hashable(value):
+                return None
+
+            cloud_service_ids = self._index[key].get(value)
+            if not cloud_service_ids:
+                return None
+
+            id_sets.append(cloud_service_ids)
+
+        # intersect from the most selective key (e.g. reference.resource_id)
+        id_sets.sort(key=len)
+        candidates = set(id_sets[0])
+
+        for cloud_service_ids in id_sets[1:]:
+            candidates &= cloud_service_ids
+
+            if len(candidates) == 0:
+                return None
+
+        if len(candidates) == 1:
+            return next(iter(candidates))
+
+        return None
+
+    def _discard(self, key: str, value: any, cloud_service_id: str) -> None:
+        cloud_service_ids = self._index[key].get(value)
+        if cloud_service_ids:
+            cloud_service_ids.discard(cloud_service_id)
+            if len(cloud_service_ids) == 0:
+                del self._index[key][value]
+
+    @staticmethod
+    def _is_hashable(value: any) -> bool:
+        try:
+            hash(value)
+        except TypeError:
+            return False
+
+        return True
+
+
+def acquire_match_index(
+    job_task_id: str, load_func: Callable[[], Union[MatchIndex, None]]
+) -> Union[MatchIndex, None]:
+    """
+    get the match index of a job task, which is shared by its sub tasks in the process
+    :param job_task_id: job task id
+    :param load_func: function to load the match index, only called by the first sub task
+    :return: match index, None if it is not loaded
+    """
+    with _LOCK:
+        match_index_info = _MATCH_INDEXES.get(job_task_id)
+        is_loader = match_index_info is None
+
+        if is_loader:
+            match_index_info = {
+                "match_index": None,
+                "ref_count": 0,
+                "loaded": threading.Event(),
+            }
+            _MATCH_INDEXES[job_task_id] = match_index_info
+
+        match_index_info["ref_count"] += 1
+
+    if is_loader:
+        try:
+            match_index_info["match_index"] = load_func()
+        finally:
+            match_index_info["loaded"].set()
+    else:
+        match_index_info["loaded"].wait()
+
+    return match_index_info["match_index"]
+
+
+def release_match_index(job_task_id: str) -> None:
+    """
+    release the match index of a job task, it is removed when no sub task uses it
+    :param job_task_id: job task id
+    """
+    with _LOCK:
+        match_index_info = _MATCH_INDEXES.get(job_task_id)
+
+        if match_index_info:
+            match_index_info["ref_count"] -= 1
+
+            if match_index_info["ref_count"] <= 0:
+                del _MATCH_INDEXES[job_task_id]
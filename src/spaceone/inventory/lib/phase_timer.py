@@ -0,0 +1,69 @@
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Iterator
+from spaceone.core.transaction import Transaction
+
+
+class PhaseTimer(object):
+    """
+    Cumulative wall time and call count per phase of a job task.
+    The timer is shared by all threads of a job task through the transaction meta.
+    """
+
+    def __init__(self):
+        self._timings = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, phase: str):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start_time)
+
+    def measure_iterator(self, phase: str, iterator: Iterator) -> Iterator:
+        iterator = iter(iterator)
+
+        try:
+            while True:
+                start_time = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self.add(phase, time.perf_counter() - start_time, count=0)
+                    return
+
+                self.add(phase, time.perf_counter() - start_time)
+                yield item
+        finally:
+            # propagate close() of this generator to the measured iterator
+            if close := getattr(iterator, "close", None):
+                close()
+
+    def add(self, phase: str, elapsed_time: float, count: int = 1) -> None:
+        with self._lock:
+            timing = self._timings.setdefault(phase, {"time": 0.0, "count": 0})
+            timing["time"] += elapsed_time
+            timing["count"] += count
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                phase: {"time": round(timing["time"], 3), "count": timing["count"]}
+                for phase, timing in self._timings.items()
+            }
+
+
+def measure_phase(transaction: Transaction, phase: str):
+    """
+    measure a phase with the timer of the transaction
+    :param transaction: current transaction
+    :param phase: e.g. 'match', 'write'
+    :return: context manager, nothing is measured if the transaction has no 'phase_timer' meta
+    """
+    if phase_timer := transaction.get_meta("phase_timer"):
+        return phase_timer.measure(phase)
+
+    return nullcontext()
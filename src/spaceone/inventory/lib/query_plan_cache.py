@@ -0,0 +1,65 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Union
+from spaceone.core import utils
+
+_QUERY_PLANS = OrderedDict()
+_LOCK = threading.Lock()
+
+
+class QueryPlan(object):
+    """
+    Query rewritten for the cloud service model
+    e.g. hashed tag keys, project groups expanded to projects and the default state filter
+    """
+
+    def __init__(self, query: dict, ttl: Union[int, float]):
+        self.query = query
+        self.expired_at = time.time() + ttl
+
+    def is_expired(self) -> bool:
+        return time.time() > self.expired_at
+
+
+def make_query_plan_key(
+    query_type: str, query: dict, domain_id: str
+) -> Union[str, None]:
+    """
+    make key of the query plan from the normalized query
+    :param query_type: 'list' | 'analyze' | 'stat'
+    :param query: query before rewriting
+    :param domain_id: domain id
+    :return: hash of the query, None if the query is not serializable
+    """
+    try:
+        return utils.dict_to_hash(
+            {"query_type": query_type, "query": query, "domain_id": domain_id}
+        )
+    except Exception:
+        return None
+
+
+def get_query_plan(plan_key: str) -> Union[dict, None]:
+    query_plan = _QUERY_PLANS.get(plan_key)
+
+    if query_plan is None or query_plan.is_expired():
+        return None
+
+    # the model may change the query, so the cached query is not shared
+    return copy.deepcopy(query_plan.query)
+
+
+def set_query_plan(
+    plan_key: str, query: dict, ttl: Union[int, float], max_size: int
+) -> None:
+    query_plan = QueryPlan(copy.deepcopy(query), ttl)
+
+    with _LOCK:
+        _QUERY_PLANS.pop(plan_key, None)
+        _QUERY_PLANS[plan_key] = query_plan
+
+        # the oldest plans are evicted first
+        while len(_QUERY_PLANS) > max_size:
+            _QUERY_PLANS.popitem(last=False)
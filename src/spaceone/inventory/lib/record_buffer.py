@@ -0,0 +1,38 @@
+import threading
+from typing import Callable, List
+
+
+class RecordBuffer(object):
+    """
+    Buffer of change history records which are flushed in a batch.
+    This is used by collector to insert records of a job task with bulk writes.
+    """
+
+    def __init__(self, flush_func: Callable[[List[dict]], None], batch_size: int):
+        self.flush_func = flush_func
+        self.batch_size = max(batch_size, 1)
+        self._records = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add(self, record_data: dict) -> None:
+        with self._lock:
+            self._records.append(record_data)
+
+            if len(self._records) < self.batch_size:
+                return
+
+            records = self._records
+            self._records = []
+
+        self.flush_func(records)
+
+    def flush(self) -> None:
+        with self._lock:
+            records = self._records
+            self._records = []
+
+        if len(records) > 0:
+            self.flush_func(records)
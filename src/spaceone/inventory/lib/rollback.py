@@ -0,0 +1,94 @@
+import threading
+import time
+from typing import Callable
+from spaceone.core.transaction import Transaction
+
+
+class RollbackStats(object):
+    """
+    Number of rollbacks registered or skipped and data snapshots taken for rollbacks.
+    This is kept in the transaction meta of a job task, so the numbers are measured
+    inside the task, not from the state of the process.
+    """
+
+    def __init__(self):
+        self._registered_count = 0
+        self._skipped_count = 0
+        self._snapshot_count = 0
+        self._snapshot_time = 0.0
+        self._lock = threading.Lock()
+
+    def add_rollback(self, is_registered: bool) -> None:
+        with self._lock:
+            if is_registered:
+                self._registered_count += 1
+            else:
+                self._skipped_count += 1
+
+    def add_snapshot(self, elapsed_time: float) -> None:
+        with self._lock:
+            self._snapshot_count += 1
+            self._snapshot_time += elapsed_time
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "registered": self._registered_count,
+                "skipped": self._skipped_count,
+                "snapshot": {
+                    "time": round(self._snapshot_time, 3),
+                    "count": self._snapshot_count,
+                },
+            }
+
+
+def is_rollback_enabled(transaction: Transaction) -> bool:
+    """
+    check whether the writes of the transaction register rollbacks
+    collector disables rollbacks because collecting is idempotent on re-run.
+    :param transaction: current transaction
+    :return: False if 'disable_rollback' is set in the transaction meta
+    """
+    return transaction.get_meta("disable_rollback") != "true"
+
+
+def add_rollback(
+    transaction: Transaction, func: Callable, *args, snapshot_vo=None
+) -> None:
+    """
+    register a rollback of a write, it is counted as skipped if rollbacks are disabled
+    :param transaction: current transaction
+    :param func: rollback function
+    :param args: arguments of the rollback function
+    :param snapshot_vo: vo whose data before the write is passed as the last argument
+    :return: None
+    """
+    rollback_stats: RollbackStats = transaction.get_meta("rollback_stats")
+    is_enabled = is_rollback_enabled(transaction)
+
+    if rollback_stats:
+        rollback_stats.add_rollback(is_enabled)
+
+    if not is_enabled:
+        return
+
+    if snapshot_vo is not None:
+        args = args + (take_snapshot(transaction, snapshot_vo),)
+
+    transaction.add_rollback(func, *args)
+
+
+def take_snapshot(transaction: Transaction, vo) -> dict:
+    """
+    take the data of a vo to revert it by a rollback
+    :param transaction: current transaction
+    :param vo: model object
+    :return: data of the vo
+    """
+    if rollback_stats := transaction.get_meta("rollback_stats"):
+        start_time = time.perf_counter()
+        data = vo.to_dict()
+        rollback_stats.add_snapshot(time.perf_counter() - start_time)
+        return data
+
+    return vo.to_dict()
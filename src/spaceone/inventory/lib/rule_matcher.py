@@ -49,3 +49,54 @@ def make_query(
     return {
         "filter": _filter,
     }
+
+
+def make_match_key(rule_keys: list, resource: dict) -> tuple:
+    """
+    make the key of a resource for a match rule order
+    :param rule_keys: e.g. ['reference.resource_id', 'provider']
+    :param resource: resource data from plugin
+    :return: (keys, values) of the rule keys that have a value, the same keys used by make_query
+        e.g. (('reference.resource_id', 'provider'), ('arn:aws:ec2:...', 'aws'))
+    """
+    keys = []
+    values = []
+
+    for rule in rule_keys:
+        value = find_data(resource, rule)
+        if value:
+            keys.append(rule)
+            values.append(value)
+
+    return tuple(keys), tuple(values)
+
+
+def make_batch_query(
+    keys: tuple, values_list: list, domain_id: str, workspace_id: str
+) -> dict:
+    _filter = [
+        {"k": "domain_id", "v": domain_id, "o": "eq"},
+        {"k": "workspace_id", "v": workspace_id, "o": "eq"},
+    ]
+
+    for index, key in enumerate(keys):
+        _filter.append(
+            {"k": key, "v": list({values[index] for values in values_list}), "o": "in"}
+        )
+
+    return {
+        "filter": _filter,
+    }
+
+
+def is_matched(resource: dict, keys: tuple, values: tuple) -> bool:
+    for key, value in zip(keys, values):
+        resource_value = find_data(resource, key)
+
+        if isinstance(resource_value, list):
+            if value not in resource_value:
+                return False
+        elif resource_value != value:
+            return False
+
+    return True
@@ -5,6 +5,7 @@ from spaceone.core.manager import BaseManager
 from spaceone.core import utils
 from spaceone.inventory.model.cloud_service_model import CloudService
 from spaceone.inventory.manager.record_manager import RecordManager
+from spaceone.inventory.lib.record_buffer import RecordBuffer
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,9 +26,10 @@ MAX_KEY_DEPTH = 3
 
 
 class ChangeHistoryManager(BaseManager):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, record_buffer: RecordBuffer = None, **kwargs):
         super().__init__(*args, **kwargs)
         self.record_mgr: RecordManager = self.locator.get_manager("RecordManager")
+        self.record_buffer = record_buffer
         self.merged_data = {}
         self.is_changed = False
         self.collector_id = self.transaction.get_meta("collector_id")
@@ -97,7 +99,10 @@ class ChangeHistoryManager(BaseManager):
             else:
                 params["user_id"] = self.user_id
 
-            self.record_mgr.create_record(params)
+            if self.record_buffer is not None:
+                self.record_buffer.add(params)
+            else:
+                self.record_mgr.create_record(params)
 
     def _make_diff(self, new_data: dict, old_data: dict, exclude_keys: list) -> list:
         diff = []
@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple
+from typing import List, Tuple
 from datetime import datetime, timedelta
 
 from spaceone.core import config
@@ -18,18 +18,29 @@ class CleanupManager(BaseManager):
     def update_disconnected_and_deleted_count(
         self, collector_id: str, secret_id: str, job_task_id: str, domain_id: str
     ) -> dict:
+        """Sweep collection states of cloud services not collected by the job task
+        - States collected by the job task are marked with its job_task_id.
+        - Unseen states are read by the delete policy, their disconnected_count is
+          increased in chunks and cloud services that reach the delete policy are
+          deleted in chunks.
+        """
         state_mgr: CollectionStateManager = self.locator.get_manager(
             CollectionStateManager
         )
-        disconnected_count = self._increment_disconnected_count_by_collector(
+
+        disconnected_ids, deleted_ids = self._get_disconnected_cloud_service_ids(
             state_mgr, collector_id, secret_id, job_task_id, domain_id
         )
-        deleted_count = self._delete_resources_by_collector(
-            state_mgr, collector_id, domain_id
+
+        state_mgr.increase_disconnected_count(
+            collector_id, secret_id, disconnected_ids + deleted_ids, domain_id
         )
 
+        deleted_count = self._delete_resources_by_collector(deleted_ids, domain_id)
+        disconnected_count = len(disconnected_ids) + len(deleted_ids) - deleted_count
+
         return {
-            "disconnected_count": disconnected_count - deleted_count,
+            "disconnected_count": disconnected_count,
             "deleted_count": deleted_count,
         }
 
@@ -65,24 +76,9 @@ class CleanupManager(BaseManager):
             return 0
 
     def _delete_resources_by_collector(
-        self, state_mgr: CollectionStateManager, collector_id: str, domain_id: str
+        self, cloud_service_ids: List[str], domain_id: str
     ) -> int:
-        disconnected_count = config.get_global(
-            "DEFAULT_DISCONNECTED_STATE_DELETE_POLICY", 3
-        )
-
-        query = {
-            "filter": [
-                {"k": "collector_id", "v": collector_id, "o": "eq"},
-                {"k": "disconnected_count", "v": disconnected_count, "o": "gte"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-            ],
-            "only": ["cloud_service_id"],
-        }
-
-        state_vos, total_count = state_mgr.list_collection_states(query)
-
-        cloud_service_ids = [state_vo.cloud_service_id for state_vo in state_vos]
+        chunk_size = config.get_global("COLLECTION_STATE_CHUNK_SIZE", 1000)
         total_deleted_count = 0
 
         if len(cloud_service_ids) > 0:
@@ -90,19 +86,15 @@ class CleanupManager(BaseManager):
                 CloudServiceManager
             )
 
-            query = {
-                "filter": [
-                    {"k": "cloud_service_id", "v": cloud_service_ids, "o": "in"},
-                    {"k": "domain_id", "v": domain_id, "o": "eq"},
-                ]
-            }
-
             try:
-                deleted_count = cloud_svc_mgr.delete_resources(query)
+                for index in range(0, len(cloud_service_ids), chunk_size):
+                    total_deleted_count += cloud_svc_mgr.delete_cloud_services_by_ids(
+                        cloud_service_ids[index : index + chunk_size], domain_id
+                    )
+
                 _LOGGER.debug(
-                    f"[_delete_resources_by_collector] delete cloud service {deleted_count} in {domain_id}"
+                    f"[_delete_resources_by_collector] delete cloud service {total_deleted_count} in {domain_id}"
                 )
-                total_deleted_count = deleted_count
             except Exception as e:
                 _LOGGER.error(
                     f"[_delete_resources_by_collector] delete cloud service error: {e}",
@@ -112,26 +104,38 @@ class CleanupManager(BaseManager):
         return total_deleted_count
 
     @staticmethod
-    def _increment_disconnected_count_by_collector(
+    def _get_disconnected_cloud_service_ids(
         state_mgr: CollectionStateManager,
         collector_id: str,
         secret_id: str,
         job_task_id: str,
         domain_id: str,
-    ):
+    ) -> Tuple[List[str], List[str]]:
+        """
+        unseen states are split by the delete policy in the queries, not in python
+        :return: (ids to be disconnected, ids to be deleted by the delete policy)
+        """
+        delete_policy = config.get_global("DEFAULT_DISCONNECTED_STATE_DELETE_POLICY", 3)
+        batch_size = config.get_global("COLLECTION_STATE_CHUNK_SIZE", 1000)
         updated_at = datetime.utcnow() - timedelta(hours=1)
 
-        query = {
-            "filter": [
-                {"k": "collector_id", "v": collector_id, "o": "eq"},
-                {"k": "secret_id", "v": secret_id, "o": "eq"},
-                {"k": "job_task_id", "v": job_task_id, "o": "not"},
-                {"k": "domain_id", "v": domain_id, "o": "eq"},
-                {"k": "updated_at", "v": updated_at, "o": "lt"},
-            ]
-        }
+        state_vos = state_mgr.filter_collection_states(
+            collector_id=collector_id,
+            secret_id=secret_id,
+            job_task_id__ne=job_task_id,
+            updated_at__lt=updated_at,
+            domain_id=domain_id,
+        )
 
-        state_vos, total_count = state_mgr.list_collection_states(query)
-        state_vos.increment("disconnected_count")
+        disconnected_ids = list(
+            state_vos.filter(disconnected_count__lt=delete_policy - 1)
+            .scalar("cloud_service_id")
+            .batch_size(batch_size)
+        )
+        deleted_ids = list(
+            state_vos.filter(disconnected_count__gte=delete_policy - 1)
+            .scalar("cloud_service_id")
+            .batch_size(batch_size)
+        )
 
-        return total_count
+        return disconnected_ids, deleted_ids
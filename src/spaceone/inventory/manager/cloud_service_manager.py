@@ -2,14 +2,30 @@ import logging
 import copy
 import math
 import pytz
-from typing import Tuple, List
+from typing import Tuple, List, Union
 from datetime import datetime
+from bson import ObjectId
+from mongoengine.queryset import transform
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
-from spaceone.core import utils
+from spaceone.core import utils, config
 from spaceone.inventory.model.cloud_service_model import CloudService
 from spaceone.inventory.lib.resource_manager import ResourceManager
+from spaceone.inventory.lib.rollback import (
+    add_rollback,
+    is_rollback_enabled,
+    take_snapshot,
+)
+from spaceone.inventory.lib import rule_matcher
+from spaceone.inventory.lib.match_index import MatchIndex
+from spaceone.inventory.lib.query_plan_cache import (
+    make_query_plan_key,
+    get_query_plan,
+    set_query_plan,
+)
 from spaceone.inventory.manager.collection_state_manager import CollectionStateManager
 from spaceone.inventory.manager.reference_manager import ReferenceManager
 from spaceone.inventory.manager.identity_manager import IdentityManager
@@ -58,7 +74,8 @@ class CloudServiceManager(BaseManager, ResourceManager):
             vo.terminate()
 
         cloud_svc_vo: CloudService = self.cloud_svc_model.create(params)
-        self.transaction.add_rollback(_rollback, cloud_svc_vo)
+
+        add_rollback(self.transaction, _rollback, cloud_svc_vo)
 
         return cloud_svc_vo
 
@@ -69,11 +86,147 @@ class CloudServiceManager(BaseManager, ResourceManager):
             _LOGGER.info(f'[ROLLBACK] Revert Data : {old_data.get("cloud_service_id")}')
             cloud_svc_vo.update(old_data)
 
-        self.transaction.add_rollback(_rollback, cloud_svc_vo.to_dict())
+        add_rollback(self.transaction, _rollback, snapshot_vo=cloud_svc_vo)
+
         cloud_svc_vo: CloudService = cloud_svc_vo.update(params)
 
         return cloud_svc_vo
 
+    def create_cloud_services(
+        self, params_list: List[dict]
+    ) -> List[Union[CloudService, Exception]]:
+        """Create cloud services with a single bulk write
+        Args:
+            params_list (list): list of create params
+
+        Returns:
+            results (list): created cloud_service_vo or exception for each params
+        """
+
+        def _rollback(vo: CloudService):
+            _LOGGER.info(
+                f"[ROLLBACK] Delete Cloud Service : {vo.provider} ({vo.cloud_service_type})"
+            )
+            vo.terminate()
+
+        results = [None] * len(params_list)
+        operations = []
+        operation_indexes = []
+
+        for index, params in enumerate(params_list):
+            try:
+                cloud_svc_vo = self._make_cloud_service_vo(params)
+                cloud_svc_vo.validate()
+                cloud_svc_vo.pk = ObjectId()
+                operations.append(InsertOne(cloud_svc_vo.to_mongo()))
+                operation_indexes.append(index)
+                results[index] = cloud_svc_vo
+            except Exception as e:
+                results[index] = ERROR_DB_QUERY(reason=e)
+
+        failed_indexes = self._bulk_write(operations, operation_indexes, results)
+
+        for index in operation_indexes:
+            if index not in failed_indexes:
+                add_rollback(self.transaction, _rollback, results[index])
+
+        return results
+
+    def update_cloud_services_by_vos(
+        self, params_and_vos: List[Tuple[dict, CloudService]]
+    ) -> List[Union[CloudService, Exception]]:
+        """Update cloud services with a single bulk write
+        Args:
+            params_and_vos (list): list of (update params, cloud_service_vo)
+
+        Returns:
+            results (list): cloud_service_vo or exception for each update
+        """
+
+        def _rollback(vo: CloudService, old_data: dict):
+            _LOGGER.info(f'[ROLLBACK] Revert Data : {old_data.get("cloud_service_id")}')
+            vo.update(old_data)
+
+        results = [None] * len(params_and_vos)
+        operations = []
+        operation_indexes = []
+
+        old_data_list = [None] * len(params_and_vos)
+        rollback_enabled = is_rollback_enabled(self.transaction)
+
+        for index, (params, cloud_svc_vo) in enumerate(params_and_vos):
+            try:
+                update_data = self._make_update_data(params)
+                operations.append(
+                    UpdateOne(
+                        {"_id": cloud_svc_vo.pk, "state": {"$ne": "DELETED"}},
+                        transform.update(self.cloud_svc_model, **update_data),
+                    )
+                )
+                operation_indexes.append(index)
+                results[index] = cloud_svc_vo
+
+                if rollback_enabled:
+                    old_data_list[index] = take_snapshot(self.transaction, cloud_svc_vo)
+            except Exception as e:
+                results[index] = ERROR_DB_QUERY(reason=e)
+
+        failed_indexes = self._bulk_write(operations, operation_indexes, results)
+        self._reload_updated_cloud_services(operation_indexes, failed_indexes, results)
+
+        for index in operation_indexes:
+            if not isinstance(results[index], Exception):
+                add_rollback(
+                    self.transaction, _rollback, results[index], old_data_list[index]
+                )
+
+        return results
+
+    def _reload_updated_cloud_services(
+        self, operation_indexes: list, failed_indexes: set, results: list
+    ) -> None:
+        """Replace the cloud services of the update results with the updated documents
+        Cloud services deleted before the update are not matched by the bulk write,
+        so they are returned as ERROR_RESOURCE_ALREADY_DELETED.
+        """
+
+        updated_indexes = [
+            index for index in operation_indexes if index not in failed_indexes
+        ]
+
+        if len(updated_indexes) == 0:
+            return
+
+        cloud_svc_vos = self.cloud_svc_model.objects(
+            pk__in=[results[index].pk for index in updated_indexes],
+            state__ne="DELETED",
+        )
+        cloud_svc_vo_map = {vo.pk: vo for vo in cloud_svc_vos}
+
+        for index in updated_indexes:
+            old_cloud_svc_vo = results[index]
+
+            if cloud_svc_vo := cloud_svc_vo_map.get(old_cloud_svc_vo.pk):
+                results[index] = cloud_svc_vo
+            else:
+                results[index] = ERROR_RESOURCE_ALREADY_DELETED(
+                    resource_type="CloudService",
+                    resource_id=old_cloud_svc_vo.cloud_service_id,
+                )
+
+    def touch_cloud_services(
+        self, cloud_service_ids: List[str], domain_id: str, workspace_id: str
+    ) -> None:
+        now = datetime.utcnow()
+        cloud_svc_vos = self.filter_cloud_services(
+            cloud_service_id=cloud_service_ids,
+            domain_id=domain_id,
+            workspace_id=workspace_id,
+        )
+        cloud_svc_vos.update(
+            {"updated_at": now, "collection_info__last_collected_at": now}
+        )
+
     @staticmethod
     def delete_cloud_service_by_vo(cloud_svc_vo: CloudService) -> None:
         cloud_svc_vo.delete()
@@ -86,6 +239,18 @@ class CloudServiceManager(BaseManager, ResourceManager):
         )
         cloud_svc_vo.terminate()
 
+    def terminate_cloud_services_by_ids(
+        self, cloud_service_ids: List[str], domain_id: str
+    ) -> int:
+        result = self.cloud_svc_model._get_collection().delete_many(
+            {
+                "cloud_service_id": {"$in": cloud_service_ids},
+                "domain_id": domain_id,
+                "state": "DELETED",
+            }
+        )
+        return result.deleted_count
+
     def get_cloud_service(
         self,
         cloud_service_id: str,
@@ -115,13 +280,7 @@ class CloudServiceManager(BaseManager, ResourceManager):
         reference_filter: dict = None,
     ) -> Tuple[QuerySet, int]:
         if change_filter:
-            query = self._change_filter_tags(query)
-            query = self._change_only_tags(query)
-            query = self._change_sort_tags(query)
-            query = self._change_filter_project_group_id(query, domain_id)
-
-            # Append Query for DELETED filter (Temporary Logic)
-            query = self._append_state_query(query)
+            query = self._get_query_plan("list", query, domain_id)
 
         return self.cloud_svc_model.query(
             **query, target=target, reference_filter=reference_filter
@@ -135,11 +294,7 @@ class CloudServiceManager(BaseManager, ResourceManager):
         reference_filter: dict = None,
     ):
         if change_filter:
-            query = self._change_filter_tags(query)
-            query = self._change_filter_project_group_id(query, domain_id)
-
-            # Append Query for DELETED filter (Temporary Logic)
-            query = self._append_state_query(query)
+            query = self._get_query_plan("analyze", query, domain_id)
 
         return self.cloud_svc_model.analyze(**query, reference_filter=reference_filter)
 
@@ -151,12 +306,7 @@ class CloudServiceManager(BaseManager, ResourceManager):
         reference_filter: dict = None,
     ):
         if change_filter:
-            query = self._change_filter_tags(query)
-            query = self._change_distinct_tags(query)
-            query = self._change_filter_project_group_id(query, domain_id)
-
-            # Append Query for DELETED filter (Temporary Logic)
-            query = self._append_state_query(query)
+            query = self._get_query_plan("stat", query, domain_id)
 
         return self.cloud_svc_model.stat(**query, reference_filter=reference_filter)
 
@@ -394,6 +544,71 @@ class CloudServiceManager(BaseManager, ResourceManager):
 
         return resources, total_count
 
+    def find_resources_in_batch(
+        self, keys: tuple, values_list: list, domain_id: str, workspace_id: str
+    ) -> dict:
+        """Find cloud services matched with the values of match rule keys in a single query
+        Args:
+            keys (tuple): match rule keys (e.g. ('reference.resource_id', 'provider'))
+            values_list (list): list of values of the match rule keys
+
+        Returns:
+            matched_resources (dict): {values: [{'cloud_service_id': 'str'}, ...]}
+        """
+
+        query = rule_matcher.make_batch_query(keys, values_list, domain_id, workspace_id)
+        query["only"] = ["cloud_service_id"] + list(keys)
+        query["filter"].append({"k": "state", "v": "DELETED", "o": "not"})
+
+        cloud_svc_vos, total_count = self.list_cloud_services(
+            query, target="SECONDARY_PREFERRED"
+        )
+
+        matched_resources = {values: [] for values in values_list}
+        for cloud_svc_vo in cloud_svc_vos:
+            cloud_svc_data = cloud_svc_vo.to_dict()
+            for values in matched_resources.keys():
+                if rule_matcher.is_matched(cloud_svc_data, keys, values):
+                    matched_resources[values].append(
+                        {"cloud_service_id": cloud_svc_vo.cloud_service_id}
+                    )
+
+        return matched_resources
+
+    def get_match_index(
+        self, keys: list, domain_id: str, workspace_id: str, limit: int = None
+    ) -> Union[MatchIndex, None]:
+        """Load match rule values of the cloud services in a workspace
+        All cloud services of the workspace are loaded, the same scope as match queries,
+        so that duplicates made by other collectors are ambiguous in the index too.
+
+        Args:
+            keys (list): match rule keys to index (e.g. ['reference.resource_id', 'name'])
+            limit (int): maximum number of cloud services to load
+
+        Returns:
+            match_index (MatchIndex): None if the number of cloud services exceeds the limit
+        """
+
+        cloud_svc_vos = self.filter_cloud_services(
+            domain_id=domain_id, workspace_id=workspace_id, state__ne="DELETED"
+        )
+
+        if limit and cloud_svc_vos.count() > limit:
+            _LOGGER.debug(
+                f"[get_match_index] skip match index: too many cloud services "
+                f"(workspace_id = {workspace_id})"
+            )
+            return None
+
+        match_index = MatchIndex(keys)
+        only = ["cloud_service_id"] + [key.replace(".", "__") for key in keys]
+
+        for cloud_svc_data in cloud_svc_vos.only(*only).as_pymongo():
+            match_index.add(cloud_svc_data["cloud_service_id"], cloud_svc_data)
+
+        return match_index
+
     def delete_resources(self, query: dict) -> int:
         query["only"] = self.resource_keys
         query["filter"].append({"k": "state", "v": "DELETED", "o": "not"})
@@ -413,6 +628,124 @@ class CloudServiceManager(BaseManager, ResourceManager):
 
         return total_count
 
+    def delete_cloud_services_by_ids(
+        self, cloud_service_ids: List[str], domain_id: str
+    ) -> int:
+        result = self.cloud_svc_model._get_collection().update_many(
+            {
+                "cloud_service_id": {"$in": cloud_service_ids},
+                "domain_id": domain_id,
+                "state": {"$ne": "DELETED"},
+            },
+            {"$set": {"state": "DELETED", "deleted_at": datetime.utcnow()}},
+        )
+
+        state_mgr: CollectionStateManager = self.locator.get_manager(
+            "CollectionStateManager"
+        )
+        state_mgr.delete_collection_state_by_cloud_service_ids(cloud_service_ids)
+
+        return result.modified_count
+
+    def _make_cloud_service_vo(self, params: dict) -> CloudService:
+        create_data = {}
+
+        for name, field in self.cloud_svc_model._fields.items():
+            if name in params:
+                create_data[name] = params[name]
+            else:
+                if generate_id := getattr(field, "generate_id", None):
+                    create_data[name] = utils.generate_id(generate_id)
+
+                if getattr(field, "auto_now", False) or getattr(
+                    field, "auto_now_add", False
+                ):
+                    create_data[name] = datetime.utcnow()
+
+        for key, value in create_data.items():
+            create_data[key] = self.cloud_svc_model._trim_value(value)
+
+        return self.cloud_svc_model(**create_data)
+
+    def _make_update_data(self, params: dict) -> dict:
+        updatable_fields = self.cloud_svc_model._meta.get("updatable_fields", [])
+
+        update_data = {
+            key: self.cloud_svc_model._trim_value(value)
+            for key, value in params.items()
+            if key in updatable_fields
+        }
+        update_data["updated_at"] = datetime.utcnow()
+
+        return update_data
+
+    def _bulk_write(self, operations: list, operation_indexes: list, results: list):
+        failed_indexes = set()
+
+        if len(operations) == 0:
+            return failed_indexes
+
+        try:
+            self.cloud_svc_model._get_collection().bulk_write(operations, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                index = operation_indexes[write_error["index"]]
+                results[index] = ERROR_DB_QUERY(reason=write_error.get("errmsg"))
+                failed_indexes.add(index)
+        except Exception as e:
+            for index in operation_indexes:
+                results[index] = ERROR_DB_QUERY(reason=e)
+                failed_indexes.add(index)
+
+        return failed_indexes
+
+    def _get_query_plan(self, query_type: str, query: dict, domain_id: str) -> dict:
+        ttl = config.get_global("QUERY_PLAN_CACHE_TTL", 300)
+        plan_key = None
+
+        if ttl > 0:
+            plan_key = make_query_plan_key(query_type, query, domain_id)
+
+        if plan_key:
+            plan_query = get_query_plan(plan_key)
+            if plan_query is not None:
+                return plan_query
+
+            if self._has_project_group_filter(query):
+                # projects of project groups can be changed at any time
+                ttl = min(ttl, config.get_global("QUERY_PLAN_PROJECT_GROUP_TTL", 30))
+
+        query = self._rewrite_query(query_type, query, domain_id)
+
+        if plan_key and ttl > 0:
+            max_size = config.get_global("QUERY_PLAN_CACHE_SIZE", 1000)
+            set_query_plan(plan_key, query, ttl, max_size)
+
+        return query
+
+    def _rewrite_query(self, query_type: str, query: dict, domain_id: str) -> dict:
+        query = self._change_filter_tags(query)
+
+        if query_type == "list":
+            query = self._change_only_tags(query)
+            query = self._change_sort_tags(query)
+        elif query_type == "stat":
+            query = self._change_distinct_tags(query)
+
+        query = self._change_filter_project_group_id(query, domain_id)
+
+        # Append Query for DELETED filter (Temporary Logic)
+        query = self._append_state_query(query)
+        return query
+
+    @staticmethod
+    def _has_project_group_filter(query: dict) -> bool:
+        for condition in query.get("filter", []):
+            if condition.get("k", condition.get("key")) == "project_group_id":
+                return True
+
+        return False
+
     @staticmethod
     def _append_state_query(query: dict) -> dict:
         state_default_filter = {"key": "state", "value": "ACTIVE", "operator": "eq"}
@@ -450,36 +783,26 @@ class CloudServiceManager(BaseManager, ResourceManager):
                         "IdentityManager"
                     )
 
-                project_groups_info = self.identity_mgr.list_project_groups(
-                    {
-                        "query": {
-                            "only": ["project_group_id"],
-                            "filter": [{"k": key, "v": value, "o": operator}],
-                        }
-                    },
-                    domain_id,
+                project_group_tree = self.identity_mgr.get_project_group_tree(
+                    domain_id
                 )
 
-                project_group_ids = [
-                    project_group_info["project_group_id"]
-                    for project_group_info in project_groups_info.get("results", [])
-                ]
-
-                project_ids = []
+                if operator == "eq" and isinstance(value, str):
+                    project_group_ids = [value]
+                elif operator == "in" and isinstance(value, list):
+                    project_group_ids = value
+                else:
+                    project_group_ids = self._list_project_group_ids(
+                        key, value, operator, domain_id
+                    )
 
+                project_ids = set()
                 for project_group_id in project_group_ids:
-                    projects_info = self.identity_mgr.get_projects_in_project_group(
-                        project_group_id
-                    )
-                    project_ids.extend(
-                        [
-                            project_info["project_id"]
-                            for project_info in projects_info.get("results", [])
-                        ]
-                    )
+                    project_ids.update(project_group_tree.get(project_group_id, []))
 
-                project_ids = list(set(project_ids))
-                change_filter.append({"k": "project_id", "v": project_ids, "o": "in"})
+                change_filter.append(
+                    {"k": "project_id", "v": list(project_ids), "o": "in"}
+                )
 
             else:
                 change_filter.append(condition)
@@ -487,6 +810,24 @@ class CloudServiceManager(BaseManager, ResourceManager):
         query["filter"] = change_filter
         return query
 
+    def _list_project_group_ids(
+        self, key: str, value: any, operator: str, domain_id: str
+    ) -> List[str]:
+        project_groups_info = self.identity_mgr.list_project_groups(
+            {
+                "query": {
+                    "only": ["project_group_id"],
+                    "filter": [{"k": key, "v": value, "o": operator}],
+                }
+            },
+            domain_id,
+        )
+
+        return [
+            project_group_info["project_group_id"]
+            for project_group_info in project_groups_info.get("results", [])
+        ]
+
     def _change_filter_tags(self, query: dict) -> dict:
         change_filter = []
 
@@ -7,6 +7,7 @@ from spaceone.core import utils
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.model.cloud_service_type_model import CloudServiceType
 from spaceone.inventory.lib.resource_manager import ResourceManager
+from spaceone.inventory.lib.rollback import add_rollback
 from spaceone.inventory.manager.cloud_service_query_set_manager import (
     CloudServiceQuerySetManager,
 )
@@ -36,7 +37,8 @@ class CloudServiceTypeManager(BaseManager, ResourceManager):
             vo.delete()
 
         cloud_svc_type_vo: CloudServiceType = self.cloud_svc_type_model.create(params)
-        self.transaction.add_rollback(_rollback, cloud_svc_type_vo)
+
+        add_rollback(self.transaction, _rollback, cloud_svc_type_vo)
 
         self._create_cloud_service_query_sets(
             params.get("metadata", {}), cloud_svc_type_vo
@@ -53,7 +55,7 @@ class CloudServiceTypeManager(BaseManager, ResourceManager):
             )
             cloud_svc_type_vo.update(old_data)
 
-        self.transaction.add_rollback(_rollback, cloud_svc_type_vo.to_dict())
+        add_rollback(self.transaction, _rollback, snapshot_vo=cloud_svc_type_vo)
 
         self._update_cloud_service_query_sets(
             params.get("metadata", {}), cloud_svc_type_vo
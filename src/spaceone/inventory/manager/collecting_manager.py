@@ -1,9 +1,20 @@
 import logging
-import time
-from typing import Generator
-from spaceone.core import utils
+import threading
+from queue import Full, Queue
+from typing import Generator, List, Tuple, Union
+from spaceone.core import config, utils
 from spaceone.core.manager import BaseManager
+from spaceone.core.transaction import create_transaction, delete_transaction
 from spaceone.inventory.lib.resource_manager import ResourceManager
+from spaceone.inventory.lib.concurrency import LeaseSemaphore, get_redis_connection
+from spaceone.inventory.lib.record_buffer import RecordBuffer
+from spaceone.inventory.lib.rollback import RollbackStats
+from spaceone.inventory.lib.phase_timer import PhaseTimer, measure_phase
+from spaceone.inventory.lib.match_index import (
+    MatchIndex,
+    acquire_match_index,
+    release_match_index,
+)
 from spaceone.inventory.manager.job_manager import JobManager
 from spaceone.inventory.manager.job_task_manager import JobTaskManager
 from spaceone.inventory.manager.collector_manager import CollectorManager
@@ -11,6 +22,8 @@ from spaceone.inventory.manager.plugin_manager import PluginManager
 from spaceone.inventory.manager.collector_plugin_manager import CollectorPluginManager
 from spaceone.inventory.manager.namespace_manager import NamespaceManager
 from spaceone.inventory.manager.metric_manager import MetricManager
+from spaceone.inventory.manager.collection_state_manager import CollectionStateManager
+from spaceone.inventory.manager.record_manager import RecordManager
 from spaceone.inventory.model.job_task_model import JobTask
 from spaceone.inventory.error import *
 from spaceone.inventory.lib import rule_matcher
@@ -18,6 +31,9 @@ from spaceone.inventory.conf.collector_conf import *
 
 _LOGGER = logging.getLogger(__name__)
 
+_END_OF_RESOURCES = object()
+_QUEUE_PUT_TIMEOUT = 1
+
 
 class CollectingManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -31,6 +47,10 @@ class CollectingManager(BaseManager):
 
         self.db_queue = DB_QUEUE_NAME
         self._service_and_manager_map = {}
+        self._collected_ids_map = {}
+        self._record_buffer_map = {}
+        self._match_index_map = {}
+        self._collected_ids_lock = threading.Lock()
 
     def collecting_resources(self, params: dict) -> bool:
         """Execute collecting task to get resources from plugin
@@ -53,20 +73,12 @@ class CollectingManager(BaseManager):
         token = params["token"]
         self.transaction.set_meta("token", token)
 
-        plugin_manager: PluginManager = self.locator.get_manager(PluginManager)
-        collector_plugin_mgr: CollectorPluginManager = self.locator.get_manager(
-            CollectorPluginManager
-        )
-
         job_id = params["job_id"]
         job_task_id = params["job_task_id"]
         collector_id = params["collector_id"]
         domain_id = params["domain_id"]
         task_options = params.get("task_options")
         is_sub_task = params.get("is_sub_task", False)
-        secret_info = params["secret_info"]
-        secret_data = params["secret_data"]
-        plugin_info = params["plugin_info"]
 
         if is_sub_task:
             _LOGGER.debug(
@@ -76,12 +88,46 @@ class CollectingManager(BaseManager):
         else:
             _LOGGER.debug(f"[collecting_resources] start job task: {job_task_id}")
 
-        if not self._check_concurrency(collector_id, job_id, domain_id):
-            time.sleep(60)
-            _LOGGER.debug(f"[collecting_resources] retry sub task: {job_task_id}")
-            self.job_task_mgr.push_job_task(params)
+        max_concurrency = self._get_max_concurrency(collector_id, domain_id)
+        semaphore = self._get_concurrency_semaphore(job_id, domain_id, max_concurrency)
+        lease_holder = f"{job_task_id}:{utils.random_string()}"
+
+        if semaphore:
+            is_acquired = semaphore.acquire(lease_holder)
+        else:
+            is_acquired = self._check_concurrency(
+                job_task_id, domain_id, max_concurrency
+            )
+
+        if not is_acquired:
+            retry_delay = config.get_global("COLLECTING_RETRY_DELAY", 60)
+            _LOGGER.debug(
+                f"[collecting_resources] delay sub task: {job_task_id} ({retry_delay}s)"
+            )
+            self.job_task_mgr.push_delayed_job_task(params, retry_delay)
             return True
 
+        try:
+            return self._collecting_resources(params)
+        finally:
+            if semaphore:
+                semaphore.release(lease_holder)
+                self._push_due_job_tasks()
+
+    def _collecting_resources(self, params: dict) -> bool:
+        plugin_manager: PluginManager = self.locator.get_manager(PluginManager)
+        collector_plugin_mgr: CollectorPluginManager = self.locator.get_manager(
+            CollectorPluginManager
+        )
+
+        job_id = params["job_id"]
+        job_task_id = params["job_task_id"]
+        domain_id = params["domain_id"]
+        task_options = params.get("task_options")
+        secret_info = params["secret_info"]
+        secret_data = params["secret_data"]
+        plugin_info = params["plugin_info"]
+
         job_task_vo = self.job_task_mgr.get(job_task_id, domain_id)
 
         # add workspace_id to params from secret_info
@@ -98,22 +144,31 @@ class CollectingManager(BaseManager):
 
         self.job_task_mgr.make_inprogress_by_vo(job_task_vo)
 
+        phase_timer = PhaseTimer()
+        rollback_stats = RollbackStats()
+        self.transaction.set_meta("phase_timer", phase_timer)
+        self.transaction.set_meta("rollback_stats", rollback_stats)
+
         try:
-            # get plugin endpoint from plugin manager
-            endpoint, updated_version = plugin_manager.get_endpoint(
-                plugin_info["plugin_id"],
-                domain_id,
-                plugin_info.get("upgrade_mode", "AUTO"),
-                plugin_info.get("version"),
-            )
+            with phase_timer.measure("plugin_wait"):
+                # get plugin endpoint from plugin manager
+                endpoint, updated_version = plugin_manager.get_endpoint(
+                    plugin_info["plugin_id"],
+                    domain_id,
+                    plugin_info.get("upgrade_mode", "AUTO"),
+                    plugin_info.get("version"),
+                    use_cache=True,
+                )
 
-            # collect data from plugin
-            resources = collector_plugin_mgr.collect(
-                endpoint,
-                plugin_info["options"],
-                secret_data.get("data", {}),
-                task_options,
-            )
+                # collect data from plugin
+                resources = collector_plugin_mgr.collect(
+                    endpoint,
+                    plugin_info["options"],
+                    secret_data.get("data", {}),
+                    task_options,
+                )
+
+            resources = phase_timer.measure_iterator("plugin_wait", resources)
 
             # delete secret_data in params for security
             del params["secret_data"]
@@ -130,11 +185,16 @@ class CollectingManager(BaseManager):
             self.job_task_mgr.add_error(
                 job_task_vo, "ERROR_COLLECTOR_PLUGIN", error_message
             )
+            plugin_manager.delete_endpoint_cache(plugin_info["plugin_id"], domain_id)
 
+            self.job_task_mgr.increase_phase_timings(
+                job_task_vo, phase_timer.to_dict()
+            )
             self.job_task_mgr.make_failure_by_vo(job_task_vo, {"failure_count": 1})
             raise ERROR_COLLECTOR_COLLECTING(plugin_info=plugin_info)
 
         job_task_status = "SUCCESS"
+        self.job_task_mgr.create_error_buffer(job_task_vo)
 
         try:
             collecting_count_info = self._upsert_collecting_resources(
@@ -157,12 +217,20 @@ class CollectingManager(BaseManager):
             self.job_task_mgr.add_error(
                 job_task_vo, "ERROR_COLLECTOR_PLUGIN", error_message
             )
+            plugin_manager.delete_endpoint_cache(plugin_info["plugin_id"], domain_id)
             job_task_status = "FAILURE"
             collecting_count_info = {"failure_count": 1}
 
+        finally:
+            self.job_task_mgr.flush_error_buffer(job_task_vo)
+            self.job_task_mgr.increase_phase_timings(
+                job_task_vo, phase_timer.to_dict()
+            )
+
         _LOGGER.debug(
             f"[collecting_resources] job task summary ({job_task_id}: {job_task_status}) "
-            f"=> {collecting_count_info}"
+            f"=> {collecting_count_info}, phase_timings: {phase_timer.to_dict()}, "
+            f"rollbacks: {rollback_stats.to_dict()}"
         )
 
         if job_task_status == "SUCCESS":
@@ -174,7 +242,9 @@ class CollectingManager(BaseManager):
 
         return True
 
-    def _check_concurrency(self, collector_id: str, job_id: str, domain_id: str):
+    def _get_max_concurrency(
+        self, collector_id: str, domain_id: str
+    ) -> Union[int, None]:
         collector_mgr: CollectorManager = self.locator.get_manager(CollectorManager)
         try:
             collector_vo = collector_mgr.get_collector(collector_id, domain_id)
@@ -182,20 +252,55 @@ class CollectingManager(BaseManager):
             metadata = plugin_info.get("metadata", {})
         except Exception as e:
             _LOGGER.warning(
-                f"[_check_concurrency] failed to get collector metadata: {e}"
+                f"[_get_max_concurrency] failed to get collector metadata: {e}"
             )
             metadata = {}
 
         max_concurrency = metadata.get("concurrency")
         if max_concurrency and isinstance(max_concurrency, int):
-            job_task_vos = self.job_task_mgr.filter_job_tasks(
-                job_id=job_id, domain_id=domain_id, status="IN_PROGRESS"
+            return max_concurrency
+
+        return None
+
+    @staticmethod
+    def _get_concurrency_semaphore(
+        job_id: str, domain_id: str, max_concurrency: Union[int, None]
+    ) -> Union[LeaseSemaphore, None]:
+        if max_concurrency is None:
+            return None
+
+        if conn := get_redis_connection():
+            return LeaseSemaphore(
+                conn,
+                f"inventory:collecting-lease:{domain_id}:{job_id}",
+                max_concurrency,
+                config.get_global("COLLECTING_LEASE_TIMEOUT", 300),
+            )
+
+        return None
+
+    def _push_due_job_tasks(self) -> None:
+        try:
+            # only the released slot can be admitted, the others are pushed by the scheduler
+            self.job_task_mgr.push_due_job_tasks(limit=1)
+        except Exception as e:
+            _LOGGER.error(
+                f"[_push_due_job_tasks] failed to push delayed job tasks: {e}",
+                exc_info=True,
             )
-            current_concurrency = job_task_vos.count()
-            if job_task_vos.count() >= max_concurrency:
+
+    def _check_concurrency(
+        self, job_task_id: str, domain_id: str, max_concurrency: Union[int, None]
+    ) -> bool:
+        """without redis, the concurrency is the number of job tasks in progress"""
+        if max_concurrency:
+            job_task_vo = self.job_task_mgr.get(job_task_id, domain_id)
+            if not self.job_task_mgr.make_inprogress_in_concurrency(
+                job_task_vo, max_concurrency
+            ):
                 _LOGGER.debug(
-                    f"[_check_concurrency] job task concurrency exceeded ({job_id}): "
-                    f"{current_concurrency}/{max_concurrency}"
+                    f"[_check_concurrency] job task concurrency exceeded "
+                    f"({job_task_vo.job_id}): {max_concurrency}"
                 )
                 return False
 
@@ -218,57 +323,336 @@ class CollectingManager(BaseManager):
             }
         """
 
-        created_count = 0
-        updated_count = 0
-        failure_count = 0
-        total_count = 0
+        batch_size = config.get_global("COLLECTING_BATCH_SIZE", 100)
+        writer_count = config.get_global("COLLECTING_WRITER_COUNT", 0)
 
         self._set_transaction_meta(params)
+        record_buffer = self._create_record_buffer(params["job_task_id"])
+        self._acquire_match_index(params)
+
+        try:
+            if batch_size > 1 and writer_count > 0:
+                collecting_count_info = self._upsert_collecting_resources_in_pipeline(
+                    resources, params, job_task_vo, batch_size, writer_count
+                )
+            else:
+                collecting_count_info = self._upsert_collecting_resources_in_sequence(
+                    resources, params, job_task_vo, batch_size
+                )
+        finally:
+            self._release_match_index(params["job_task_id"])
+
+            with measure_phase(self.transaction, "history"):
+                self._flush_record_buffer(params["job_task_id"], record_buffer)
+
+            # resources collected before an abort must not be cleaned up as disconnected
+            with measure_phase(self.transaction, "state"):
+                self._reconcile_collection_states(params)
+
+        return collecting_count_info
+
+    def _upsert_collecting_resources_in_sequence(
+        self,
+        resources: Generator[dict, None, None],
+        params: dict,
+        job_task_vo: JobTask,
+        batch_size: int,
+    ) -> dict:
+        collecting_count_info = self._make_collecting_count_info()
+        cloud_service_batch = []
 
         for resource_data in resources:
             resource_type = resource_data.get("resource_type")
-            total_count += 1
+            collecting_count_info["total_count"] += 1
 
-            try:
-                if resource_type in ["inventory.Namespace", "inventory.Metric"]:
-                    self._upsert_metric_and_namespace(resource_data, params)
-                    total_count -= 1
+            if resource_type == "inventory.CloudService" and batch_size > 1:
+                cloud_service_batch.append(resource_data)
+
+                if len(cloud_service_batch) >= batch_size:
+                    self._flush_cloud_service_batch(
+                        cloud_service_batch,
+                        params,
+                        job_task_vo,
+                        collecting_count_info,
+                    )
+                    cloud_service_batch = []
+            else:
+                self._upsert_collecting_resource(
+                    resource_data, params, job_task_vo, collecting_count_info
+                )
+
+        if len(cloud_service_batch) > 0:
+            self._flush_cloud_service_batch(
+                cloud_service_batch, params, job_task_vo, collecting_count_info
+            )
+
+        return collecting_count_info
+
+    def _upsert_collecting_resources_in_pipeline(
+        self,
+        resources: Generator[dict, None, None],
+        params: dict,
+        job_task_vo: JobTask,
+        batch_size: int,
+        writer_count: int,
+    ) -> dict:
+        """Upsert resources while the plugin stream is read by a reader thread
+        - The reader thread drains the plugin stream into a bounded queue.
+        - Cloud services are dispatched to writer threads by the values of their lowest
+          order match rule. Resources that are matched by another order of match rules
+          (e.g. a changed reference.resource_id) can be upserted by different writers
+          at the same time, so the pipeline is disabled by default (COLLECTING_WRITER_COUNT).
+        - Other resources (e.g. CloudServiceType and Region) are upserted in the dispatching thread
+          before any cloud service that comes after them is dispatched.
+        """
+
+        queue_size = config.get_global("COLLECTING_QUEUE_SIZE", 1000)
+        meta = self.transaction.meta
+
+        resource_queue = Queue(maxsize=queue_size)
+        reader_errors = []
+        stop_event = threading.Event()
+        reader = threading.Thread(
+            target=self._read_collecting_resources,
+            args=(resources, resource_queue, reader_errors, stop_event, meta),
+            daemon=True,
+        )
+        reader.start()
+
+        collecting_count_info = self._make_collecting_count_info()
+        writer_queues = []
+        writer_count_infos = []
+        writers = []
+
+        for _ in range(writer_count):
+            writer_queue = Queue(maxsize=queue_size)
+            writer_count_info = self._make_collecting_count_info()
+            writer = threading.Thread(
+                target=self._write_cloud_services,
+                args=(
+                    writer_queue,
+                    params,
+                    job_task_vo,
+                    batch_size,
+                    writer_count_info,
+                    meta,
+                ),
+                daemon=True,
+            )
+            writer.start()
+
+            writer_queues.append(writer_queue)
+            writer_count_infos.append(writer_count_info)
+            writers.append(writer)
+
+        try:
+            while True:
+                resource_data = resource_queue.get()
+                if resource_data is _END_OF_RESOURCES:
+                    break
+
+                resource_type = resource_data.get("resource_type")
+                collecting_count_info["total_count"] += 1
+
+                if resource_type == "inventory.CloudService":
+                    writer_index = self._get_writer_index(resource_data, writer_count)
+                    writer_queues[writer_index].put(resource_data)
                 else:
-                    upsert_result = self._upsert_resource(
-                        resource_data, params, job_task_vo
+                    self._upsert_collecting_resource(
+                        resource_data, params, job_task_vo, collecting_count_info
                     )
+        finally:
+            # stop the reader if the dispatching is aborted before the end of resources
+            stop_event.set()
 
-                    if upsert_result == NOT_COUNT:
-                        # skip count for cloud service type and region
-                        total_count -= 1
-                        pass
-                    elif upsert_result == CREATED:
-                        created_count += 1
-                    elif upsert_result == UPDATED:
-                        updated_count += 1
-                    else:
-                        failure_count += 1
+            for writer_queue in writer_queues:
+                writer_queue.put(_END_OF_RESOURCES)
 
-            except Exception as e:
-                _LOGGER.error(
-                    f"[_upsert_collecting_resources] upsert resource error: {e}",
-                    exc_info=True,
+            for writer in writers:
+                writer.join()
+
+        if len(reader_errors) > 0:
+            raise reader_errors[0]
+
+        for writer_count_info in writer_count_infos:
+            for key, value in writer_count_info.items():
+                collecting_count_info[key] += value
+
+        return collecting_count_info
+
+    def _read_collecting_resources(
+        self,
+        resources: Generator[dict, None, None],
+        resource_queue: Queue,
+        errors: list,
+        stop_event: threading.Event,
+        meta: dict,
+    ) -> None:
+        create_transaction(meta=meta, thread_id=str(threading.current_thread().ident))
+
+        try:
+            for resource_data in resources:
+                if not self._put_resource(resource_queue, resource_data, stop_event):
+                    break
+        except Exception as e:
+            errors.append(e)
+        finally:
+            # close the plugin stream if the reading is stopped before the end
+            if close := getattr(resources, "close", None):
+                close()
+
+            self._put_resource(resource_queue, _END_OF_RESOURCES, stop_event)
+            delete_transaction()
+
+    @staticmethod
+    def _put_resource(
+        resource_queue: Queue, resource_data: object, stop_event: threading.Event
+    ) -> bool:
+        while not stop_event.is_set():
+            try:
+                resource_queue.put(resource_data, timeout=_QUEUE_PUT_TIMEOUT)
+                return True
+            except Full:
+                continue
+
+        return False
+
+    def _write_cloud_services(
+        self,
+        writer_queue: Queue,
+        params: dict,
+        job_task_vo: JobTask,
+        batch_size: int,
+        collecting_count_info: dict,
+        meta: dict,
+    ) -> None:
+        create_transaction(meta=meta, thread_id=str(threading.current_thread().ident))
+        cloud_service_batch = []
+
+        try:
+            while True:
+                resource_data = writer_queue.get()
+                if resource_data is _END_OF_RESOURCES:
+                    break
+
+                cloud_service_batch.append(resource_data)
+
+                if len(cloud_service_batch) >= batch_size:
+                    self._flush_cloud_service_batch(
+                        cloud_service_batch, params, job_task_vo, collecting_count_info
+                    )
+                    cloud_service_batch = []
+
+            if len(cloud_service_batch) > 0:
+                self._flush_cloud_service_batch(
+                    cloud_service_batch, params, job_task_vo, collecting_count_info
                 )
-                self.job_task_mgr.add_error(
-                    job_task_vo,
-                    "ERROR_UNKNOWN",
-                    f"failed to upsert {resource_type}: {e}",
-                    {"resource_type": resource_type},
+        finally:
+            delete_transaction()
+
+    @staticmethod
+    def _get_writer_index(resource_data: dict, writer_count: int) -> int:
+        try:
+            match_rules = rule_matcher.dict_key_int_parser(
+                resource_data.get("match_rules") or {}
+            )
+            order = min(match_rules.keys())
+            keys, values = rule_matcher.make_match_key(
+                match_rules[order], resource_data.get("resource", {})
+            )
+            return hash(values) % writer_count
+        except Exception:
+            return 0
+
+    def _upsert_collecting_resource(
+        self,
+        resource_data: dict,
+        params: dict,
+        job_task_vo: JobTask,
+        collecting_count_info: dict,
+    ) -> None:
+        resource_type = resource_data.get("resource_type")
+
+        try:
+            if resource_type in ["inventory.Namespace", "inventory.Metric"]:
+                self._upsert_metric_and_namespace(resource_data, params)
+                collecting_count_info["total_count"] -= 1
+            else:
+                upsert_result = self._upsert_resource(
+                    resource_data, params, job_task_vo
+                )
+                self._update_collecting_count_info(
+                    collecting_count_info, upsert_result
                 )
-                failure_count += 1
 
+        except Exception as e:
+            _LOGGER.error(
+                f"[_upsert_collecting_resources] upsert resource error: {e}",
+                exc_info=True,
+            )
+            self.job_task_mgr.add_error(
+                job_task_vo,
+                "ERROR_UNKNOWN",
+                f"failed to upsert {resource_type}: {e}",
+                {"resource_type": resource_type},
+            )
+            collecting_count_info["failure_count"] += 1
+
+    @staticmethod
+    def _make_collecting_count_info() -> dict:
         return {
-            "total_count": total_count,
-            "created_count": created_count,
-            "updated_count": updated_count,
-            "failure_count": failure_count,
+            "total_count": 0,
+            "created_count": 0,
+            "updated_count": 0,
+            "unchanged_count": 0,
+            "failure_count": 0,
         }
 
+    def _flush_cloud_service_batch(
+        self,
+        cloud_service_batch: List[dict],
+        params: dict,
+        job_task_vo: JobTask,
+        collecting_count_info: dict,
+    ) -> None:
+        try:
+            upsert_results = self._upsert_cloud_services(
+                cloud_service_batch, params, job_task_vo
+            )
+        except Exception as e:
+            _LOGGER.error(
+                f"[_flush_cloud_service_batch] upsert resources error: {e}",
+                exc_info=True,
+            )
+            self.job_task_mgr.add_error(
+                job_task_vo,
+                "ERROR_UNKNOWN",
+                f"failed to upsert inventory.CloudService: {e}",
+                {"resource_type": "inventory.CloudService"},
+            )
+            upsert_results = [ERROR] * len(cloud_service_batch)
+
+        for upsert_result in upsert_results:
+            self._update_collecting_count_info(collecting_count_info, upsert_result)
+
+        self.job_task_mgr.flush_error_buffer_if_due(job_task_vo)
+
+    @staticmethod
+    def _update_collecting_count_info(
+        collecting_count_info: dict, upsert_result: int
+    ) -> None:
+        if upsert_result == NOT_COUNT:
+            # skip count for cloud service type and region
+            collecting_count_info["total_count"] -= 1
+        elif upsert_result == CREATED:
+            collecting_count_info["created_count"] += 1
+        elif upsert_result == UPDATED:
+            collecting_count_info["updated_count"] += 1
+        elif upsert_result == UNCHANGED:
+            collecting_count_info["unchanged_count"] += 1
+        else:
+            collecting_count_info["failure_count"] += 1
+
     def _upsert_metric_and_namespace(self, resource_data: dict, params: dict) -> None:
         """
         Args:
@@ -400,9 +784,10 @@ class CollectingManager(BaseManager):
             return ERROR
 
         try:
-            match_resource, total_count = self._query_with_match_rules(
-                request_data, match_rules, domain_id, workspace_id, manager
-            )
+            with measure_phase(self.transaction, "match"):
+                match_resource, total_count = self._query_with_match_rules(
+                    request_data, match_rules, domain_id, workspace_id, manager
+                )
 
         except ERROR_TOO_MANY_MATCH as e:
             _LOGGER.error(
@@ -480,6 +865,375 @@ class CollectingManager(BaseManager):
 
             return response
 
+    def _upsert_cloud_services(
+        self, resources: List[dict], params: dict, job_task_vo: JobTask
+    ) -> List[int]:
+        """
+        Args:
+            resources (list): cloud service resources from plugin
+            params (dict): same as _upsert_cloud_service_batch
+        Returns:
+            upsert_results (list): CREATED, UPDATED or ERROR for each resource
+
+        Resources with the same match rule values in one batch are upserted in
+        separate rounds, so that the repeats update the resource of the first one.
+        """
+
+        upsert_results = [ERROR] * len(resources)
+
+        for indexes in self._split_duplicated_resources(resources):
+            results = self._upsert_cloud_service_batch(
+                [resources[index] for index in indexes], params, job_task_vo
+            )
+
+            for index, result in zip(indexes, results):
+                upsert_results[index] = result
+
+        return upsert_results
+
+    @staticmethod
+    def _split_duplicated_resources(resources: List[dict]) -> List[List[int]]:
+        last_rounds = {}
+        rounds = []
+
+        for index, resource_data in enumerate(resources):
+            match_keys = set()
+
+            try:
+                match_rules = rule_matcher.dict_key_int_parser(
+                    resource_data.get("match_rules") or {}
+                )
+                for rule_keys in match_rules.values():
+                    keys, values = rule_matcher.make_match_key(
+                        rule_keys, resource_data.get("resource", {})
+                    )
+                    if keys:
+                        hash(values)
+                        match_keys.add((keys, values))
+            except Exception:
+                # unhashable match values are matched in the first round
+                match_keys = set()
+
+            round_index = max(
+                [
+                    last_rounds[match_key] + 1
+                    for match_key in match_keys
+                    if match_key in last_rounds
+                ],
+                default=0,
+            )
+
+            for match_key in match_keys:
+                last_rounds[match_key] = round_index
+
+            if round_index == len(rounds):
+                rounds.append([])
+
+            rounds[round_index].append(index)
+
+        return rounds
+
+    def _upsert_cloud_service_batch(
+        self, resources: List[dict], params: dict, job_task_vo: JobTask
+    ) -> List[int]:
+        """
+        Args:
+            resources (list): cloud service resources from plugin
+            params(dict): {
+                'collector_id': 'str',
+                'job_id': 'str',
+                'job_task_id': 'str',
+                'workspace_id': 'str',
+                'domain_id': 'str',
+                'plugin_info': 'dict',
+                'task_options': 'dict',
+                'secret_info': 'dict'
+            }
+        Returns:
+            upsert_results (list): CREATED, UPDATED or ERROR for each resource
+        """
+
+        job_task_id = params["job_task_id"]
+        domain_id = params["domain_id"]
+        workspace_id = params["workspace_id"]
+        resource_type = "inventory.CloudService"
+
+        service, manager = self._get_resource_map(resource_type)
+        record_buffer = self._record_buffer_map.get(job_task_id)
+        match_index = self._match_index_map.get(job_task_id)
+
+        upsert_results = [ERROR] * len(resources)
+        collected_ids = []
+        match_indexes = []
+        request_data_list = []
+        match_rules_list = []
+
+        for index, resource_data in enumerate(resources):
+            match_rules = resource_data.get("match_rules")
+            request_data = resource_data.get("resource", {})
+            request_data["domain_id"] = domain_id
+            request_data["workspace_id"] = workspace_id
+
+            if resource_data.get("state") == "FAILURE":
+                error_message = resource_data.get("message", "Unknown error.")
+                _LOGGER.error(
+                    f"[_upsert_cloud_services] plugin response error ({job_task_id}): {error_message}"
+                )
+                self.job_task_mgr.add_error(
+                    job_task_vo, "ERROR_PLUGIN", error_message, request_data
+                )
+            elif not match_rules:
+                error_message = "Match rule is not defined."
+                _LOGGER.error(
+                    f"[_upsert_cloud_services] match rule error ({job_task_id}): {error_message}"
+                )
+                self.job_task_mgr.add_error(
+                    job_task_vo,
+                    "ERROR_MATCH_RULE",
+                    error_message,
+                    {"resource_type": resource_type},
+                )
+            else:
+                match_indexes.append(index)
+                request_data_list.append(request_data)
+                match_rules_list.append(match_rules)
+
+        with measure_phase(self.transaction, "match"):
+            match_results = self._query_with_match_rules_in_batch(
+                request_data_list,
+                match_rules_list,
+                domain_id,
+                workspace_id,
+                manager,
+                match_index,
+            )
+
+        create_indexes = []
+        create_params_list = []
+        update_indexes = []
+        update_params_list = []
+
+        for index, request_data, match_result in zip(
+            match_indexes, request_data_list, match_results
+        ):
+            if isinstance(match_result, Exception):
+                self._add_match_error(job_task_vo, job_task_id, match_result)
+                continue
+
+            match_resource, total_count = match_result
+
+            if total_count == 0:
+                create_indexes.append(index)
+                create_params_list.append(request_data)
+            elif total_count == 1:
+                request_data.update(match_resource[0])
+                update_indexes.append(index)
+                update_params_list.append(request_data)
+
+        if len(update_indexes) > 0:
+            try:
+                unchanged_flags = service.touch_unchanged_resources(update_params_list)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[_upsert_cloud_services] failed to check unchanged resources ({job_task_id}): {e}",
+                    exc_info=True,
+                )
+                unchanged_flags = [False] * len(update_indexes)
+
+            for index, is_unchanged, update_params in zip(
+                update_indexes, unchanged_flags, update_params_list
+            ):
+                if is_unchanged:
+                    upsert_results[index] = UNCHANGED
+                    collected_ids.append(update_params["cloud_service_id"])
+
+            update_indexes, update_params_list = self._exclude_unchanged_resources(
+                update_indexes, update_params_list, unchanged_flags
+            )
+
+        for indexes, upsert_params_list, response, upsert_method in [
+            (create_indexes, create_params_list, CREATED, service.create_resources),
+            (update_indexes, update_params_list, UPDATED, service.update_resources),
+        ]:
+            if len(indexes) == 0:
+                continue
+
+            match_count = 0 if response == CREATED else 1
+            results = upsert_method(upsert_params_list, record_buffer)
+
+            for index, upsert_params, result in zip(
+                indexes, upsert_params_list, results
+            ):
+                if isinstance(result, Exception):
+                    self._add_upsert_error(
+                        job_task_vo,
+                        job_task_id,
+                        result,
+                        resource_type,
+                        match_count,
+                        upsert_params,
+                    )
+                else:
+                    upsert_results[index] = response
+                    collected_ids.append(result.cloud_service_id)
+
+                    if match_index is not None:
+                        match_index.add(result.cloud_service_id, upsert_params)
+
+        self._add_collected_cloud_service_ids(job_task_id, collected_ids)
+
+        return upsert_results
+
+    def _acquire_match_index(self, params: dict) -> None:
+        job_task_id = params["job_task_id"]
+        match_index = acquire_match_index(
+            job_task_id, lambda: self._load_match_index(params)
+        )
+
+        if match_index is not None:
+            self._match_index_map[job_task_id] = match_index
+
+    def _release_match_index(self, job_task_id: str) -> None:
+        self._match_index_map.pop(job_task_id, None)
+        release_match_index(job_task_id)
+
+    def _load_match_index(self, params: dict) -> Union[MatchIndex, None]:
+        keys = config.get_global("COLLECTING_MATCH_INDEX_KEYS", [])
+        if len(keys) == 0:
+            return None
+
+        _, manager = self._get_resource_map("inventory.CloudService")
+
+        try:
+            with measure_phase(self.transaction, "match_index"):
+                return manager.get_match_index(
+                    keys,
+                    params["domain_id"],
+                    params["workspace_id"],
+                    config.get_global("COLLECTING_MATCH_INDEX_LIMIT"),
+                )
+        except Exception as e:
+            _LOGGER.error(
+                f"[_load_match_index] failed to load match index ({params['job_task_id']}): {e}",
+                exc_info=True,
+            )
+            return None
+
+    def _create_record_buffer(self, job_task_id: str) -> RecordBuffer:
+        record_mgr: RecordManager = self.locator.get_manager(RecordManager)
+        record_buffer = RecordBuffer(
+            record_mgr.create_records,
+            config.get_global("CHANGE_HISTORY_BATCH_SIZE", 500),
+        )
+        self._record_buffer_map[job_task_id] = record_buffer
+        return record_buffer
+
+    def _flush_record_buffer(self, job_task_id: str, record_buffer: RecordBuffer):
+        self._record_buffer_map.pop(job_task_id, None)
+
+        try:
+            record_buffer.flush()
+        except Exception as e:
+            _LOGGER.error(
+                f"[_flush_record_buffer] failed to create change history records ({job_task_id}): {e}",
+                exc_info=True,
+            )
+
+    def _add_collected_cloud_service_ids(
+        self, job_task_id: str, cloud_service_ids: List[str]
+    ) -> None:
+        with self._collected_ids_lock:
+            self._collected_ids_map.setdefault(job_task_id, set()).update(
+                cloud_service_ids
+            )
+
+    def _reconcile_collection_states(self, params: dict) -> None:
+        with self._collected_ids_lock:
+            cloud_service_ids = self._collected_ids_map.pop(params["job_task_id"], set())
+
+        if len(cloud_service_ids) > 0:
+            state_mgr: CollectionStateManager = self.locator.get_manager(
+                CollectionStateManager
+            )
+            state_mgr.reconcile_collection_states(
+                cloud_service_ids, params["domain_id"]
+            )
+
+    @staticmethod
+    def _exclude_unchanged_resources(
+        indexes: List[int], params_list: List[dict], unchanged_flags: List[bool]
+    ) -> Tuple[List[int], List[dict]]:
+        changed_indexes = []
+        changed_params_list = []
+
+        for index, params, is_unchanged in zip(indexes, params_list, unchanged_flags):
+            if not is_unchanged:
+                changed_indexes.append(index)
+                changed_params_list.append(params)
+
+        return changed_indexes, changed_params_list
+
+    def _add_match_error(
+        self, job_task_vo: JobTask, job_task_id: str, error: Exception
+    ) -> None:
+        resource_type = "inventory.CloudService"
+
+        if isinstance(error, ERROR_TOO_MANY_MATCH):
+            _LOGGER.error(
+                f"[_upsert_cloud_services] match resource error ({job_task_id}): {error}"
+            )
+            self.job_task_mgr.add_error(
+                job_task_vo,
+                error.error_code,
+                error.message,
+                {"resource_type": resource_type},
+            )
+        else:
+            if isinstance(error, ERROR_BASE):
+                error_message = error.message
+            else:
+                error_message = str(error)
+
+            _LOGGER.error(
+                f"[_upsert_cloud_services] match resource error ({job_task_id}): {error_message}"
+            )
+            self.job_task_mgr.add_error(
+                job_task_vo,
+                "ERROR_UNKNOWN",
+                f"Failed to match resource: {error_message}",
+                {"resource_type": resource_type},
+            )
+
+    def _add_upsert_error(
+        self,
+        job_task_vo: JobTask,
+        job_task_id: str,
+        error: Exception,
+        resource_type: str,
+        total_count: int,
+        request_data: dict,
+    ) -> None:
+        if isinstance(error, ERROR_BASE):
+            _LOGGER.error(
+                f"[_upsert_cloud_services] resource upsert error ({job_task_id}): {error.message}"
+            )
+            additional = self._set_error_addition_info(
+                resource_type, total_count, request_data
+            )
+            self.job_task_mgr.add_error(
+                job_task_vo, error.error_code, error.message, additional
+            )
+        else:
+            _LOGGER.debug(
+                f"[_upsert_cloud_services] unknown error ({job_task_id}): {error}"
+            )
+            self.job_task_mgr.add_error(
+                job_task_vo,
+                "ERROR_UNKNOWN",
+                str(error),
+                {"resource_type": resource_type},
+            )
+
     def _set_transaction_meta(self, params):
         secret_info = params["secret_info"]
 
@@ -489,6 +1243,9 @@ class CollectingManager(BaseManager):
         self.transaction.set_meta("secret.secret_id", secret_info["secret_id"])
         self.transaction.set_meta("disable_info_log", "true")
 
+        if not config.get_global("COLLECTING_ROLLBACK_ENABLED", False):
+            self.transaction.set_meta("disable_rollback", "true")
+
         if plugin_id := params["plugin_info"].get("plugin_id"):
             self.transaction.set_meta("plugin_id", plugin_id)
 
@@ -582,3 +1339,119 @@ class CollectingManager(BaseManager):
                 return match_resource, total_count
 
         return match_resource, total_count
+
+    @staticmethod
+    def _query_with_match_rules_in_batch(
+        resource_data_list: List[dict],
+        match_rules_list: List[dict],
+        domain_id: str,
+        workspace_id: str,
+        resource_manager: ResourceManager,
+        match_index: MatchIndex = None,
+    ) -> list:
+        """match resources based on match rules with one query per match rule order
+
+        Args:
+            resource_data_list (list): resource data from plugin
+            match_rules_list (list): match rules of each resource data
+                e.g. {1:['reference.resource_id'], 2:['name']}
+            match_index (MatchIndex): match index of the job task, the database is
+                queried only for the resources missed or ambiguous in the index
+
+        Return:
+            match_results (list): (match_resource, total_count) or exception for each resource data
+        """
+
+        match_results = [(None, 0)] * len(resource_data_list)
+        match_rules_list = [
+            rule_matcher.dict_key_int_parser(match_rules)
+            for match_rules in match_rules_list
+        ]
+        orders = sorted(
+            {order for match_rules in match_rules_list for order in match_rules.keys()}
+        )
+        unmatched_indexes = list(range(len(resource_data_list)))
+
+        for order in orders:
+            match_keys = {}
+            query_indexes = {}
+            matched_indexes = set()
+
+            for index in unmatched_indexes:
+                match_rules = match_rules_list[index]
+                if order not in match_rules:
+                    continue
+
+                try:
+                    keys, values = rule_matcher.make_match_key(
+                        match_rules[order], resource_data_list[index]
+                    )
+                    hash(values)
+                except Exception:
+                    keys = None
+
+                if keys and match_index is not None:
+                    if cloud_service_id := match_index.lookup(keys, values):
+                        match_results[index] = [
+                            {"cloud_service_id": cloud_service_id}
+                        ], 1
+                        matched_indexes.add(index)
+                        continue
+
+                if keys:
+                    match_keys[index] = keys, values
+                    query_indexes.setdefault(keys, []).append(index)
+                else:
+                    # fall back to the query per resource for unindexable values
+                    query_indexes.setdefault(None, []).append(index)
+
+            for keys, indexes in query_indexes.items():
+                try:
+                    if keys is None:
+                        for index in indexes:
+                            query = rule_matcher.make_query(
+                                order,
+                                match_rules_list[index],
+                                resource_data_list[index],
+                                domain_id,
+                                workspace_id,
+                            )
+                            match_results[index] = resource_manager.find_resources(
+                                query
+                            )
+                    else:
+                        values_list = list({match_keys[index][1] for index in indexes})
+                        matched_resources = resource_manager.find_resources_in_batch(
+                            keys, values_list, domain_id, workspace_id
+                        )
+
+                        for index in indexes:
+                            match_resource = matched_resources[match_keys[index][1]]
+                            match_results[index] = match_resource, len(match_resource)
+
+                except Exception as e:
+                    for index in indexes:
+                        match_results[index] = e
+                        matched_indexes.add(index)
+
+                    continue
+
+                for index in indexes:
+                    match_resource, total_count = match_results[index]
+
+                    if total_count > 1:
+                        if data := resource_data_list[index].get("data"):
+                            match_results[index] = ERROR_TOO_MANY_MATCH(
+                                match_key=match_rules_list[index][order],
+                                resources=match_resource,
+                                more=data,
+                            )
+                            matched_indexes.add(index)
+                    elif total_count == 1 and match_resource:
+                        matched_indexes.add(index)
+
+            unmatched_indexes = [
+                index for index in unmatched_indexes if index not in matched_indexes
+            ]
+
+        return match_results
@@ -1,9 +1,12 @@
 import logging
+from datetime import datetime
 from typing import Union, Tuple, List
 
+from spaceone.core import config
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.model.collection_state_model import CollectionState
+from spaceone.inventory.lib.rollback import add_rollback
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,7 +39,8 @@ class CollectionStateManager(BaseManager):
             }
 
             state_vo = self.collection_state_model.create(state_data)
-            self.transaction.add_rollback(_rollback, state_vo)
+
+            add_rollback(self.transaction, _rollback, state_vo)
 
     def update_collection_state_by_vo(
         self, params: dict, state_vo: CollectionState
@@ -48,7 +52,8 @@ class CollectionStateManager(BaseManager):
             )
             state_vo.update(old_data)
 
-        self.transaction.add_rollback(_rollback, state_vo.to_dict())
+        add_rollback(self.transaction, _rollback, snapshot_vo=state_vo)
+
         return state_vo.update(params)
 
     def reset_collection_state(self, state_vo: CollectionState) -> None:
@@ -57,6 +62,74 @@ class CollectionStateManager(BaseManager):
 
             self.update_collection_state_by_vo(params, state_vo)
 
+    def reconcile_collection_states(
+        self, cloud_service_ids: List[str], domain_id: str
+    ) -> None:
+        """Reset collection states of cloud services collected by the job task
+        and create collection states of cloud services that have no state
+        """
+        if not (self.collector_id and self.job_task_id and self.secret_id):
+            return
+
+        chunk_size = config.get_global("COLLECTION_STATE_CHUNK_SIZE", 1000)
+        cloud_service_ids = list(cloud_service_ids)
+
+        for index in range(0, len(cloud_service_ids), chunk_size):
+            chunk_ids = cloud_service_ids[index : index + chunk_size]
+            now = datetime.utcnow()
+
+            state_vos = self.filter_collection_states(
+                collector_id=self.collector_id,
+                secret_id=self.secret_id,
+                cloud_service_id=chunk_ids,
+                domain_id=domain_id,
+            )
+            existing_ids = set(state_vos.distinct("cloud_service_id"))
+
+            state_vos.update(
+                {
+                    "disconnected_count": 0,
+                    "job_task_id": self.job_task_id,
+                    "updated_at": now,
+                }
+            )
+
+            new_state_vos = [
+                self.collection_state_model(
+                    collector_id=self.collector_id,
+                    job_task_id=self.job_task_id,
+                    secret_id=self.secret_id,
+                    cloud_service_id=cloud_service_id,
+                    domain_id=domain_id,
+                    updated_at=now,
+                )
+                for cloud_service_id in chunk_ids
+                if cloud_service_id not in existing_ids
+            ]
+
+            if len(new_state_vos) > 0:
+                self.collection_state_model.objects.insert(
+                    new_state_vos, load_bulk=False
+                )
+
+    def increase_disconnected_count(
+        self,
+        collector_id: str,
+        secret_id: str,
+        cloud_service_ids: List[str],
+        domain_id: str,
+    ) -> None:
+        chunk_size = config.get_global("COLLECTION_STATE_CHUNK_SIZE", 1000)
+
+        for index in range(0, len(cloud_service_ids), chunk_size):
+            state_vos = self.filter_collection_states(
+                collector_id=collector_id,
+                secret_id=secret_id,
+                cloud_service_id=cloud_service_ids[index : index + chunk_size],
+                domain_id=domain_id,
+            )
+            state_vos.increment("disconnected_count")
+
     def get_collection_state(
         self, cloud_service_id: str, domain_id: str
     ) -> Union[CollectionState, None]:
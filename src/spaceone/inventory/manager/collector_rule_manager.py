@@ -1,14 +1,26 @@
 import logging
-import functools
-from typing import Tuple
-from spaceone.core import utils
+from typing import List, Tuple, Union
+from spaceone.core import config, utils
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.manager.identity_manager import IdentityManager
-from spaceone.inventory.model.collector_rule_model import (
-    CollectorRule,
-    CollectorRuleCondition,
+from spaceone.inventory.model.collector_rule_model import CollectorRule
+from spaceone.inventory.lib.collector_rule_engine import (
+    CompiledCollectorRule,
+    CompiledCollectorRules,
+    compile_collector_rule,
+    get_collector_rule_version,
+    get_compiled_collector_rules,
+    increase_collector_rule_version,
+    make_collector_rule_hash,
+    set_compiled_collector_rules,
 )
+from spaceone.inventory.lib.identity_snapshot import (
+    IdentitySnapshot,
+    get_identity_snapshot,
+    set_identity_snapshot,
+)
+from spaceone.inventory.lib.phase_timer import measure_phase
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +35,7 @@ class CollectorRuleManager(BaseManager):
         self._project_info = {}
         self._service_account_info = {}
         self._collector_rule_info = {}
+        self._refreshed_identity_snapshots = set()
 
     def create_collector_rule(self, params: dict) -> CollectorRule:
         def _rollback(vo: CollectorRule):
@@ -34,6 +47,9 @@ class CollectorRuleManager(BaseManager):
 
         collector_rule_vo: CollectorRule = self.collector_rule_model.create(params)
         self.transaction.add_rollback(_rollback, collector_rule_vo)
+        self.increase_collector_rule_version(
+            collector_rule_vo.collector_id, collector_rule_vo.domain_id
+        )
 
         return collector_rule_vo
 
@@ -49,11 +65,23 @@ class CollectorRuleManager(BaseManager):
 
         self.transaction.add_rollback(_rollback, collector_rule_vo.to_dict())
 
-        return collector_rule_vo.update(params)
+        collector_rule_vo = collector_rule_vo.update(params)
+        self.increase_collector_rule_version(
+            collector_rule_vo.collector_id, collector_rule_vo.domain_id
+        )
+
+        return collector_rule_vo
+
+    def delete_collector_rule_by_vo(self, collector_rule_vo: CollectorRule) -> None:
+        collector_id = collector_rule_vo.collector_id
+        domain_id = collector_rule_vo.domain_id
 
-    @staticmethod
-    def delete_collector_rule_by_vo(collector_rule_vo: CollectorRule) -> None:
         collector_rule_vo.delete()
+        self.increase_collector_rule_version(collector_id, domain_id)
+
+    @staticmethod
+    def increase_collector_rule_version(collector_id: str, domain_id: str) -> None:
+        increase_collector_rule_version(collector_id, domain_id)
 
     def get_collector_rule(
         self, collector_rule_id: str, domain_id: str, workspace_id: str = None
@@ -80,35 +108,37 @@ class CollectorRuleManager(BaseManager):
     def change_cloud_service_data(
         self, collector_id: str, domain_id: str, cloud_service_data: dict
     ) -> dict:
-        (
-            managed_collector_rule_vos,
-            custom_collector_rule_vos,
-        ) = self._get_collector_rules(collector_id, domain_id)
+        compiled_rules = self._get_compiled_collector_rules(collector_id, domain_id)
 
         cloud_service_data = self._apply_collector_rule_to_cloud_service_data(
-            cloud_service_data, managed_collector_rule_vos, domain_id
+            cloud_service_data, compiled_rules.managed_rules, domain_id
         )
 
         cloud_service_data = self._apply_collector_rule_to_cloud_service_data(
-            cloud_service_data, custom_collector_rule_vos, domain_id
+            cloud_service_data, compiled_rules.custom_rules, domain_id
         )
 
         return cloud_service_data
 
+    def get_collector_rule_hash(self, collector_id: str, domain_id: str) -> str:
+        compiled_rules = self._get_compiled_collector_rules(collector_id, domain_id)
+        return compiled_rules.collector_rule_hash
+
     def _apply_collector_rule_to_cloud_service_data(
-        self, cloud_service_data: dict, collector_rule_vos: QuerySet, domain_id: str
+        self,
+        cloud_service_data: dict,
+        compiled_rules: List[CompiledCollectorRule],
+        domain_id: str,
     ) -> dict:
-        for collector_rule_vo in collector_rule_vos:
-            is_match = self._change_cloud_service_data_by_rule(
-                cloud_service_data, collector_rule_vo
-            )
+        for compiled_rule in compiled_rules:
+            is_match = compiled_rule.match(cloud_service_data)
 
             if is_match:
                 cloud_service_data = self._change_cloud_service_data_with_actions(
-                    cloud_service_data, collector_rule_vo.actions, domain_id
+                    cloud_service_data, compiled_rule.actions, domain_id
                 )
 
-            if is_match and collector_rule_vo.options.stop_processing:
+            if is_match and compiled_rule.stop_processing:
                 break
 
         return cloud_service_data
@@ -172,6 +202,23 @@ class CollectorRuleManager(BaseManager):
                 f"inventory:service-account:{domain_id}:{target_key}:{target_value}"
             ]
 
+        service_account_info = self._find_in_identity_snapshot(
+            "service_account", target_key, target_value, domain_id
+        )
+
+        if service_account_info is False:
+            service_account_info = self._list_service_account(
+                target_key, target_value, domain_id
+            )
+
+        self._service_account_info[
+            f"inventory:service-account:{domain_id}:{target_key}:{target_value}"
+        ] = service_account_info
+        return service_account_info
+
+    def _list_service_account(
+        self, target_key: str, target_value: any, domain_id: str
+    ) -> Union[dict, None]:
         query = {
             "filter": [
                 {"k": target_key, "v": target_value, "o": "eq"},
@@ -180,20 +227,17 @@ class CollectorRuleManager(BaseManager):
         }
 
         query_hash = utils.dict_to_hash(query)
-        response = self.identity_mgr.list_service_accounts_with_cache(
-            query, query_hash, domain_id
-        )
+        with measure_phase(self.transaction, "identity_lookup"):
+            response = self.identity_mgr.list_service_accounts_with_cache(
+                query, query_hash, domain_id
+            )
         results = response.get("results", [])
         total_count = response.get("total_count", 0)
 
-        service_account_info = None
         if total_count > 0:
-            service_account_info = results[0]
+            return results[0]
 
-        self._service_account_info[
-            f"inventory:service-account:{domain_id}:{target_key}:{target_value}"
-        ] = service_account_info
-        return service_account_info
+        return None
 
     def _get_project(self, target_key: str, target_value: str, domain_id: str) -> dict:
         if (
@@ -204,93 +248,183 @@ class CollectorRuleManager(BaseManager):
                 f"identity:project:{domain_id}:{target_key}:{target_value}"
             ]
 
+        project_info = self._find_in_identity_snapshot(
+            "project", target_key, target_value, domain_id
+        )
+
+        if project_info is False:
+            project_info = self._list_project(target_key, target_value, domain_id)
+
+        self._project_info[
+            f"identity:project:{domain_id}:{target_key}:{target_value}"
+        ] = project_info
+        return project_info
+
+    def _list_project(
+        self, target_key: str, target_value: str, domain_id: str
+    ) -> Union[dict, None]:
         query = {
             "filter": [{"k": target_key, "v": target_value, "o": "eq"}],
             "only": ["project_id", "workspace_id"],
         }
 
         query_hash = utils.dict_to_hash(query)
-        response = self.identity_mgr.list_projects_with_cache(
-            query, query_hash, domain_id
-        )
+        with measure_phase(self.transaction, "identity_lookup"):
+            response = self.identity_mgr.list_projects_with_cache(
+                query, query_hash, domain_id
+            )
         results = response.get("results", [])
         total_count = response.get("total_count", 0)
 
-        project_info = None
         if total_count > 0:
-            project_info = results[0]
+            return results[0]
+
+        return None
+
+    def _find_in_identity_snapshot(
+        self, resource_type: str, target_key: str, target_value: any, domain_id: str
+    ) -> Union[dict, None, bool]:
+        """
+        find a project or service account in the identity snapshot of the domain
+        :return: a found resource, None if not found, False if the snapshot is unavailable
+        """
+        if isinstance(target_value, (list, dict)):
+            return False
 
-        self._project_info[
-            f"identity:project:{domain_id}:{target_key}:{target_value}"
-        ] = project_info
-        return project_info
+        ttl = config.get_global("IDENTITY_SNAPSHOT_TTL", 300)
+        snapshot = get_identity_snapshot(resource_type, domain_id, ttl)
+
+        if snapshot is None or not snapshot.is_indexed(target_key):
+            snapshot = self._load_identity_snapshot(resource_type, target_key, domain_id)
+
+        elif snapshot.find(target_key, target_value) is None:
+            # resources created after loading are found by one refresh per job task
+            if resource_type not in self._refreshed_identity_snapshots:
+                snapshot = self._load_identity_snapshot(
+                    resource_type, target_key, domain_id
+                )
+
+        if snapshot is None:
+            return False
 
-    def _change_cloud_service_data_by_rule(
-        self, cloud_service_data: dict, collector_rule_vo: CollectorRule
-    ) -> bool:
-        conditions_policy = collector_rule_vo.conditions_policy
+        return snapshot.find(target_key, target_value)
 
-        if conditions_policy == "ALWAYS":
-            return True
+    def _load_identity_snapshot(
+        self, resource_type: str, target_key: str, domain_id: str
+    ) -> Union[IdentitySnapshot, None]:
+        self._refreshed_identity_snapshots.add(resource_type)
+
+        if resource_type == "project":
+            only = ["project_id", "workspace_id"]
         else:
-            results = list(
-                map(
-                    functools.partial(self._check_condition, cloud_service_data),
-                    collector_rule_vo.conditions,
+            only = ["service_account_id", "project_id", "workspace_id"]
+
+        target_keys = self._get_identity_target_keys(resource_type, domain_id)
+        target_keys.update([only[0], target_key])
+        only += sorted(target_keys - set(only))
+
+        try:
+            with measure_phase(self.transaction, "identity_lookup"):
+                results = self._list_all_identity_resources(
+                    resource_type, only, domain_id
                 )
+        except Exception as e:
+            _LOGGER.warning(
+                f"[_load_identity_snapshot] failed to load {resource_type} "
+                f"({domain_id}): {e}"
             )
+            return None
 
-            if conditions_policy == "ALL":
-                return all(results)
-            else:
-                return any(results)
+        snapshot = IdentitySnapshot(results, list(target_keys))
+        set_identity_snapshot(resource_type, domain_id, snapshot)
 
-    @staticmethod
-    def _check_condition(
-        cloud_service_data: dict, condition: CollectorRuleCondition
-    ) -> bool:
-        cloud_service_value = utils.get_dict_value(cloud_service_data, condition.key)
-        condition_value = condition.value
-        operator = condition.operator
-
-        if cloud_service_value is None:
-            return False
+        _LOGGER.debug(
+            f"[_load_identity_snapshot] load {resource_type} ({domain_id}): "
+            f"count = {len(results)}, target_keys = {sorted(target_keys)}"
+        )
 
-        if operator == "eq":
-            if cloud_service_value == condition_value:
-                return True
-            else:
-                return False
-        elif operator == "contain":
-            if cloud_service_value.lower().find(condition_value.lower()) >= 0:
-                return True
-            else:
-                return False
-        elif operator == "not":
-            if cloud_service_value != condition_value:
-                return True
-            else:
-                return False
-        elif operator == "not_contain":
-            if cloud_service_value.lower().find(condition_value.lower()) < 0:
-                return True
+        return snapshot
+
+    def _list_all_identity_resources(
+        self, resource_type: str, only: list, domain_id: str
+    ) -> List[dict]:
+        page_size = config.get_global("IDENTITY_SNAPSHOT_PAGE_SIZE", 1000)
+        results = []
+        start = 1
+
+        while True:
+            query = {"only": only, "page": {"start": start, "limit": page_size}}
+
+            if resource_type == "project":
+                response = self.identity_mgr.list_projects({"query": query}, domain_id)
             else:
-                return False
+                response = self.identity_mgr.list_service_accounts(query, domain_id)
+
+            page_results = response.get("results", [])
+            results += page_results
+            start += page_size
+
+            if len(page_results) < page_size or start > response.get(
+                "total_count", 0
+            ):
+                return results
+
+    def _get_identity_target_keys(self, resource_type: str, domain_id: str) -> set:
+        if resource_type == "project":
+            action, default_target_key = "match_project", "project_id"
+        else:
+            action, default_target_key = "match_service_account", "service_account_id"
 
-        return False
+        target_keys = set()
+        collector_rule_vos = self.filter_collector_rules(
+            **{"domain_id": domain_id, f"actions__{action}__exists": True}
+        )
+
+        for collector_rule_vo in collector_rule_vos.only("actions"):
+            action_info = (collector_rule_vo.actions or {}).get(action) or {}
+            target_keys.add(action_info.get("target", default_target_key))
+
+        return target_keys
 
-    def _get_collector_rules(
+    def _get_compiled_collector_rules(
         self, collector_id: str, domain_id: str
-    ) -> Tuple[QuerySet, QuerySet]:
+    ) -> CompiledCollectorRules:
+        # the version is checked once per manager, i.e. once per job task
         if collector_id in self._collector_rule_info:
-            return self._collector_rule_info[collector_id].get(
-                "managed", []
-            ), self._collector_rule_info[collector_id].get("custom", [])
+            return self._collector_rule_info[collector_id]
 
+        version = get_collector_rule_version(collector_id, domain_id)
+        compiled_rules = get_compiled_collector_rules(collector_id, domain_id, version)
+
+        if compiled_rules is None:
+            managed_collector_rule_vos, custom_collector_rule_vos = (
+                self._list_collector_rules_by_type(collector_id, domain_id)
+            )
+
+            compiled_rules = CompiledCollectorRules(
+                version,
+                [compile_collector_rule(vo) for vo in managed_collector_rule_vos],
+                [compile_collector_rule(vo) for vo in custom_collector_rule_vos],
+                make_collector_rule_hash(
+                    managed_collector_rule_vos + custom_collector_rule_vos
+                ),
+            )
+            set_compiled_collector_rules(collector_id, domain_id, compiled_rules)
+
+            _LOGGER.debug(
+                f"[_get_compiled_collector_rules] compile collector rules: "
+                f"{collector_id} (version = {version})"
+            )
+
+        self._collector_rule_info[collector_id] = compiled_rules
+        return compiled_rules
+
+    def _list_collector_rules_by_type(
+        self, collector_id: str, domain_id: str
+    ) -> Tuple[List[CollectorRule], List[CollectorRule]]:
         managed_query = self._make_collector_rule_query(
             collector_id, "MANAGED", domain_id
         )
-
         managed_collector_rule_vos, total_count = self.list_collector_rules(
             managed_query
         )
@@ -300,11 +434,7 @@ class CollectorRuleManager(BaseManager):
         )
         custom_collector_rule_vos, total_count = self.list_collector_rules(custom_query)
 
-        self._collector_rule_info[collector_id] = {}
-        self._collector_rule_info[collector_id]["managed"] = managed_collector_rule_vos
-        self._collector_rule_info[collector_id]["custom"] = custom_collector_rule_vos
-
-        return managed_collector_rule_vos, custom_collector_rule_vos
+        return list(managed_collector_rule_vos), list(custom_collector_rule_vos)
 
     @staticmethod
     def _make_collector_rule_query(
@@ -1,4 +1,5 @@
 import logging
+from typing import Union
 from spaceone.core import cache, config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
@@ -80,6 +81,100 @@ class IdentityManager(BaseManager):
 
         return self.identity_conn.dispatch("Project.list", params)
 
+    def get_project_group_tree(self, domain_id: str) -> dict:
+        """
+        get project ids of each project group including child project groups
+        :return: {project_group_id: [project_id, ...]}
+        """
+        cache_key = f"inventory:project-group-tree:{domain_id}"
+        project_group_tree = self._get_project_group_tree_cache(cache_key)
+
+        if project_group_tree is None:
+            project_group_tree = self._load_project_group_tree(domain_id)
+            self._set_project_group_tree_cache(cache_key, project_group_tree)
+
+        return project_group_tree
+
+    def _load_project_group_tree(self, domain_id: str) -> dict:
+        system_token = config.get_global("TOKEN")
+
+        project_groups_info = self.identity_conn.dispatch(
+            "ProjectGroup.list",
+            {"query": {"only": ["project_group_id", "parent_group_id"]}},
+            x_domain_id=domain_id,
+            token=system_token,
+        )
+        projects_info = self.identity_conn.dispatch(
+            "Project.list",
+            {"query": {"only": ["project_id", "project_group_id"]}},
+            x_domain_id=domain_id,
+            token=system_token,
+        )
+
+        child_group_map = {}
+        for project_group_info in project_groups_info.get("results", []):
+            project_group_id = project_group_info["project_group_id"]
+            parent_group_id = project_group_info.get("parent_group_id")
+
+            child_group_map.setdefault(project_group_id, [])
+            if parent_group_id:
+                child_group_map.setdefault(parent_group_id, []).append(
+                    project_group_id
+                )
+
+        project_map = {}
+        for project_info in projects_info.get("results", []):
+            if project_group_id := project_info.get("project_group_id"):
+                project_map.setdefault(project_group_id, []).append(
+                    project_info["project_id"]
+                )
+
+        project_group_tree = {}
+        for project_group_id in child_group_map.keys():
+            project_ids = []
+            target_group_ids = [project_group_id]
+            visited_group_ids = set()
+
+            while target_group_ids:
+                target_group_id = target_group_ids.pop()
+                if target_group_id in visited_group_ids:
+                    continue
+
+                visited_group_ids.add(target_group_id)
+                project_ids.extend(project_map.get(target_group_id, []))
+                target_group_ids.extend(child_group_map.get(target_group_id, []))
+
+            project_group_tree[project_group_id] = project_ids
+
+        return project_group_tree
+
+    @staticmethod
+    def _get_project_group_tree_cache(cache_key: str) -> Union[dict, None]:
+        if not cache.is_set():
+            return None
+
+        try:
+            return cache.get(cache_key)
+        except Exception as e:
+            _LOGGER.warning(
+                f"[_get_project_group_tree_cache] failed to get cache: {e}"
+            )
+            return None
+
+    @staticmethod
+    def _set_project_group_tree_cache(cache_key: str, project_group_tree: dict):
+        expire = config.get_global("PROJECT_GROUP_TREE_CACHE_TTL", 300)
+
+        if not (cache.is_set() and expire > 0):
+            return
+
+        try:
+            cache.set(cache_key, project_group_tree, expire=expire)
+        except Exception as e:
+            _LOGGER.warning(
+                f"[_set_project_group_tree_cache] failed to set cache: {e}"
+            )
+
     @cache.cacheable(
         key="inventory:project:query:{domain_id}:{query_hash}", expire=3600
     )
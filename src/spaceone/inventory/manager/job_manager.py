@@ -1,5 +1,5 @@
 import logging
-from typing import Tuple, List
+from typing import Tuple, List, Union
 from datetime import datetime, timedelta
 from spaceone.core import cache, config
 from spaceone.core.manager import BaseManager
@@ -7,7 +7,6 @@ from spaceone.core.model.mongo_model import QuerySet
 from spaceone.inventory.error import *
 from spaceone.inventory.model.collector_model import Collector
 from spaceone.inventory.model.job_model import Job
-from spaceone.inventory.model.job_task_model import JobTask
 from spaceone.inventory.manager.metric_manager import MetricManager
 from spaceone.inventory.manager.metric_data_manager import MetricDataManager
 
@@ -80,44 +79,61 @@ class JobManager(BaseManager):
     def stat_jobs(self, query: dict) -> dict:
         return self.job_model.stat(**query)
 
-    def increase_success_tasks(self, job_id: str, domain_id: str) -> None:
-        job_vo: Job = self.get_job(job_id, domain_id)
-        job_vo.increment("success_tasks")
-        self.decrease_remained_tasks_by_vo(job_vo)
+    def increase_success_tasks(
+        self, job_id: str, domain_id: str, changed_count_info: dict = None
+    ) -> None:
+        self._increase_finished_tasks(
+            job_id, domain_id, "success_tasks", changed_count_info
+        )
 
-    def increase_failure_tasks(self, job_id: str, domain_id: str) -> None:
-        job_vo: Job = self.get_job(job_id, domain_id)
-        job_vo.increment("failure_tasks")
-        self.decrease_remained_tasks_by_vo(job_vo)
+    def increase_failure_tasks(
+        self, job_id: str, domain_id: str, changed_count_info: dict = None
+    ) -> None:
+        self._increase_finished_tasks(
+            job_id, domain_id, "failure_tasks", changed_count_info
+        )
+
+    def _increase_finished_tasks(
+        self,
+        job_id: str,
+        domain_id: str,
+        finished_key: str,
+        changed_count_info: dict = None,
+    ) -> None:
+        inc_params = {f"inc__{finished_key}": 1, "inc__remained_tasks": -1}
+
+        for key, value in (changed_count_info or {}).items():
+            if value > 0:
+                inc_params[f"inc__{key}"] = value
+
+        # only the last finished task sees remained_tasks == 0
+        job_vo: Job = self.job_model.objects(job_id=job_id, domain_id=domain_id).modify(
+            new=True, **inc_params
+        )
 
-    def decrease_remained_tasks_by_vo(self, job_vo: Job) -> None:
-        job_vo = job_vo.decrement("remained_tasks")
+        if job_vo is None:
+            raise ERROR_NOT_FOUND(key="job_id", value=job_id)
 
         if job_vo.remained_tasks == 0:
-            if job_vo.status == "IN_PROGRESS":
-                if job_vo.failure_tasks > 0:
-                    self.make_failure_by_vo(job_vo)
-                else:
-                    self.make_success_by_vo(job_vo)
-
-            if self._is_changed(job_vo):
-                self._run_metric_queries(job_vo.plugin_id, job_vo.domain_id)
-
-    def _is_changed(self, job_vo: Job) -> bool:
-        job_task_model: JobTask = self.locator.get_model("JobTask")
-        job_task_vos: List[JobTask] = job_task_model.filter(
-            job_id=job_vo.job_id, domain_id=job_vo.domain_id
-        )
-        is_changed = False
+            self._finish_job(job_vo)
 
-        for job_task_vo in job_task_vos:
-            if (
-                job_task_vo.created_count > 0
-                or job_task_vo.updated_count > 0
-                or job_task_vo.deleted_count > 0
-            ):
-                is_changed = True
-                break
+    def _finish_job(self, job_vo: Job) -> None:
+        if job_vo.status == "IN_PROGRESS":
+            if job_vo.failure_tasks > 0:
+                self.make_failure_by_vo(job_vo)
+            else:
+                self.make_success_by_vo(job_vo)
+
+        if self._is_changed(job_vo):
+            self._run_metric_queries(job_vo.plugin_id, job_vo.domain_id)
+
+    @staticmethod
+    def _is_changed(job_vo: Job) -> bool:
+        is_changed = (
+            job_vo.created_count > 0
+            or job_vo.updated_count > 0
+            or job_vo.deleted_count > 0
+        )
 
         _LOGGER.debug(
             f"[_is_changed] job_id: {job_vo.job_id}, is_changed: {is_changed}"
@@ -180,7 +196,7 @@ class JobManager(BaseManager):
             "filter": [
                 {"k": "domain_id", "v": domain_id, "o": "eq"},
                 {"k": "created_at", "v": created_at, "o": "lt"},
-                {"k": "status", "v": "IN_PROGRESS", "o": "eq"},
+                {"k": "status", "v": ["PLANNING", "IN_PROGRESS"], "o": "in"},
             ]
         }
 
@@ -207,7 +223,7 @@ class JobManager(BaseManager):
             "filter": [
                 {"k": "domain_id", "v": domain_id, "o": "eq"},
                 {"k": "collector_id", "v": collector_id, "o": "eq"},
-                {"k": "status", "v": "IN_PROGRESS", "o": "eq"},
+                {"k": "status", "v": ["PLANNING", "IN_PROGRESS"], "o": "in"},
                 {
                     "k": "request_workspace_id",
                     "v": changed_request_workspace_id,
@@ -220,6 +236,18 @@ class JobManager(BaseManager):
         job_vos, total_count = self.list_jobs(query)
         return job_vos
 
+    def make_inprogress_by_vo(self, job_vo: Job, total_tasks: int) -> Union[Job, None]:
+        # only a planning job is changed, so a job canceled while planning is kept
+        return self.job_model.objects(
+            job_id=job_vo.job_id, domain_id=job_vo.domain_id, status="PLANNING"
+        ).modify(
+            new=True,
+            set__status="IN_PROGRESS",
+            set__total_tasks=total_tasks,
+            set__remained_tasks=total_tasks,
+            set__updated_at=datetime.utcnow(),
+        )
+
     def make_success_by_vo(self, job_vo: Job) -> None:
         self._update_job_status_by_vo(job_vo, "SUCCESS")
 
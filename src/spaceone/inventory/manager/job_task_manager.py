@@ -1,8 +1,11 @@
 import copy
+import functools
 import logging
 import json
-from typing import Tuple, Union
+import threading
+from typing import List, Tuple, Union
 from jsonschema import validate
+from mongoengine import Q
 from datetime import datetime
 from spaceone.core import config, queue, utils
 from spaceone.core.manager import BaseManager
@@ -10,7 +13,14 @@ from spaceone.core.scheduler.task_schema import SPACEONE_TASK_SCHEMA
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.inventory.manager.job_manager import JobManager
 from spaceone.inventory.manager.cleanup_manager import CleanupManager
-from spaceone.inventory.model.job_task_model import JobTask
+from spaceone.inventory.model.job_task_model import JobTask, Error
+from spaceone.inventory.lib.concurrency import (
+    DelayedQueue,
+    get_redis_connection,
+    put_queue_items,
+)
+from spaceone.inventory.lib.error_buffer import ErrorBuffer
+from spaceone.inventory.conf.collector_conf import DELAYED_QUEUE_NAME
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,6 +29,7 @@ class JobTaskManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.job_task_model: JobTask = self.locator.get_model("JobTask")
+        self._error_buffer_map = {}
 
     def create_job_task(self, params: dict) -> JobTask:
         def _rollback(vo: JobTask):
@@ -29,6 +40,28 @@ class JobTaskManager(BaseManager):
         self.transaction.add_rollback(_rollback, job_task_vo)
         return job_task_vo
 
+    def create_job_tasks(self, params_list: List[dict]) -> List[JobTask]:
+        def _rollback(job_task_ids: List[str]):
+            _LOGGER.info(f"[ROLLBACK] Delete job tasks: {len(job_task_ids)}")
+            self.job_task_model.filter(job_task_id=job_task_ids).delete()
+
+        now = datetime.utcnow()
+        job_task_vos = []
+
+        for params in params_list:
+            job_task_vo: JobTask = self.job_task_model(**params)
+            job_task_vo.job_task_id = utils.generate_id("job-task")
+            job_task_vo.created_at = now
+            job_task_vos.append(job_task_vo)
+
+        if len(job_task_vos) > 0:
+            job_task_vos = self.job_task_model.objects.insert(job_task_vos)
+            self.transaction.add_rollback(
+                _rollback, [job_task_vo.job_task_id for job_task_vo in job_task_vos]
+            )
+
+        return job_task_vos
+
     def get(
         self,
         job_task_id: str,
@@ -64,23 +97,199 @@ class JobTaskManager(BaseManager):
         json_task = json.dumps(task)
         queue.put(self.get_queue_name(name="collect_queue"), json_task)
 
+    def push_job_planning_task(self, params: dict) -> None:
+        task = {
+            "name": "plan_job",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "CollectorService",
+                    "metadata": {"token": self.transaction.meta.get("token")},
+                    "method": "plan_job",
+                    "params": {"params": params},
+                }
+            ],
+        }
+
+        validate(task, schema=SPACEONE_TASK_SCHEMA)
+        queue.put(self.get_queue_name(name="collect_queue"), json.dumps(task))
+
+    def push_job_tasks(self, params_list: List[dict]) -> None:
+        json_tasks = []
+
+        for params in params_list:
+            task = self.create_task_pipeline(dict(params))
+
+            # tasks differ only in params, so the schema is validated once
+            if len(json_tasks) == 0:
+                validate(task, schema=SPACEONE_TASK_SCHEMA)
+
+            json_tasks.append(json.dumps(task))
+
+        if len(json_tasks) > 0:
+            put_queue_items(self.get_queue_name(name="collect_queue"), json_tasks)
+
+    def push_delayed_job_task(self, params: dict, delay: int) -> None:
+        task = self.create_task_pipeline(copy.deepcopy(params))
+        validate(task, schema=SPACEONE_TASK_SCHEMA)
+        json_task = json.dumps(task)
+
+        if delayed_queue := self._get_delayed_queue():
+            delayed_queue.put(json_task, delay)
+        else:
+            # without redis, the task is pushed by a timer instead of blocking the worker
+            _LOGGER.warning(
+                f"[push_delayed_job_task] redis is not configured, the delayed task "
+                f"is kept in memory and lost if the worker restarts: "
+                f"{params.get('job_task_id')} ({delay}s)"
+            )
+            timer = threading.Timer(
+                delay,
+                queue.put,
+                args=(self.get_queue_name(name="collect_queue"), json_task),
+            )
+            timer.daemon = True
+            timer.start()
+
+    def push_due_job_tasks(self, limit: int = 100) -> int:
+        delayed_queue = self._get_delayed_queue()
+        if delayed_queue is None:
+            return 0
+
+        json_tasks = delayed_queue.pop_due_items(limit)
+        for json_task in json_tasks:
+            queue.put(self.get_queue_name(name="collect_queue"), json_task)
+
+        return len(json_tasks)
+
     @staticmethod
+    def _get_delayed_queue() -> Union[DelayedQueue, None]:
+        if conn := get_redis_connection():
+            return DelayedQueue(conn, DELAYED_QUEUE_NAME)
+
+        return None
+
     def add_error(
+        self,
         job_task_vo: JobTask,
         error_code: str,
         error_message: str,
         additional: dict = None,
     ) -> None:
-        error_info = {"error_code": error_code, "message": str(error_message).strip()}
+        error_message = str(error_message).strip()
+
+        if error_buffer := self._error_buffer_map.get(job_task_vo.job_task_id):
+            error_buffer.add(error_code, error_message, additional)
+            return
+
+        error_info = {"error_code": error_code, "message": error_message}
 
         if additional:
             error_info["additional"] = additional
 
         job_task_vo.append("errors", error_info)
-        _LOGGER.error(
-            f"[add_error] {job_task_vo.job_task_id}: {error_info}", exc_info=True
+        _LOGGER.error(f"[add_error] {job_task_vo.job_task_id}: {error_info}")
+
+    def create_error_buffer(self, job_task_vo: JobTask) -> None:
+        self._error_buffer_map[job_task_vo.job_task_id] = ErrorBuffer(
+            functools.partial(self._save_errors, job_task_vo),
+            config.get_global("JOB_TASK_ERROR_LIMIT", 100),
+            config.get_global("JOB_TASK_ERROR_SAMPLE_SIZE", 5),
+            config.get_global("JOB_TASK_ERROR_FLUSH_INTERVAL", 10),
+            self._get_saved_error_count(job_task_vo),
         )
 
+    @staticmethod
+    def _get_saved_error_count(job_task_vo: JobTask) -> int:
+        return sum(
+            (error.additional or {}).get("error_count", 1)
+            for error in job_task_vo.errors or []
+        )
+
+    def flush_error_buffer_if_due(self, job_task_vo: JobTask) -> None:
+        if error_buffer := self._error_buffer_map.get(job_task_vo.job_task_id):
+            try:
+                error_buffer.flush_if_due()
+            except Exception as e:
+                _LOGGER.error(
+                    f"[flush_error_buffer_if_due] failed to save errors ({job_task_vo.job_task_id}): {e}",
+                    exc_info=True,
+                )
+
+    def flush_error_buffer(self, job_task_vo: JobTask) -> None:
+        error_buffer = self._error_buffer_map.pop(job_task_vo.job_task_id, None)
+
+        if error_buffer:
+            try:
+                error_buffer.flush()
+            except Exception as e:
+                _LOGGER.error(
+                    f"[flush_error_buffer] failed to save errors ({job_task_vo.job_task_id}): {e}",
+                    exc_info=True,
+                )
+
+    def _save_errors(
+        self, job_task_vo: JobTask, errors: list, overflow_count: int
+    ) -> None:
+        update_data = {}
+
+        if len(errors) > 0:
+            update_data["push_all__errors"] = [
+                Error(**error_info) for error_info in errors
+            ]
+
+        if overflow_count > 0:
+            update_data["inc__error_overflow_count"] = overflow_count
+
+        self.job_task_model.objects(pk=job_task_vo.pk).update(**update_data)
+
+        for error_info in errors:
+            error_count = error_info.get("additional", {}).get("error_count", 1)
+            _LOGGER.error(
+                f"[_save_errors] {job_task_vo.job_task_id}: {error_info['error_code']} "
+                f"(count: {error_count}) {error_info['message']}"
+            )
+
+        if overflow_count > 0:
+            _LOGGER.error(
+                f"[_save_errors] {job_task_vo.job_task_id}: error limit exceeded "
+                f"(overflow count: {overflow_count})"
+            )
+
+    def increase_phase_timings(self, job_task_vo: JobTask, phase_timings: dict) -> None:
+        """Accumulate wall time (seconds) and call count per phase of the job task
+        The timings are not returned by the JobTask API (job_task_info), operators read them
+        from the 'phase_timings' field of the job_task collection in the database,
+        or per sub task from the 'job task summary' debug log of the collecting manager.
+
+        Args:
+            phase_timings (dict): {
+                'plugin_wait': {'time': 'float', 'count': 'int'},
+                'match_index': {'time': 'float', 'count': 'int'},
+                'match': {'time': 'float', 'count': 'int'},
+                'rule_apply': {'time': 'float', 'count': 'int'},    # includes identity_lookup
+                'identity_lookup': {'time': 'float', 'count': 'int'},
+                'write': {'time': 'float', 'count': 'int'},
+                'history': {'time': 'float', 'count': 'int'},
+                'state': {'time': 'float', 'count': 'int'}
+            }
+        """
+
+        inc_data = {}
+        for phase, timing in phase_timings.items():
+            inc_data[f"inc__phase_timings__{phase}__time"] = timing["time"]
+            inc_data[f"inc__phase_timings__{phase}__count"] = timing["count"]
+
+        if len(inc_data) > 0:
+            try:
+                self.job_task_model.objects(pk=job_task_vo.pk).update(**inc_data)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[increase_phase_timings] failed to save phase timings ({job_task_vo.job_task_id}): {e}"
+                )
+
     @staticmethod
     def _update_job_status_by_vo(
         job_task_vo: JobTask,
@@ -113,6 +322,53 @@ class JobTaskManager(BaseManager):
                 started_at=datetime.utcnow(),
             )
 
+    def make_inprogress_in_concurrency(
+        self, job_task_vo: JobTask, max_concurrency: int
+    ) -> bool:
+        """Make a job task in progress if less than max_concurrency job tasks of the job
+        were started before it. The job task is marked first and checked after,
+        so that job tasks started at the same time see each other and only the later ones
+        are turned back to PENDING.
+
+        Returns:
+            is_admitted (bool): False if the job task should be delayed
+        """
+
+        job_task_vo.reload()
+        is_started = False
+
+        if job_task_vo.status == "PENDING":
+            started_job_task_vo = self.job_task_model.objects(
+                pk=job_task_vo.pk, status="PENDING"
+            ).modify(set__status="IN_PROGRESS", set__started_at=datetime.utcnow())
+            is_started = started_job_task_vo is not None
+            job_task_vo.reload()
+
+        # canceled or finished job tasks are handled by the collecting
+        if job_task_vo.status != "IN_PROGRESS":
+            return True
+
+        earlier_count = self.job_task_model.objects(
+            Q(started_at__lt=job_task_vo.started_at)
+            | Q(
+                started_at=job_task_vo.started_at,
+                job_task_id__lt=job_task_vo.job_task_id,
+            ),
+            job_id=job_task_vo.job_id,
+            domain_id=job_task_vo.domain_id,
+            status="IN_PROGRESS",
+        ).count()
+
+        if earlier_count < max_concurrency:
+            return True
+
+        if is_started:
+            self.job_task_model.objects(
+                pk=job_task_vo.pk, status="IN_PROGRESS"
+            ).modify(set__status="PENDING", set__started_at=None)
+
+        return False
+
     def make_success_by_vo(
         self,
         job_task_vo: JobTask,
@@ -139,39 +395,73 @@ class JobTaskManager(BaseManager):
     def decrease_remained_sub_tasks(
         self, job_task_vo: JobTask, collecting_count_info: dict = None
     ) -> JobTask:
-        if collecting_count_info:
-            self._update_collecting_count_info(job_task_vo, collecting_count_info)
+        job_task_vo = self._increase_counters(
+            job_task_vo, collecting_count_info, remained_sub_tasks=-1
+        )
 
-        job_task_vo: JobTask = job_task_vo.decrement("remained_sub_tasks")
         if job_task_vo.remained_sub_tasks == 0:
             job_mgr: JobManager = self.locator.get_manager(JobManager)
             if job_task_vo.status == "IN_PROGRESS":
                 deleted_resources_info = self._update_disconnected_and_deleted_count(
                     job_task_vo
                 )
-                self._update_collecting_count_info(job_task_vo, deleted_resources_info)
+                job_task_vo = self._increase_counters(
+                    job_task_vo, deleted_resources_info
+                )
 
                 self.make_success_by_vo(job_task_vo)
                 job_mgr.increase_success_tasks(
-                    job_task_vo.job_id, job_task_vo.domain_id
+                    job_task_vo.job_id,
+                    job_task_vo.domain_id,
+                    self._get_changed_count_info(job_task_vo),
                 )
             else:
                 job_mgr.increase_failure_tasks(
-                    job_task_vo.job_id, job_task_vo.domain_id
+                    job_task_vo.job_id,
+                    job_task_vo.domain_id,
+                    self._get_changed_count_info(job_task_vo),
                 )
 
         return job_task_vo
 
-    @staticmethod
-    def _update_collecting_count_info(
-        job_task_vo: JobTask, collecting_count_info: dict
-    ) -> None:
+    def _increase_counters(
+        self,
+        job_task_vo: JobTask,
+        collecting_count_info: dict = None,
+        remained_sub_tasks: int = 0,
+    ) -> JobTask:
+        """
+        increase collecting counts and remained_sub_tasks in one atomic update
+        :return: job task with the updated counters
+        """
+        inc_params = {}
+
+        if remained_sub_tasks != 0:
+            inc_params["inc__remained_sub_tasks"] = remained_sub_tasks
+
+        for key, value in (collecting_count_info or {}).items():
+            if isinstance(value, int) and value > 0:
+                inc_params[f"inc__{key}"] = value
+
+        if len(inc_params) == 0:
+            return job_task_vo
+
         _LOGGER.debug(
-            f"[_update_collecting_count_info] update collecting count => {utils.dump_json(collecting_count_info)}"
+            f"[_increase_counters] update counters ({job_task_vo.job_task_id}) => "
+            f"{utils.dump_json(inc_params)}"
         )
-        for key, value in collecting_count_info.items():
-            if isinstance(value, int) and value > 0:
-                job_task_vo.increment(key, value)
+
+        return self.job_task_model.objects(pk=job_task_vo.pk).modify(
+            new=True, **inc_params
+        )
+
+    @staticmethod
+    def _get_changed_count_info(job_task_vo: JobTask) -> dict:
+        return {
+            "created_count": job_task_vo.created_count,
+            "updated_count": job_task_vo.updated_count,
+            "deleted_count": job_task_vo.deleted_count,
+        }
 
     def _update_disconnected_and_deleted_count(self, job_task_vo: JobTask) -> dict:
         try:
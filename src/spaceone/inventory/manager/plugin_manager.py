@@ -1,7 +1,7 @@
 import logging
 from typing import Tuple
 
-from spaceone.core import config
+from spaceone.core import cache, config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 
@@ -23,7 +23,16 @@ class PluginManager(BaseManager):
         domain_id: str,
         upgrade_mode: str = "AUTO",
         version: str = None,
+        use_cache: bool = False,
     ) -> Tuple[str, str]:
+        cache_key = self._make_endpoint_cache_key(
+            plugin_id, domain_id, upgrade_mode, version
+        )
+
+        if use_cache:
+            if endpoint_info := self._get_endpoint_cache(cache_key):
+                return endpoint_info["endpoint"], endpoint_info.get("updated_version")
+
         system_token = config.get_global("TOKEN")
 
         response = self.plugin_connector.dispatch(
@@ -37,4 +46,56 @@ class PluginManager(BaseManager):
             token=system_token,
         )
 
-        return response.get("endpoint"), response.get("updated_version")
+        endpoint = response.get("endpoint")
+        updated_version = response.get("updated_version")
+
+        if updated_version and updated_version != version:
+            # the plugin is upgraded, so the endpoints of other versions are stale
+            self.delete_endpoint_cache(plugin_id, domain_id)
+        elif endpoint:
+            self._set_endpoint_cache(
+                cache_key, {"endpoint": endpoint, "updated_version": updated_version}
+            )
+
+        return endpoint, updated_version
+
+    @staticmethod
+    def delete_endpoint_cache(plugin_id: str, domain_id: str) -> None:
+        if not cache.is_set():
+            return
+
+        try:
+            cache.delete_pattern(f"inventory:plugin-endpoint:{domain_id}:{plugin_id}:*")
+        except Exception as e:
+            _LOGGER.warning(f"[delete_endpoint_cache] failed to delete cache: {e}")
+
+    @staticmethod
+    def _get_endpoint_cache(cache_key: str) -> dict:
+        if not cache.is_set():
+            return {}
+
+        try:
+            return cache.get(cache_key) or {}
+        except Exception as e:
+            _LOGGER.warning(f"[_get_endpoint_cache] failed to get cache: {e}")
+            return {}
+
+    @staticmethod
+    def _set_endpoint_cache(cache_key: str, endpoint_info: dict) -> None:
+        expire = config.get_global("PLUGIN_ENDPOINT_CACHE_TTL", 60)
+
+        if not (cache.is_set() and expire > 0):
+            return
+
+        try:
+            cache.set(cache_key, endpoint_info, expire=expire)
+        except Exception as e:
+            _LOGGER.warning(f"[_set_endpoint_cache] failed to set cache: {e}")
+
+    @staticmethod
+    def _make_endpoint_cache_key(
+        plugin_id: str, domain_id: str, upgrade_mode: str, version: str
+    ) -> str:
+        return (
+            f"inventory:plugin-endpoint:{domain_id}:{plugin_id}:{version}:{upgrade_mode}"
+        )
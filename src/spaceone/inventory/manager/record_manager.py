@@ -1,9 +1,12 @@
 import logging
-from typing import Tuple
+from datetime import datetime
+from typing import Tuple, List
 
+from spaceone.core import utils
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.model.record_model import Record
+from spaceone.inventory.lib.rollback import add_rollback
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,10 +24,24 @@ class RecordManager(BaseManager):
             vo.delete()
 
         record_vo: Record = self.record_model.create(params)
-        self.transaction.add_rollback(_rollback, record_vo)
+
+        add_rollback(self.transaction, _rollback, record_vo)
 
         return record_vo
 
+    def create_records(self, params_list: List[dict]) -> None:
+        now = datetime.utcnow()
+        record_vos = []
+
+        for params in params_list:
+            record_vo: Record = self.record_model(**params)
+            record_vo.record_id = utils.generate_id("record")
+            record_vo.created_at = now
+            record_vos.append(record_vo)
+
+        if len(record_vos) > 0:
+            self.record_model.objects.insert(record_vos, load_bulk=False)
+
     def get_record(self, record_id: str, domain_id: str) -> Record:
         return self.record_model.get(record_id=record_id, domain_id=domain_id)
 
@@ -4,6 +4,7 @@ from typing import Tuple
 from spaceone.core.model.mongo_model import QuerySet
 from spaceone.core.manager import BaseManager
 from spaceone.inventory.lib.resource_manager import ResourceManager
+from spaceone.inventory.lib.rollback import add_rollback
 from spaceone.inventory.model.region_model import Region
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,7 +24,8 @@ class RegionManager(BaseManager, ResourceManager):
             vo.delete()
 
         region_vo: Region = self.region_model.create(params)
-        self.transaction.add_rollback(_rollback, region_vo)
+
+        add_rollback(self.transaction, _rollback, region_vo)
 
         return region_vo
 
@@ -34,7 +36,8 @@ class RegionManager(BaseManager, ResourceManager):
             )
             region_vo.update(old_data)
 
-        self.transaction.add_rollback(_rollback, region_vo.to_dict())
+        add_rollback(self.transaction, _rollback, snapshot_vo=region_vo)
+
         return region_vo.update(params)
 
     @staticmethod
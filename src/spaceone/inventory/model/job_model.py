@@ -9,12 +9,15 @@ class Job(MongoModel):
     status = StringField(
         max_length=20,
         default="IN_PROGRESS",
-        choices=("CANCELED", "IN_PROGRESS", "FAILURE", "SUCCESS"),
+        choices=("PLANNING", "CANCELED", "IN_PROGRESS", "FAILURE", "SUCCESS"),
     )
     total_tasks = IntField(min_value=0, default=0)
     remained_tasks = IntField(default=0)
     success_tasks = IntField(min_value=0, default=0)
     failure_tasks = IntField(min_value=0, default=0)
+    created_count = IntField(default=0)
+    updated_count = IntField(default=0)
+    deleted_count = IntField(default=0)
     collector_id = StringField(max_length=40)
     request_secret_id = StringField(max_length=40, null=True, default=None)
     request_workspace_id = StringField(max_length=40, null=True, default=None)
@@ -33,6 +36,9 @@ class Job(MongoModel):
             "remained_tasks",
             "success_tasks",
             "failure_tasks",
+            "created_count",
+            "updated_count",
+            "deleted_count",
             "collector_id",
             "updated_at",
             "finished_at",
@@ -20,9 +20,12 @@ class JobTask(MongoModel):
     remained_sub_tasks = IntField(default=0)
     created_count = IntField(default=0)
     updated_count = IntField(default=0)
+    unchanged_count = IntField(default=0)
     deleted_count = IntField(default=0)
     disconnected_count = IntField(default=0)
     failure_count = IntField(default=0)
+    error_overflow_count = IntField(default=0)
+    phase_timings = DictField(default=None)
     total_count = IntField(default=0)
     errors = ListField(EmbeddedDocumentField(Error, default=None, null=True))
     job_id = StringField(max_length=40)
@@ -43,10 +46,13 @@ class JobTask(MongoModel):
             "remained_sub_tasks",
             "created_count",
             "updated_count",
+            "unchanged_count",
             "deleted_count",
             "disconnected_count",
             "failure_count",
             "errors",
+            "error_overflow_count",
+            "phase_timings",
             "started_at",
             "finished_at",
         ],
@@ -1,4 +1,5 @@
 import logging
+import time
 from datetime import datetime, timedelta
 from spaceone.core.service import *
 from spaceone.core import config
@@ -181,19 +182,29 @@ class CleanupService(BaseService):
                 f"[terminate_resources] Terminate cloud services: {str(total_count)}"
             )
 
-        for cloud_svc_vo in cloud_svc_vos:
-            cloud_service_id = cloud_svc_vo.cloud_service_id
+        chunk_size = config.get_global("RESOURCE_TERMINATION_CHUNK_SIZE", 1000)
+        chunk_interval = config.get_global("RESOURCE_TERMINATION_CHUNK_INTERVAL", 1)
+        cloud_service_ids = [
+            cloud_svc_vo.cloud_service_id for cloud_svc_vo in cloud_svc_vos
+        ]
+
+        for index in range(0, len(cloud_service_ids), chunk_size):
+            if index > 0 and chunk_interval > 0:
+                # give replicas time to catch up between chunks
+                time.sleep(chunk_interval)
+
+            chunk_ids = cloud_service_ids[index : index + chunk_size]
 
             # Cascade Delete Records
             record_vos = record_mgr.filter_records(
-                cloud_service_id=cloud_service_id, domain_id=domain_id
+                cloud_service_id=chunk_ids, domain_id=domain_id
             )
             record_vos.delete()
 
             # Cascade Delete Notes
             note_vos = note_mgr.filter_notes(
-                cloud_service_id=cloud_service_id, domain_id=domain_id
+                cloud_service_id=chunk_ids, domain_id=domain_id
             )
             note_vos.delete()
 
-            cloud_svc_mgr.terminate_cloud_service(cloud_service_id, domain_id)
+            cloud_svc_mgr.terminate_cloud_services_by_ids(chunk_ids, domain_id)
@@ -15,6 +15,8 @@ from spaceone.inventory.manager.collection_state_manager import CollectionStateM
 from spaceone.inventory.manager.note_manager import NoteManager
 from spaceone.inventory.manager.collector_rule_manager import CollectorRuleManager
 from spaceone.inventory.manager.export_manager import ExportManager
+from spaceone.inventory.lib.record_buffer import RecordBuffer
+from spaceone.inventory.lib.phase_timer import measure_phase
 from spaceone.inventory.error import *
 
 _KEYWORD_FILTER = [
@@ -88,6 +90,66 @@ class CloudServiceService(BaseService):
 
         return self.create_resource(params)
 
+    def create_resource(self, params: dict) -> CloudService:
+        params = self._make_create_params(params)
+
+        with measure_phase(self.transaction, "write"):
+            cloud_svc_vo = self.cloud_svc_mgr.create_cloud_service(params)
+
+        self._complete_create_resource(cloud_svc_vo, params)
+
+        return cloud_svc_vo
+
+    def create_resources(
+        self, params_list: List[dict], record_buffer: RecordBuffer = None
+    ) -> List[Union[CloudService, Exception]]:
+        """Create cloud services collected in a batch with a single bulk write
+        Collection states are not changed, the caller reconciles them at the end of the job task.
+
+        Args:
+            params_list (list): list of create params
+            record_buffer (RecordBuffer): buffer of change history records flushed by the caller
+
+        Returns:
+            results (list): created cloud_service_vo or exception for each params
+        """
+
+        results = [None] * len(params_list)
+        create_indexes = []
+        create_params_list = []
+
+        for index, params in enumerate(params_list):
+            try:
+                create_params_list.append(self._make_create_params(params))
+                create_indexes.append(index)
+            except Exception as e:
+                results[index] = e
+
+        with measure_phase(self.transaction, "write"):
+            cloud_svc_vos = self.cloud_svc_mgr.create_cloud_services(
+                create_params_list
+            )
+
+        for index, params, cloud_svc_vo in zip(
+            create_indexes, create_params_list, cloud_svc_vos
+        ):
+            if isinstance(cloud_svc_vo, Exception):
+                results[index] = cloud_svc_vo
+                continue
+
+            try:
+                self._complete_create_resource(
+                    cloud_svc_vo,
+                    params,
+                    update_collection_state=False,
+                    record_buffer=record_buffer,
+                )
+                results[index] = cloud_svc_vo
+            except Exception as e:
+                results[index] = e
+
+        return results
+
     @check_required(
         [
             "cloud_service_type",
@@ -97,9 +159,7 @@ class CloudServiceService(BaseService):
             "domain_id",
         ]
     )
-    def create_resource(self, params: dict) -> CloudService:
-        ch_mgr: ChangeHistoryManager = self.locator.get_manager("ChangeHistoryManager")
-
+    def _make_create_params(self, params: dict) -> dict:
         if json_data := params.get("json_data"):
             params["data"] = utils.load_json(json_data)
             if not isinstance(params["data"], dict):
@@ -129,14 +189,12 @@ class CloudServiceService(BaseService):
             if not isinstance(instance_size, float):
                 raise ERROR_INVALID_PARAMETER_TYPE(key="instance_size", type="float")
 
-        if "tags" in params:
-            params["tags"] = self._convert_tags_to_dict(params["tags"])
-
         # Change data through Collector Rule
-        if self._is_created_by_collector():
-            params = self.collector_rule_mgr.change_cloud_service_data(
-                self.collector_id, domain_id, params
-            )
+        if self._is_created_by_collector() and "fingerprint" not in params:
+            params = self._apply_collector_rules(params)
+            params["fingerprint"] = self._make_fingerprint(params)
+        elif "tags" in params:
+            params["tags"] = self._convert_tags_to_dict(params["tags"])
 
         if "tags" in params:
             params["tags"], params["tag_keys"] = self._convert_tags_to_hash(
@@ -144,7 +202,8 @@ class CloudServiceService(BaseService):
             )
 
         if "project_id" in params:
-            self.identity_mgr.get_project(params["project_id"], domain_id)
+            with measure_phase(self.transaction, "identity_lookup"):
+                self.identity_mgr.get_project(params["project_id"], domain_id)
         elif secret_project_id:
             params["project_id"] = secret_project_id
 
@@ -160,15 +219,29 @@ class CloudServiceService(BaseService):
 
         params["collection_info"] = self._get_collection_info()
 
-        cloud_svc_vo = self.cloud_svc_mgr.create_cloud_service(params)
+        return params
+
+    def _complete_create_resource(
+        self,
+        cloud_svc_vo: CloudService,
+        params: dict,
+        update_collection_state: bool = True,
+        record_buffer: RecordBuffer = None,
+    ) -> None:
+        ch_mgr: ChangeHistoryManager = self.locator.get_manager(
+            "ChangeHistoryManager", record_buffer=record_buffer
+        )
 
         # Create New History
-        ch_mgr.add_new_history(cloud_svc_vo, params)
+        with measure_phase(self.transaction, "history"):
+            ch_mgr.add_new_history(cloud_svc_vo, params)
 
         # Create Collection State
-        self.state_mgr.create_collection_state(cloud_svc_vo.cloud_service_id, domain_id)
-
-        return cloud_svc_vo
+        if update_collection_state:
+            with measure_phase(self.transaction, "state"):
+                self.state_mgr.create_collection_state(
+                    cloud_svc_vo.cloud_service_id, cloud_svc_vo.domain_id
+                )
 
     @transaction(
         permission="inventory:CloudService.write",
@@ -204,8 +277,157 @@ class CloudServiceService(BaseService):
 
     @check_required(["cloud_service_id", "workspace_id", "domain_id"])
     def update_resource(self, params: dict) -> CloudService:
-        ch_mgr: ChangeHistoryManager = self.locator.get_manager("ChangeHistoryManager")
+        cloud_svc_vo: CloudService = self.cloud_svc_mgr.get_cloud_service(
+            params["cloud_service_id"],
+            params["domain_id"],
+            params["workspace_id"],
+            params.get("user_projects"),
+        )
+
+        params, old_cloud_svc_data = self._make_update_params(params, cloud_svc_vo)
+
+        with measure_phase(self.transaction, "write"):
+            cloud_svc_vo = self.cloud_svc_mgr.update_cloud_service_by_vo(
+                params, cloud_svc_vo
+            )
+
+        self._complete_update_resource(cloud_svc_vo, params, old_cloud_svc_data)
+
+        return cloud_svc_vo
+
+    def update_resources(
+        self, params_list: List[dict], record_buffer: RecordBuffer = None
+    ) -> List[Union[CloudService, Exception]]:
+        """Update cloud services collected in a batch with a single bulk write
+        Collection states are not changed, the caller reconciles them at the end of the job task.
+
+        Args:
+            params_list (list): list of update params with the same workspace_id and domain_id
+            record_buffer (RecordBuffer): buffer of change history records flushed by the caller
+
+        Returns:
+            results (list): cloud_service_vo or exception for each params
+        """
+
+        results = [None] * len(params_list)
+        update_indexes = []
+        update_params_list = []
+
+        if len(params_list) == 0:
+            return results
+
+        cloud_service_ids = [params["cloud_service_id"] for params in params_list]
+        cloud_svc_vos = self.cloud_svc_mgr.filter_cloud_services(
+            cloud_service_id=cloud_service_ids,
+            domain_id=params_list[0]["domain_id"],
+            workspace_id=params_list[0]["workspace_id"],
+        )
+        cloud_svc_vo_map = {vo.cloud_service_id: vo for vo in cloud_svc_vos}
+
+        for index, params in enumerate(params_list):
+            try:
+                cloud_svc_vo = cloud_svc_vo_map.get(params["cloud_service_id"])
+
+                if cloud_svc_vo is None:
+                    raise ERROR_NOT_FOUND(
+                        key="cloud_service_id", value=params["cloud_service_id"]
+                    )
 
+                update_params_list.append(
+                    self._make_update_params(params, cloud_svc_vo) + (cloud_svc_vo,)
+                )
+                update_indexes.append(index)
+            except Exception as e:
+                results[index] = e
+
+        with measure_phase(self.transaction, "write"):
+            cloud_svc_vos = self.cloud_svc_mgr.update_cloud_services_by_vos(
+                [(params, vo) for params, old_data, vo in update_params_list]
+            )
+
+        for index, (params, old_cloud_svc_data, _), cloud_svc_vo in zip(
+            update_indexes, update_params_list, cloud_svc_vos
+        ):
+            if isinstance(cloud_svc_vo, Exception):
+                results[index] = cloud_svc_vo
+                continue
+
+            try:
+                self._complete_update_resource(
+                    cloud_svc_vo,
+                    params,
+                    old_cloud_svc_data,
+                    update_collection_state=False,
+                    record_buffer=record_buffer,
+                )
+                results[index] = cloud_svc_vo
+            except Exception as e:
+                results[index] = e
+
+        return results
+
+    def touch_unchanged_resources(self, params_list: List[dict]) -> List[bool]:
+        """Touch cloud services whose collected data is the same as the last collection
+        Collection states are not changed, the caller reconciles them at the end of the job task.
+
+        Args:
+            params_list (list): list of update params with the same workspace_id and domain_id
+
+        Returns:
+            unchanged_flags (list): True if the cloud service of params is unchanged
+        """
+
+        unchanged_flags = [False] * len(params_list)
+
+        if len(params_list) == 0 or not self._is_created_by_collector():
+            return unchanged_flags
+
+        domain_id = params_list[0]["domain_id"]
+        workspace_id = params_list[0]["workspace_id"]
+
+        # collector rules are applied once, the update of changed params reuses them
+        for index, params in enumerate(params_list):
+            try:
+                params = self._apply_collector_rules(params)
+            except Exception as e:
+                _LOGGER.debug(
+                    f"[touch_unchanged_resources] failed to apply collector rules: {e}"
+                )
+                continue
+
+            params["fingerprint"] = self._make_fingerprint(params)
+            params_list[index] = params
+
+        cloud_svc_vos = self.cloud_svc_mgr.filter_cloud_services(
+            cloud_service_id=[params["cloud_service_id"] for params in params_list],
+            domain_id=domain_id,
+            workspace_id=workspace_id,
+            state__ne="DELETED",
+        ).only("cloud_service_id", "fingerprint")
+        fingerprint_map = {
+            vo.cloud_service_id: vo.fingerprint for vo in cloud_svc_vos
+        }
+
+        unchanged_ids = []
+        for index, params in enumerate(params_list):
+            cloud_service_id = params["cloud_service_id"]
+            fingerprint = params.get("fingerprint")
+
+            if fingerprint and fingerprint_map.get(cloud_service_id) == fingerprint:
+                unchanged_flags[index] = True
+                unchanged_ids.append(cloud_service_id)
+
+        if len(unchanged_ids) > 0:
+            with measure_phase(self.transaction, "write"):
+                self.cloud_svc_mgr.touch_cloud_services(
+                    unchanged_ids, domain_id, workspace_id
+                )
+
+        return unchanged_flags
+
+    def _make_update_params(
+        self, params: dict, cloud_svc_vo: CloudService
+    ) -> Tuple[dict, dict]:
         if json_data := params.get("json_data"):
             params["data"] = utils.load_json(json_data)
             if not isinstance(params["data"], dict):
@@ -226,9 +448,6 @@ class CloudServiceService(BaseService):
 
         secret_project_id = self.transaction.get_meta("secret.project_id")
 
-        cloud_service_id = params["cloud_service_id"]
-        workspace_id = params["workspace_id"]
-        user_projects = params.get("user_projects")
         domain_id = params["domain_id"]
         provider = self._get_provider_from_meta()
 
@@ -239,21 +458,19 @@ class CloudServiceService(BaseService):
             if not isinstance(instance_size, float):
                 raise ERROR_INVALID_PARAMETER_TYPE(key="instance_size", type="float")
 
-        if "tags" in params:
-            params["tags"] = self._convert_tags_to_dict(params["tags"])
-
         # Change data through Collector Rule
-        if self._is_created_by_collector():
-            params = self.collector_rule_mgr.change_cloud_service_data(
-                self.collector_id, domain_id, params
-            )
+        if not self._is_created_by_collector():
+            params["fingerprint"] = None
+        elif "fingerprint" not in params:
+            params = self._apply_collector_rules(params)
+            params["fingerprint"] = self._make_fingerprint(params)
 
-        cloud_svc_vo: CloudService = self.cloud_svc_mgr.get_cloud_service(
-            cloud_service_id, domain_id, workspace_id, user_projects
-        )
+        if "tags" in params:
+            params["tags"] = self._convert_tags_to_dict(params["tags"])
 
         if "project_id" in params:
-            self.identity_mgr.get_project(params["project_id"], domain_id)
+            with measure_phase(self.transaction, "identity_lookup"):
+                self.identity_mgr.get_project(params["project_id"], domain_id)
         elif secret_project_id and secret_project_id != cloud_svc_vo.project_id:
             params["project_id"] = secret_project_id
 
@@ -296,19 +513,38 @@ class CloudServiceService(BaseService):
 
         params = self.cloud_svc_mgr.merge_data(params, old_cloud_svc_data)
 
-        cloud_svc_vo = self.cloud_svc_mgr.update_cloud_service_by_vo(
-            params, cloud_svc_vo
+        return params, old_cloud_svc_data
+
+    def _complete_update_resource(
+        self,
+        cloud_svc_vo: CloudService,
+        params: dict,
+        old_cloud_svc_data: dict,
+        update_collection_state: bool = True,
+        record_buffer: RecordBuffer = None,
+    ) -> None:
+        ch_mgr: ChangeHistoryManager = self.locator.get_manager(
+            "ChangeHistoryManager", record_buffer=record_buffer
         )
 
+        cloud_service_id = cloud_svc_vo.cloud_service_id
+        workspace_id = old_cloud_svc_data["workspace_id"]
+        domain_id = old_cloud_svc_data["domain_id"]
+
         # Create Update History
-        ch_mgr.add_update_history(cloud_svc_vo, params, old_cloud_svc_data)
+        with measure_phase(self.transaction, "history"):
+            ch_mgr.add_update_history(cloud_svc_vo, params, old_cloud_svc_data)
 
         # Update Collection History
-        state_vo = self.state_mgr.get_collection_state(cloud_service_id, domain_id)
-        if state_vo:
-            self.state_mgr.reset_collection_state(state_vo)
-        else:
-            self.state_mgr.create_collection_state(cloud_service_id, domain_id)
+        if update_collection_state:
+            with measure_phase(self.transaction, "state"):
+                state_vo = self.state_mgr.get_collection_state(
+                    cloud_service_id, domain_id
+                )
+                if state_vo:
+                    self.state_mgr.reset_collection_state(state_vo)
+                else:
+                    self.state_mgr.create_collection_state(cloud_service_id, domain_id)
 
         if "project_id" in params:
             note_mgr: NoteManager = self.locator.get_manager("NoteManager")
@@ -321,8 +557,6 @@ class CloudServiceService(BaseService):
                 {"project_id": params["project_id"], "workspace_id": workspace_id}
             )
 
-        return cloud_svc_vo
-
     @transaction(
         permission="inventory:CloudService.write",
         role_types=["WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
@@ -588,6 +822,49 @@ class CloudServiceService(BaseService):
     def _convert_metadata(metadata: dict, provider: str) -> dict:
         return {provider: copy.deepcopy(metadata)}
 
+    def _apply_collector_rules(self, params: dict) -> dict:
+        if "tags" in params:
+            params["tags"] = self._convert_tags_to_dict(params["tags"])
+
+        with measure_phase(self.transaction, "rule_apply"):
+            return self.collector_rule_mgr.change_cloud_service_data(
+                self.collector_id, params["domain_id"], params
+            )
+
+    def _make_fingerprint(self, params: dict) -> Union[str, None]:
+        """make a fingerprint of the params resolved by collector rules
+        so that the fingerprint changes when they resolve to other identities.
+        """
+        resource_data = {
+            key: value
+            for key, value in params.items()
+            if key
+            not in [
+                "cloud_service_id",
+                "fingerprint",
+                "domain_id",
+                "user_projects",
+            ]
+        }
+
+        try:
+            return utils.dict_to_hash(
+                {
+                    "resource": resource_data,
+                    "collector_id": self.collector_id,
+                    "secret_id": self.transaction.get_meta("secret.secret_id"),
+                    "service_account_id": self.service_account_id,
+                    "project_id": self.transaction.get_meta("secret.project_id"),
+                    "provider": self.transaction.get_meta("secret.provider"),
+                    "collector_rule_hash": self.collector_rule_mgr.get_collector_rule_hash(
+                        self.collector_id, params["domain_id"]
+                    ),
+                }
+            )
+        except Exception as e:
+            _LOGGER.debug(f"[_make_fingerprint] failed to make fingerprint: {e}")
+            return None
+
     def _get_collection_info(self) -> dict:
         collector_id = self.transaction.get_meta("collector_id")
         secret_id = self.transaction.get_meta("secret.secret_id")
@@ -1,8 +1,11 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Tuple
 from spaceone.core.service import *
 from spaceone.core.model.mongo_model import QuerySet
-from spaceone.core import utils
+from spaceone.core import config, utils
+from spaceone.core.transaction import create_transaction, delete_transaction
 from spaceone.inventory.error import *
 from spaceone.inventory.manager.collection_state_manager import CollectionStateManager
 from spaceone.inventory.manager.collector_manager import CollectorManager
@@ -453,7 +456,6 @@ class CollectorService(BaseService):
             job_vo (object)
         """
 
-        plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
         job_mgr: JobManager = self.locator.get_manager(JobManager)
         job_task_mgr: JobTaskManager = self.locator.get_manager(JobTaskManager)
 
@@ -464,6 +466,79 @@ class CollectorService(BaseService):
         collector_vo = self.collector_mgr.get_collector(
             collector_id, domain_id, workspace_id
         )
+
+        duplicated_job_vos = job_mgr.get_duplicate_jobs(
+            collector_id, domain_id, workspace_id, params.get("secret_id")
+        )
+
+        for job_vo in duplicated_job_vos:
+            job_mgr.make_canceled_by_vo(job_vo)
+
+        # create job, tasks are planned by a worker
+        params["plugin_id"] = collector_vo.plugin_info.plugin_id
+        params["status"] = "PLANNING"
+        job_vo = job_mgr.create_job(collector_vo, params)
+
+        job_task_mgr.push_job_planning_task(
+            {
+                "job_id": job_vo.job_id,
+                "collector_id": collector_id,
+                "secret_id": params.get("secret_id"),
+                "domain_id": domain_id,
+            }
+        )
+
+        _LOGGER.debug(f"[collect] push job planning task ({job_vo.job_id})")
+
+        return job_vo
+
+    @transaction(
+        permission="inventory:Collector.write",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+    )
+    @check_required(["job_id", "collector_id", "domain_id"])
+    def plan_job(self, params: dict) -> None:
+        """Plan tasks of a collecting job and push them to the queue
+        Args:
+            params (dict): {
+                'job_id': 'str',            # required
+                'collector_id': 'str',      # required
+                'secret_id': 'str',
+                'domain_id': 'str',         # required
+            }
+
+        Returns:
+            None
+        """
+
+        job_mgr: JobManager = self.locator.get_manager(JobManager)
+
+        job_id = params["job_id"]
+        domain_id = params["domain_id"]
+
+        job_vo = job_mgr.get_job(job_id, domain_id)
+
+        if job_vo.status != "PLANNING":
+            _LOGGER.debug(f"[plan_job] skip job ({job_id}): {job_vo.status}")
+            return None
+
+        try:
+            self._plan_job(params, job_vo)
+        except Exception as e:
+            _LOGGER.error(
+                f"[plan_job] failed to plan job ({job_id}): {e}", exc_info=True
+            )
+            job_mgr.make_failure_by_vo(job_vo)
+
+    def _plan_job(self, params: dict, job_vo: Job) -> None:
+        plugin_mgr: PluginManager = self.locator.get_manager(PluginManager)
+        job_mgr: JobManager = self.locator.get_manager(JobManager)
+        job_task_mgr: JobTaskManager = self.locator.get_manager(JobTaskManager)
+
+        collector_id = params["collector_id"]
+        domain_id = params["domain_id"]
+
+        collector_vo = self.collector_mgr.get_collector(collector_id, domain_id)
         collector_data = collector_vo.to_dict()
 
         plugin_info = collector_data["plugin_info"]
@@ -473,12 +548,12 @@ class CollectorService(BaseService):
         upgrade_mode = plugin_info.get("upgrade_mode", "AUTO")
 
         endpoint, updated_version = plugin_mgr.get_endpoint(
-            plugin_id, domain_id, upgrade_mode, version
+            plugin_id, domain_id, upgrade_mode, version, use_cache=True
         )
 
         if updated_version and version != updated_version:
             _LOGGER.debug(
-                f"[collect] upgrade plugin version: {version} -> {updated_version}"
+                f"[plan_job] upgrade plugin version: {version} -> {updated_version}"
             )
             collector_vo = self._update_collector_plugin(
                 endpoint, updated_version, plugin_info, collector_vo
@@ -494,81 +569,89 @@ class CollectorService(BaseService):
             domain_id,
         )
 
-        duplicated_job_vos = job_mgr.get_duplicate_jobs(
-            collector_id, domain_id, workspace_id, params.get("secret_id")
-        )
-
-        for job_vo in duplicated_job_vos:
-            job_mgr.make_canceled_by_vo(job_vo)
+        job_id = job_vo.job_id
+        job_vo = job_mgr.make_inprogress_by_vo(job_vo, len(tasks))
 
-        # create job
-        params["plugin_id"] = plugin_id
-        params["total_tasks"] = len(tasks)
-        params["remained_tasks"] = len(tasks)
-        job_vo = job_mgr.create_job(collector_vo, params)
+        if job_vo is None:
+            _LOGGER.debug(f"[plan_job] job is canceled while planning: {job_id}")
+            return None
 
-        _LOGGER.debug(f"[collect] total tasks ({job_vo.job_id}): {len(tasks)}")
+        _LOGGER.debug(f"[plan_job] total tasks ({job_vo.job_id}): {len(tasks)}")
 
         if len(tasks) > 0:
+            create_params_list = []
             for task in tasks:
                 secret_info = task["secret_info"]
-                sub_tasks = task.get("sub_tasks", [])
-                if len(sub_tasks) == 0:
-                    sub_task_count = 1
-                else:
-                    sub_task_count = len(sub_tasks)
-
-                if "sub_tasks" in task:
-                    del task["sub_tasks"]
-
-                create_params = {
-                    "total_sub_tasks": sub_task_count,
-                    "remained_sub_tasks": sub_task_count,
-                    "job_id": job_vo.job_id,
-                    "collector_id": job_vo.collector_id,
-                    "secret_id": secret_info.get("secret_id"),
-                    "service_account_id": secret_info.get("service_account_id"),
-                    "project_id": secret_info.get("project_id"),
-                    "workspace_id": secret_info.get("workspace_id"),
-                    "domain_id": domain_id,
-                }
+                sub_task_count = max(len(task.get("sub_tasks", [])), 1)
+
+                create_params_list.append(
+                    {
+                        "total_sub_tasks": sub_task_count,
+                        "remained_sub_tasks": sub_task_count,
+                        "job_id": job_vo.job_id,
+                        "collector_id": job_vo.collector_id,
+                        "secret_id": secret_info.get("secret_id"),
+                        "service_account_id": secret_info.get("service_account_id"),
+                        "project_id": secret_info.get("project_id"),
+                        "workspace_id": secret_info.get(
+                            "workspace_id", job_vo.workspace_id
+                        ),
+                        "domain_id": domain_id,
+                    }
+                )
 
-                task.update({"collector_id": collector_id, "job_id": job_vo.job_id})
+            # create job tasks
+            job_task_vos = job_task_mgr.create_job_tasks(create_params_list)
 
-                try:
-                    # create job task
-                    job_task_vo = job_task_mgr.create_job_task(create_params)
-                    task.update({"job_task_id": job_task_vo.job_task_id})
+            push_tasks = []
+            failed_job_task_vos = []
+            for task, job_task_vo in zip(tasks, job_task_vos):
+                sub_tasks = task.pop("sub_tasks", [])
+                error_info = task.pop("error", None)
 
-                    if len(sub_tasks) > 0:
-                        for sub_task in sub_tasks:
-                            task_options = sub_task.get("task_options", {})
-                            task.update(
-                                {"task_options": task_options, "is_sub_task": True}
-                            )
-                            _LOGGER.debug(
-                                f"[collect] push sub task ({job_task_vo.job_task_id}) => {utils.dump_json(task_options)}"
+                task.update(
+                    {
+                        "collector_id": collector_id,
+                        "job_id": job_vo.job_id,
+                        "job_task_id": job_task_vo.job_task_id,
+                    }
+                )
+
+                if error_info:
+                    job_task_mgr.add_error(
+                        job_task_vo,
+                        error_info["error_code"],
+                        error_info["message"],
+                    )
+
+                if "secret_data" not in task:
+                    failed_job_task_vos.append(job_task_vo)
+                elif len(sub_tasks) > 0:
+                    for sub_task in sub_tasks:
+                        push_tasks.append(
+                            dict(
+                                task,
+                                task_options=sub_task.get("task_options", {}),
+                                is_sub_task=True,
                             )
-                            job_task_mgr.push_job_task(task)
-                    else:
-                        _LOGGER.debug(
-                            f"[collect] push job task ({job_task_vo.job_task_id})"
                         )
-                        job_task_mgr.push_job_task(task)
+                else:
+                    push_tasks.append(task)
 
-                except Exception as e:
-                    _LOGGER.error(
-                        f"[collect] Error to create job task ({job_vo.job_id}): {e}",
-                        exc_info=True,
-                    )
-                    job_mgr.make_failure_by_vo(job_vo)
+            job_task_mgr.push_job_tasks(push_tasks)
+
+            _LOGGER.debug(
+                f"[plan_job] push job tasks ({job_vo.job_id}): "
+                f"job_tasks = {len(job_task_vos)}, messages = {len(push_tasks)}"
+            )
+
+            for job_task_vo in failed_job_task_vos:
+                job_task_mgr.make_failure_by_vo(job_task_vo)
 
             self.collector_mgr.update_last_collected_time(collector_vo)
-            return job_vo
         else:
             # close job if no tasks
             job_mgr.make_success_by_vo(job_vo)
-            return job_vo
 
     def _get_tasks(
         self,
@@ -580,12 +663,11 @@ class CollectorService(BaseService):
         secret_filter: dict,
         domain_id: str,
     ) -> list:
-        secret_mgr: SecretManager = self.locator.get_manager(SecretManager)
-        collector_plugin_mgr: CollectorPluginManager = self.locator.get_manager(
-            CollectorPluginManager
-        )
+        """Resolve secrets and sub tasks of a collector in parallel
+        - A task whose secret is not resolved has "error" without "secret_data".
+        - A task whose sub tasks are not resolved has "error" and is collected without sub tasks.
+        """
 
-        tasks = []
         secret_ids = self._get_secret_ids_from_filter(
             secret_filter,
             collector_provider,
@@ -593,9 +675,84 @@ class CollectorService(BaseService):
             params.get("secret_id"),
         )
 
-        for secret_id in secret_ids:
-            secret_info = secret_mgr.get_secret(secret_id, domain_id)
-            secret_data = secret_mgr.get_secret_data(secret_id, domain_id)
+        if len(secret_ids) == 0:
+            return []
+
+        worker_count = config.get_global("COLLECT_TASK_WORKER_COUNT", 10)
+        timeout = config.get_global("COLLECT_TASK_TIMEOUT", 60)
+        meta = self.transaction.meta
+
+        executor = ThreadPoolExecutor(max_workers=min(worker_count, len(secret_ids)))
+        futures = [
+            executor.submit(
+                self._get_task,
+                meta,
+                secret_id,
+                endpoint,
+                collector_id,
+                plugin_info,
+                domain_id,
+            )
+            for secret_id in secret_ids
+        ]
+
+        tasks = []
+        try:
+            # all tasks share one deadline instead of waiting for each in turn
+            wait(futures, timeout=timeout)
+
+            for secret_id, future in zip(secret_ids, futures):
+                if future.done():
+                    tasks.append(future.result())
+                else:
+                    tasks.append(
+                        self._make_error_task(
+                            secret_id,
+                            plugin_info,
+                            domain_id,
+                            "ERROR_COLLECTOR_SECRET",
+                            f"Timed out resolving the secret. (timeout = {timeout}s)",
+                        )
+                    )
+        finally:
+            # timed out calls are left to finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return tasks
+
+    def _get_task(
+        self,
+        meta: dict,
+        secret_id: str,
+        endpoint: str,
+        collector_id: str,
+        plugin_info: dict,
+        domain_id: str,
+    ) -> dict:
+        create_transaction(meta=meta, thread_id=str(threading.current_thread().ident))
+
+        try:
+            secret_mgr: SecretManager = self.locator.get_manager(SecretManager)
+            collector_plugin_mgr: CollectorPluginManager = self.locator.get_manager(
+                CollectorPluginManager
+            )
+
+            try:
+                secret_info = secret_mgr.get_secret(secret_id, domain_id)
+                secret_data = secret_mgr.get_secret_data(secret_id, domain_id)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[get_tasks] failed to get secret ({collector_id}): "
+                    f"{secret_id} => {e}"
+                )
+                return self._make_error_task(
+                    secret_id,
+                    plugin_info,
+                    domain_id,
+                    "ERROR_COLLECTOR_SECRET",
+                    self._get_error_message(e),
+                )
+
             _task = {
                 "plugin_info": plugin_info,
                 "secret_info": secret_info,
@@ -613,11 +770,41 @@ class CollectorService(BaseService):
                 _task["sub_tasks"] = response.get("tasks", [])
 
             except Exception as e:
-                pass
+                _LOGGER.error(
+                    f"[get_tasks] failed to get sub tasks ({collector_id}): "
+                    f"{secret_id} => {e}"
+                )
+                PluginManager.delete_endpoint_cache(plugin_info["plugin_id"], domain_id)
+                _task["error"] = {
+                    "error_code": "ERROR_COLLECTOR_GET_TASKS",
+                    "message": self._get_error_message(e),
+                }
 
-            tasks.append(_task)
+            return _task
+        finally:
+            delete_transaction()
 
-        return tasks
+    @staticmethod
+    def _make_error_task(
+        secret_id: str,
+        plugin_info: dict,
+        domain_id: str,
+        error_code: str,
+        error_message: str,
+    ) -> dict:
+        return {
+            "plugin_info": plugin_info,
+            "secret_info": {"secret_id": secret_id},
+            "domain_id": domain_id,
+            "error": {"error_code": error_code, "message": error_message},
+        }
+
+    @staticmethod
+    def _get_error_message(error: Exception) -> str:
+        if isinstance(error, ERROR_BASE):
+            return error.message
+        else:
+            return str(error)
 
     @staticmethod
     def _check_secrets(
@@ -849,6 +1036,7 @@ class CollectorService(BaseService):
             collector_id=collector_id, rule_type="MANAGED", domain_id=domain_id
         )
         old_collector_rule_vos.delete()
+        collector_rule_mgr.increase_collector_rule_version(collector_id, domain_id)
 
     @staticmethod
     def _make_secret_filter(
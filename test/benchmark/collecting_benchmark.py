@@ -0,0 +1,407 @@
+"""End-to-end throughput benchmark of CollectingManager.collecting_resources
+
+The collector plugin is replaced with an in-process generator of synthetic
+CloudServiceType, Region and CloudService payloads, and the identity service
+is replaced with a stand-in. Everything else (services, managers and models)
+runs as in the worker against a local mongod.
+
+Usage (from the repository root):
+    PYTHONPATH=src python -m test.benchmark.collecting_benchmark \\
+        --mongo-uri mongodb://localhost:27017 --count 10000 --rounds 3 --change-ratio 0.1
+
+Each round is a new job collecting the same resources. The first round creates
+them and the next rounds update the changed ones (--change-ratio).
+"""
+
+import argparse
+import json
+import random
+import resource
+import threading
+import time
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from pymongo import monitoring
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.core.model.mongo_model import MongoModel
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+DOMAIN_ID = "domain-benchmark"
+WORKSPACE_ID = "workspace-benchmark"
+PROJECT_ID = "project-benchmark"
+COLLECTOR_ID = "collector-benchmark"
+SECRET_ID = "secret-benchmark"
+SERVICE_ACCOUNT_ID = "sa-benchmark"
+PLUGIN_ID = "plugin-benchmark"
+PROVIDER = "benchmark"
+IGNORED_COMMANDS = ["hello", "ismaster", "isMaster", "ping", "endSessions"]
+
+
+class CommandCounter(monitoring.CommandListener):
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        if event.command_name not in IGNORED_COMMANDS:
+            with self._lock:
+                self.count += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+class LatencyRecorder(object):
+    """
+    Latency of each resource from being yielded by the plugin to being upserted.
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self._yielded_at = {}
+        self._lock = threading.Lock()
+
+    def yielded(self, resource_data: dict) -> None:
+        self._yielded_at[id(resource_data)] = time.perf_counter()
+
+    def upserted(self, resource_data: dict) -> None:
+        upserted_at = time.perf_counter()
+        with self._lock:
+            if yielded_at := self._yielded_at.pop(id(resource_data), None):
+                self.latencies.append(upserted_at - yielded_at)
+
+    def percentile(self, percent: int) -> float:
+        if len(self.latencies) == 0:
+            return 0.0
+
+        latencies = sorted(self.latencies)
+        index = min(int(len(latencies) * percent / 100), len(latencies) - 1)
+        return latencies[index]
+
+
+class SyntheticPlugin(object):
+    """
+    Stand-in of CollectorPluginManager.collect which yields synthetic payloads.
+    """
+
+    def __init__(self, args: argparse.Namespace, latency_recorder: LatencyRecorder):
+        self.args = args
+        self.latency_recorder = latency_recorder
+        self.round = 0
+        self._revisions = {}
+
+    def collect(self, *args, **kwargs):
+        for index in range(self.args.cloud_service_types):
+            yield self._record(self._make_cloud_service_type(index))
+
+        for index in range(self.args.regions):
+            yield self._record(self._make_region(index))
+
+        changed = random.Random(self.args.seed + self.round)
+        for index in range(self.args.count):
+            if self.round > 0 and changed.random() < self.args.change_ratio:
+                self._revisions[index] = self.round
+
+            yield self._record(self._make_cloud_service(index))
+
+    def _record(self, resource_data: dict) -> dict:
+        self.latency_recorder.yielded(resource_data)
+        return resource_data
+
+    @staticmethod
+    def _make_cloud_service_type(index: int) -> dict:
+        return {
+            "resource_type": "inventory.CloudServiceType",
+            "match_rules": {"1": ["name", "group", "provider"]},
+            "resource": {
+                "name": f"Type{index}",
+                "group": f"Group{index}",
+                "provider": PROVIDER,
+                "metadata": {},
+                "tags": {"spaceone:icon": "https://benchmark/icon.svg"},
+            },
+        }
+
+    @staticmethod
+    def _make_region(index: int) -> dict:
+        return {
+            "resource_type": "inventory.Region",
+            "match_rules": {"1": ["region_code", "provider"]},
+            "resource": {
+                "name": f"Region {index}",
+                "region_code": f"region-{index}",
+                "provider": PROVIDER,
+            },
+        }
+
+    def _make_cloud_service(self, index: int) -> dict:
+        type_index = index % self.args.cloud_service_types
+
+        return {
+            "resource_type": "inventory.CloudService",
+            "match_rules": {
+                "1": [
+                    "reference.resource_id",
+                    "provider",
+                    "cloud_service_type",
+                    "cloud_service_group",
+                ]
+            },
+            "resource": {
+                "name": f"resource-{index}",
+                "account": "benchmark-account",
+                "provider": PROVIDER,
+                "cloud_service_group": f"Group{type_index}",
+                "cloud_service_type": f"Type{type_index}",
+                "region_code": f"region-{index % self.args.regions}",
+                "reference": {"resource_id": f"benchmark:resource:{index}"},
+                "data": self._make_data(index),
+                "tags": {
+                    f"tag-{tag_index}": f"value-{index}-{tag_index}"
+                    for tag_index in range(self.args.tag_count)
+                },
+                "metadata": {},
+            },
+        }
+
+    def _make_data(self, index: int) -> dict:
+        data = {
+            "index": index,
+            "revision": self._revisions.get(index, 0),
+            "payload": "x" * self.args.data_size,
+        }
+
+        for depth in range(self.args.depth, 0, -1):
+            data = {f"level_{depth}": data, "depth": depth}
+
+        return data
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--mongo-uri", default="mongodb://localhost:27017")
+    parser.add_argument("--db", default="inventory-benchmark")
+    parser.add_argument("--count", type=int, default=1000, help="cloud services")
+    parser.add_argument("--cloud-service-types", type=int, default=5)
+    parser.add_argument("--regions", type=int, default=3)
+    parser.add_argument("--data-size", type=int, default=1024, help="bytes per data")
+    parser.add_argument("--tag-count", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=3, help="nesting depth of data")
+    parser.add_argument("--change-ratio", type=float, default=0.1)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--set-global",
+        action="append",
+        default=[],
+        metavar="KEY=JSON",
+        help="override a global config (e.g. COLLECTING_BATCH_SIZE=1)",
+    )
+    parser.add_argument("--keep-db", action="store_true")
+    return parser.parse_args()
+
+
+def init_database(args: argparse.Namespace, command_counter: CommandCounter):
+    connect(db=args.db, host=args.mongo_uri, event_listeners=[command_counter])
+
+    __import__("spaceone.inventory.model", fromlist=["*"])
+    for model in MongoModel.__subclasses__():
+        model._create_index()
+        model._load_default_meta()
+
+
+def init_config(args: argparse.Namespace) -> None:
+    config.init_conf(package="spaceone.inventory")
+    config.set_service_config()
+
+    for global_config in args.set_global:
+        key, value = global_config.split("=", 1)
+        config.set_global_force(**{key: json.loads(value)})
+
+
+def make_params(job_id: str, job_task_id: str) -> dict:
+    return {
+        "collector_id": COLLECTOR_ID,
+        "job_id": job_id,
+        "job_task_id": job_task_id,
+        "domain_id": DOMAIN_ID,
+        "plugin_info": {"plugin_id": PLUGIN_ID, "options": {}},
+        "task_options": None,
+        "secret_info": {
+            "secret_id": SECRET_ID,
+            "provider": PROVIDER,
+            "service_account_id": SERVICE_ACCOUNT_ID,
+            "project_id": PROJECT_ID,
+            "workspace_id": WORKSPACE_ID,
+        },
+        "secret_data": {"data": {}},
+        "token": "benchmark-token",
+    }
+
+
+def run_round(latency_recorder: LatencyRecorder, command_counter: CommandCounter):
+    from spaceone.inventory.manager.collecting_manager import CollectingManager
+    from spaceone.inventory.model.job_model import Job
+    from spaceone.inventory.model.job_task_model import JobTask
+
+    # remained_tasks is never decreased to 0 to skip the metric queries of a finished job
+    job_vo = Job.create(
+        {
+            "collector_id": COLLECTOR_ID,
+            "plugin_id": PLUGIN_ID,
+            "resource_group": "WORKSPACE",
+            "total_tasks": 2,
+            "remained_tasks": 2,
+            "workspace_id": WORKSPACE_ID,
+            "domain_id": DOMAIN_ID,
+        }
+    )
+    job_task_vo = JobTask.create(
+        {
+            "status": "PENDING",
+            "total_sub_tasks": 1,
+            "remained_sub_tasks": 1,
+            "job_id": job_vo.job_id,
+            "secret_id": SECRET_ID,
+            "collector_id": COLLECTOR_ID,
+            "service_account_id": SERVICE_ACCOUNT_ID,
+            "project_id": PROJECT_ID,
+            "workspace_id": WORKSPACE_ID,
+            "domain_id": DOMAIN_ID,
+        }
+    )
+
+    create_transaction(thread_id=str(threading.current_thread().ident))
+    latency_recorder.latencies = []
+    start_command_count = command_counter.count
+    start_time = time.perf_counter()
+
+    try:
+        collecting_mgr = CollectingManager()
+        collecting_mgr.collecting_resources(
+            make_params(job_vo.job_id, job_task_vo.job_task_id)
+        )
+    finally:
+        delete_transaction()
+
+    elapsed_time = time.perf_counter() - start_time
+    job_task_vo.reload()
+
+    return {
+        "elapsed_time": elapsed_time,
+        "command_count": command_counter.count - start_command_count,
+        "job_task": job_task_vo,
+    }
+
+
+def print_report(
+    round_index: int, args: argparse.Namespace, latency_recorder, round_result
+):
+    job_task_vo = round_result["job_task"]
+    resource_count = args.count + args.cloud_service_types + args.regions
+    elapsed_time = round_result["elapsed_time"]
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    report = {
+        "round": round_index + 1,
+        "status": job_task_vo.status,
+        "resources": resource_count,
+        "elapsed_time": round(elapsed_time, 3),
+        "throughput": round(resource_count / elapsed_time, 1),
+        "latency_p50_ms": round(latency_recorder.percentile(50) * 1000, 3),
+        "latency_p99_ms": round(latency_recorder.percentile(99) * 1000, 3),
+        "mongo_ops_per_resource": round(
+            round_result["command_count"] / resource_count, 2
+        ),
+        "peak_rss_mb": round(max_rss / 1024, 1),
+        "created_count": job_task_vo.created_count,
+        "updated_count": job_task_vo.updated_count,
+        "unchanged_count": job_task_vo.unchanged_count,
+        "failure_count": job_task_vo.failure_count,
+        "phase_timings": job_task_vo.phase_timings,
+    }
+
+    print(json.dumps(report))
+
+
+def main():
+    from spaceone.inventory.manager.collecting_manager import CollectingManager
+    from spaceone.inventory.manager.collector_plugin_manager import (
+        CollectorPluginManager,
+    )
+    from spaceone.inventory.manager.identity_manager import IdentityManager
+    from spaceone.inventory.manager.plugin_manager import PluginManager
+
+    args = parse_args()
+    command_counter = CommandCounter()
+    latency_recorder = LatencyRecorder()
+    plugin = SyntheticPlugin(args, latency_recorder)
+
+    init_config(args)
+    init_database(args, command_counter)
+
+    upsert_cloud_services = CollectingManager._upsert_cloud_services
+    upsert_resource = CollectingManager._upsert_resource
+
+    def _upsert_cloud_services(self, resources, *args, **kwargs):
+        results = upsert_cloud_services(self, resources, *args, **kwargs)
+        for resource_data in resources:
+            latency_recorder.upserted(resource_data)
+        return results
+
+    def _upsert_resource(self, resource_data, *args, **kwargs):
+        result = upsert_resource(self, resource_data, *args, **kwargs)
+        latency_recorder.upserted(resource_data)
+        return result
+
+    def _get_project(self, project_id, domain_id):
+        return {"project_id": project_id, "workspace_id": WORKSPACE_ID}
+
+    def _list_with_cache(self, *args, **kwargs):
+        return {"results": [], "total_count": 0}
+
+    with patch.object(
+        PluginManager, "__init__", BaseManager.__init__
+    ), patch.object(
+        PluginManager, "get_endpoint", return_value=("grpc://benchmark:50051", None)
+    ), patch.object(
+        CollectorPluginManager, "__init__", BaseManager.__init__
+    ), patch.object(
+        CollectorPluginManager, "collect", plugin.collect
+    ), patch.object(
+        IdentityManager, "__init__", BaseManager.__init__
+    ), patch.object(
+        IdentityManager, "get_project", _get_project
+    ), patch.object(
+        IdentityManager, "list_projects_with_cache", _list_with_cache
+    ), patch.object(
+        IdentityManager, "list_service_accounts_with_cache", _list_with_cache
+    ), patch.object(
+        CollectingManager, "_get_max_concurrency", return_value=None
+    ), patch.object(
+        CollectingManager, "_upsert_cloud_services", _upsert_cloud_services
+    ), patch.object(
+        CollectingManager, "_upsert_resource", _upsert_resource
+    ):
+        try:
+            for round_index in range(args.rounds):
+                plugin.round = round_index
+                round_result = run_round(latency_recorder, command_counter)
+                print_report(round_index, args, latency_recorder, round_result)
+        finally:
+            if not args.keep_db:
+                from mongoengine.connection import get_db
+
+                get_db().client.drop_database(args.db)
+
+            disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Per-row serialization cost of CloudServiceInfo
+
+Synthetic CloudService documents with wide data are converted to CloudServiceInfo
+messages with and without an only projection. Documents of the projected cases
+only have the projected fields, the same as documents loaded with only().
+No database is needed.
+
+Usage (from the repository root):
+    PYTHONPATH=src python -m test.benchmark.info_benchmark \\
+        --count 2000 --data-width 200 --rounds 3
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+from spaceone.inventory.info.cloud_service_info import CloudServiceInfo
+from spaceone.inventory.model.cloud_service_model import CloudService
+
+CASES = [
+    ("full", None),
+    ("only id, name", ["cloud_service_id", "name", "state"]),
+    ("only tags", ["cloud_service_id", "name", "tags.benchmark"]),
+    ("only data", ["cloud_service_id", "name", "data"]),
+]
+
+
+def make_cloud_service(index: int, data_width: int, only: list = None) -> CloudService:
+    values = {
+        "cloud_service_id": f"cloud-svc-{index}",
+        "name": f"cloud-service-{index}",
+        "state": "ACTIVE",
+        "provider": "benchmark",
+        "cloud_service_group": "Group",
+        "cloud_service_type": "Type",
+        "region_code": "region-1",
+        "project_id": "project-benchmark",
+        "workspace_id": "workspace-benchmark",
+        "domain_id": "domain-benchmark",
+        "ip_addresses": [f"10.0.{index // 256 % 256}.{index % 256}"],
+        "reference": {"resource_id": f"resource-{index}"},
+        "data": {
+            f"key_{key}": {"value": f"value-{index}-{key}", "size": key, "list": [1, 2]}
+            for key in range(data_width)
+        },
+        "tags": {
+            "benchmark": {
+                f"hash-{key}": {"key": f"tag_{key}", "value": f"{index}"}
+                for key in range(10)
+            }
+        },
+        "tag_keys": {"benchmark": [f"tag_{key}" for key in range(10)]},
+        "collection_info": {"collector_id": "collector-benchmark"},
+        "created_at": datetime.utcnow(),
+        "updated_at": datetime.utcnow(),
+    }
+
+    if only:
+        projected_fields = set([key.split(".", 1)[0] for key in only])
+        values = {
+            key: value for key, value in values.items() if key in projected_fields
+        }
+
+    return CloudService(**values)
+
+
+def run(args: argparse.Namespace) -> None:
+    print(f"count={args.count}, data_width={args.data_width}, rounds={args.rounds}")
+
+    for name, only in CASES:
+        cloud_svc_vos = [
+            make_cloud_service(index, args.data_width, only)
+            for index in range(args.count)
+        ]
+
+        elapsed_times = []
+        for _ in range(args.rounds):
+            started_at = time.perf_counter()
+            for cloud_svc_vo in cloud_svc_vos:
+                CloudServiceInfo(cloud_svc_vo, include_metadata=False, only=only)
+            elapsed_times.append(time.perf_counter() - started_at)
+
+        best_time = min(elapsed_times)
+        print(
+            f"{name:<16} {best_time * 1000000 / args.count:>10.1f} us/row "
+            f"{args.count / best_time:>12.0f} rows/s"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--data-width", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
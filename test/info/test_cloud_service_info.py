@@ -0,0 +1,112 @@
+import unittest
+
+import mongomock
+from google.protobuf.json_format import MessageToDict
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+
+from spaceone.inventory.info.cloud_service_info import (
+    CloudServiceInfo,
+    CloudServicesInfo,
+)
+from spaceone.inventory.model.cloud_service_model import CloudService
+
+
+class TestCloudServiceInfo(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.cloud_svc_vo = CloudService.create(
+            {
+                "cloud_service_id": "cloud-svc-1",
+                "name": "instance-1",
+                "provider": "aws",
+                "cloud_service_group": "EC2",
+                "cloud_service_type": "Instance",
+                "region_code": "ap-northeast-2",
+                "reference": {"resource_id": "arn:1"},
+                "data": {"size": 10, "os": "linux"},
+                "metadata": {"view": {}},
+                "tags": {"aws": {"hash-1": {"key": "env", "value": "prod"}}},
+                "project_id": "project-1",
+                "workspace_id": "workspace-a",
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def tearDown(self) -> None:
+        CloudService.objects.filter().delete()
+
+    @staticmethod
+    def _get_fields(info) -> list:
+        return sorted(field.name for field, _ in info.ListFields())
+
+    def test_cloud_service_info(self):
+        info = MessageToDict(
+            CloudServiceInfo(self.cloud_svc_vo), preserving_proto_field_name=True
+        )
+
+        self.assertEqual(info["cloud_service_id"], "cloud-svc-1")
+        self.assertEqual(info["reference"], {"resource_id": "arn:1"})
+        self.assertEqual(info["data"], {"size": 10.0, "os": "linux"})
+        self.assertEqual(info["tags"], {"aws": {"env": "prod"}})
+        self.assertEqual(info["metadata"], {"view": {}})
+        self.assertEqual(
+            info["created_at"], utils.datetime_to_iso8601(self.cloud_svc_vo.created_at)
+        )
+
+    def test_cloud_service_info_with_minimal(self):
+        info = CloudServiceInfo(self.cloud_svc_vo, minimal=True)
+        info_without_metadata = CloudServiceInfo(
+            self.cloud_svc_vo, include_metadata=False
+        )
+
+        self.assertEqual(
+            self._get_fields(info),
+            [
+                "cloud_service_group",
+                "cloud_service_id",
+                "cloud_service_type",
+                "name",
+                "project_id",
+                "provider",
+                "reference",
+                "region_code",
+                "state",
+            ],
+        )
+        self.assertNotIn("metadata", self._get_fields(info_without_metadata))
+        self.assertIn("data", self._get_fields(info_without_metadata))
+
+    def test_cloud_services_info_with_only(self):
+        only = ["name", "data.size", "tags.aws.env"]
+        cloud_svc_vos = CloudService.objects.filter(domain_id=self.domain_id).only(
+            "name", "data.size", "tags"
+        )
+
+        infos = CloudServicesInfo(cloud_svc_vos, 1, only=only)
+
+        # fields which are not projected are left empty
+        self.assertEqual(infos.total_count, 1)
+        self.assertEqual(self._get_fields(infos.results[0]), ["data", "name", "tags"])
+        self.assertEqual(MessageToDict(infos.results[0])["data"], {"size": 10.0})
+
+
+if __name__ == "__main__":
+    unittest.main()
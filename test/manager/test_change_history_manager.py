@@ -0,0 +1,102 @@
+import threading
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.lib.record_buffer import RecordBuffer
+from spaceone.inventory.manager.change_history_manager import ChangeHistoryManager
+from spaceone.inventory.manager.record_manager import RecordManager
+from spaceone.inventory.model.cloud_service_model import CloudService
+from spaceone.inventory.model.record_model import Record
+
+
+class TestChangeHistoryManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        create_transaction(
+            meta={
+                "collector_id": utils.generate_id("collector"),
+                "job_id": utils.generate_id("job"),
+                "plugin_id": utils.generate_id("plugin"),
+                "secret.secret_id": utils.generate_id("secret"),
+                "secret.service_account_id": utils.generate_id("sa"),
+            },
+            thread_id=str(threading.current_thread().ident),
+        )
+        self.cloud_svc_vo = CloudService.create(
+            {
+                "cloud_service_id": utils.generate_id("cloud-svc"),
+                "name": "instance",
+                "provider": "aws",
+                "cloud_service_group": "EC2",
+                "cloud_service_type": "Instance",
+                "reference": {"resource_id": "arn:1"},
+                "workspace_id": utils.generate_id("workspace"),
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def tearDown(self) -> None:
+        CloudService.objects.filter().delete()
+        Record.objects.filter().delete()
+        delete_transaction()
+
+    def test_add_new_history_with_record_buffer(self):
+        record_buffer = RecordBuffer(RecordManager().create_records, 2)
+        ch_mgr = ChangeHistoryManager(record_buffer=record_buffer)
+
+        for index in range(3):
+            ch_mgr.add_new_history(
+                self.cloud_svc_vo, {"name": f"instance-{index}", "data": {"a": 1}}
+            )
+
+        flushed_count = Record.objects.count()
+        buffered_count = len(record_buffer)
+
+        record_buffer.flush()
+        record_vos = Record.objects.filter(
+            cloud_service_id=self.cloud_svc_vo.cloud_service_id
+        )
+
+        self.assertEqual(flushed_count, 2)
+        self.assertEqual(buffered_count, 1)
+        self.assertEqual(record_vos.count(), 3)
+        self.assertEqual(len({record_vo.record_id for record_vo in record_vos}), 3)
+        self.assertEqual(
+            {record_vo.updated_by for record_vo in record_vos}, {"COLLECTOR"}
+        )
+
+    def test_add_update_history_without_changed_keys(self):
+        record_buffer = RecordBuffer(RecordManager().create_records, 1)
+        ch_mgr = ChangeHistoryManager(record_buffer=record_buffer)
+
+        ch_mgr.add_update_history(
+            self.cloud_svc_vo, {"state": "ACTIVE"}, self.cloud_svc_vo.to_dict()
+        )
+
+        self.assertEqual(len(record_buffer), 0)
+        self.assertEqual(Record.objects.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.manager.cleanup_manager import CleanupManager
+from spaceone.inventory.manager.cloud_service_manager import CloudServiceManager
+from spaceone.inventory.model.collection_state_model import CollectionState
+
+
+class TestCleanupManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        create_transaction(meta={"token": utils.random_string()})
+
+        self.collector_id = utils.generate_id("collector")
+        self.secret_id = utils.generate_id("secret")
+        self.job_task_id = utils.generate_id("job-task")
+        old_job_task_id = utils.generate_id("job-task")
+        old_updated_at = datetime.utcnow() - timedelta(hours=2)
+
+        # (cloud_service_id, job_task_id, disconnected_count, is_old)
+        for cloud_service_id, job_task_id, disconnected_count, is_old in [
+            ("cloud-svc-collected", self.job_task_id, 0, True),
+            ("cloud-svc-recent", old_job_task_id, 0, False),
+            ("cloud-svc-disconnected", old_job_task_id, 1, True),
+            ("cloud-svc-deleted", old_job_task_id, 2, True),
+        ]:
+            state_vo = CollectionState.create(
+                {
+                    "collector_id": self.collector_id,
+                    "job_task_id": job_task_id,
+                    "secret_id": self.secret_id,
+                    "cloud_service_id": cloud_service_id,
+                    "disconnected_count": disconnected_count,
+                    "domain_id": self.domain_id,
+                }
+            )
+
+            if is_old:
+                CollectionState.objects(pk=state_vo.pk).update(
+                    set__updated_at=old_updated_at
+                )
+
+    def tearDown(self) -> None:
+        CollectionState.objects.filter().delete()
+        delete_transaction()
+
+    def test_update_disconnected_and_deleted_count(self):
+        with patch.object(
+            CloudServiceManager,
+            "delete_cloud_services_by_ids",
+            side_effect=lambda cloud_service_ids, domain_id: len(cloud_service_ids),
+        ) as delete_cloud_services_by_ids:
+            count_info = CleanupManager().update_disconnected_and_deleted_count(
+                self.collector_id, self.secret_id, self.job_task_id, self.domain_id
+            )
+
+        disconnected_counts = {
+            state_vo.cloud_service_id: state_vo.disconnected_count
+            for state_vo in CollectionState.objects.filter(domain_id=self.domain_id)
+        }
+
+        self.assertEqual(count_info, {"disconnected_count": 1, "deleted_count": 1})
+        delete_cloud_services_by_ids.assert_called_once_with(
+            ["cloud-svc-deleted"], self.domain_id
+        )
+        self.assertEqual(
+            disconnected_counts,
+            {
+                "cloud-svc-collected": 0,
+                "cloud-svc-recent": 0,
+                "cloud-svc-disconnected": 2,
+                "cloud-svc-deleted": 3,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
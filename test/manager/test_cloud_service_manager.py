@@ -0,0 +1,223 @@
+import copy
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongomock.collection import BulkOperationBuilder
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.error import ERROR_RESOURCE_ALREADY_DELETED
+from spaceone.inventory.lib import query_plan_cache
+from spaceone.inventory.lib.rollback import RollbackStats
+from spaceone.inventory.manager.cloud_service_manager import CloudServiceManager
+from spaceone.inventory.manager.identity_manager import IdentityManager
+from spaceone.inventory.model.cloud_service_model import CloudService
+
+
+@patch.object(SpaceConnector, "__init__", return_value=None)
+class TestCloudServiceManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.workspace_id = utils.generate_id("workspace")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        create_transaction(meta={"token": utils.random_string()})
+
+        for index in range(6):
+            CloudService.create(
+                {
+                    "cloud_service_id": f"cloud-svc-{index}",
+                    "name": f"instance-{index}",
+                    "state": "ACTIVE",
+                    "provider": "aws" if index % 2 == 0 else "azure",
+                    "cloud_service_group": "Compute",
+                    "cloud_service_type": "Instance",
+                    "reference": {"resource_id": f"resource-{index}"},
+                    "workspace_id": self.workspace_id,
+                    "domain_id": self.domain_id,
+                }
+            )
+
+    def tearDown(self) -> None:
+        CloudService.objects.filter().delete()
+        delete_transaction()
+
+    def test_update_cloud_services_by_vos(self, *args):
+        cloud_svc_vos = list(
+            CloudService.objects.filter(
+                cloud_service_id__in=["cloud-svc-0", "cloud-svc-1"]
+            ).order_by("cloud_service_id")
+        )
+        CloudService.objects.filter(cloud_service_id="cloud-svc-1").update(
+            state="DELETED"
+        )
+        add_update = BulkOperationBuilder.add_update
+
+        # mongomock does not accept the sort option which pymongo passes to UpdateOne
+        with patch.object(
+            BulkOperationBuilder,
+            "add_update",
+            lambda builder, *args, sort=None, **kwargs: add_update(
+                builder, *args, **kwargs
+            ),
+        ):
+            results = CloudServiceManager().update_cloud_services_by_vos(
+                [({"name": "updated"}, cloud_svc_vo) for cloud_svc_vo in cloud_svc_vos]
+            )
+
+        self.assertEqual(results[0].name, "updated")
+        self.assertIsInstance(results[1], ERROR_RESOURCE_ALREADY_DELETED)
+        self.assertEqual(
+            CloudService.objects.get(cloud_service_id="cloud-svc-1").name,
+            "instance-1",
+        )
+
+    def test_count_rollbacks_of_bulk_writes(self, *args):
+        rollback_stats = RollbackStats()
+        transaction = create_transaction(
+            meta={"rollback_stats": rollback_stats, "disable_rollback": "true"},
+            thread_id=str(threading.current_thread().ident),
+        )
+        cloud_svc_mgr = CloudServiceManager()
+
+        cloud_svc_mgr.create_cloud_services(
+            [
+                {
+                    "cloud_service_id": utils.generate_id("cloud-svc"),
+                    "name": f"created-{index}",
+                    "provider": "aws",
+                    "cloud_service_group": "Compute",
+                    "cloud_service_type": "Instance",
+                    "reference": {"resource_id": f"created-{index}"},
+                    "workspace_id": self.workspace_id,
+                    "domain_id": self.domain_id,
+                }
+                for index in range(2)
+            ]
+        )
+        skipped_stats = rollback_stats.to_dict()
+
+        transaction.set_meta("disable_rollback", "false")
+        add_update = BulkOperationBuilder.add_update
+
+        with patch.object(
+            BulkOperationBuilder,
+            "add_update",
+            lambda builder, *args, sort=None, **kwargs: add_update(
+                builder, *args, **kwargs
+            ),
+        ):
+            cloud_svc_mgr.update_cloud_services_by_vos(
+                [
+                    (
+                        {"name": "updated"},
+                        CloudService.objects.get(cloud_service_id="cloud-svc-0"),
+                    )
+                ]
+            )
+
+        registered_stats = rollback_stats.to_dict()
+
+        self.assertEqual(skipped_stats["skipped"], 2)
+        self.assertEqual(skipped_stats["snapshot"]["count"], 0)
+        self.assertEqual(registered_stats["registered"], 1)
+        self.assertEqual(registered_stats["snapshot"]["count"], 1)
+
+
+    def test_reuse_query_plan(self, *args):
+        cloud_svc_mgr = CloudServiceManager()
+        query = {
+            "filter": [{"k": "tags.env", "v": utils.random_string(), "o": "eq"}],
+            "sort": [{"key": "tags.env"}],
+        }
+
+        with patch.object(
+            CloudServiceManager,
+            "_rewrite_query",
+            autospec=True,
+            side_effect=CloudServiceManager._rewrite_query,
+        ) as rewrite_query:
+            for _ in range(2):
+                cloud_svc_vos, total_count = cloud_svc_mgr.list_cloud_services(
+                    copy.deepcopy(query), change_filter=True, domain_id=self.domain_id
+                )
+
+            plan_query = cloud_svc_mgr._get_query_plan(
+                "list", copy.deepcopy(query), self.domain_id
+            )
+            plan_query["filter"].clear()
+            cached_plan_query = cloud_svc_mgr._get_query_plan(
+                "list", copy.deepcopy(query), self.domain_id
+            )
+
+        self.assertEqual(rewrite_query.call_count, 1)
+        self.assertEqual(total_count, 0)
+        # the cached plan is not changed by the query of a caller
+        self.assertEqual(len(cached_plan_query["filter"]), 2)
+        self.assertEqual(cached_plan_query["sort"][0]["key"], "tags.env")
+
+    def test_expire_query_plan_with_project_group(self, *args):
+        cloud_svc_mgr = CloudServiceManager()
+        project_group_id = utils.generate_id("pg")
+        query = {
+            "filter": [{"k": "project_group_id", "v": project_group_id, "o": "eq"}]
+        }
+        now = time.time()
+        project_ttl = config.get_global("QUERY_PLAN_PROJECT_GROUP_TTL")
+        project_ids_list = []
+
+        with patch.object(
+            IdentityManager,
+            "get_project_group_tree",
+            side_effect=[
+                {project_group_id: ["project-1"]},
+                {project_group_id: ["project-1", "project-2"]},
+            ],
+        ) as get_project_group_tree:
+            for elapsed_time in [0, project_ttl - 1, project_ttl + 1]:
+                # the query is rewritten in place, so each request has its own query
+                with patch.object(time, "time", return_value=now + elapsed_time):
+                    plan_query = cloud_svc_mgr._get_query_plan(
+                        "list", copy.deepcopy(query), self.domain_id
+                    )
+
+                project_ids_list.append(sorted(plan_query["filter"][0]["v"]))
+
+        self.assertEqual(get_project_group_tree.call_count, 2)
+        self.assertEqual(
+            project_ids_list,
+            [["project-1"], ["project-1"], ["project-1", "project-2"]],
+        )
+
+    def test_evict_oldest_query_plan(self, *args):
+        plan_keys = [utils.random_string() for _ in range(3)]
+
+        for index, plan_key in enumerate(plan_keys):
+            query_plan_cache.set_query_plan(plan_key, {"index": index}, 60, 2)
+
+        self.assertIsNone(query_plan_cache.get_query_plan(plan_keys[0]))
+        self.assertEqual(query_plan_cache.get_query_plan(plan_keys[2]), {"index": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
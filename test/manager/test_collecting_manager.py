@@ -0,0 +1,372 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.conf.collector_conf import CREATED, ERROR
+from spaceone.inventory.lib.match_index import (
+    acquire_match_index,
+    release_match_index,
+)
+from spaceone.inventory.manager.cloud_service_manager import CloudServiceManager
+from spaceone.inventory.manager.collecting_manager import CollectingManager
+from spaceone.inventory.model.cloud_service_model import CloudService
+from spaceone.inventory.model.collection_state_model import CollectionState
+from spaceone.inventory.model.job_task_model import JobTask
+
+
+def make_cloud_service(resource_id: str, name: str) -> dict:
+    return {
+        "resource_type": "inventory.CloudService",
+        "state": "SUCCESS",
+        "match_rules": {
+            "1": [
+                "reference.resource_id",
+                "provider",
+                "cloud_service_type",
+                "cloud_service_group",
+            ]
+        },
+        "resource": {
+            "name": name,
+            "provider": "aws",
+            "cloud_service_group": "EC2",
+            "cloud_service_type": "Instance",
+            "region_code": "us-east-1",
+            "data": {"name": name},
+            "reference": {"resource_id": resource_id},
+        },
+    }
+
+
+@patch.object(SpaceConnector, "dispatch", return_value={"results": []})
+@patch.object(SpaceConnector, "__init__", return_value=None)
+class TestCollectingManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.workspace_id = utils.generate_id("workspace")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.params = {
+            "collector_id": utils.generate_id("collector"),
+            "job_id": utils.generate_id("job"),
+            "job_task_id": utils.generate_id("job-task"),
+            "domain_id": self.domain_id,
+            "workspace_id": self.workspace_id,
+            "plugin_info": {"plugin_id": utils.generate_id("plugin")},
+            "task_options": None,
+            "secret_info": {
+                "secret_id": utils.generate_id("secret"),
+                "provider": "aws",
+                "service_account_id": utils.generate_id("sa"),
+                "workspace_id": self.workspace_id,
+            },
+        }
+
+        self.transaction = create_transaction(
+            meta={
+                "token": utils.random_string(),
+                "job_id": self.params["job_id"],
+                "job_task_id": self.params["job_task_id"],
+                "collector_id": self.params["collector_id"],
+                "plugin_id": self.params["plugin_info"]["plugin_id"],
+                "secret.secret_id": self.params["secret_info"]["secret_id"],
+                "secret.provider": "aws",
+                "secret.service_account_id": self.params["secret_info"][
+                    "service_account_id"
+                ],
+            }
+        )
+        self.job_task_vo = JobTask.create(
+            {
+                "job_task_id": self.params["job_task_id"],
+                "job_id": self.params["job_id"],
+                "collector_id": self.params["collector_id"],
+                "secret_id": self.params["secret_info"]["secret_id"],
+                "remained_sub_tasks": 1,
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def tearDown(self) -> None:
+        CloudService.objects.filter().delete()
+        CollectionState.objects.filter().delete()
+        JobTask.objects.filter().delete()
+        delete_transaction()
+
+    def test_upsert_duplicated_cloud_services_in_batch(self, *args):
+        resources = [
+            make_cloud_service("arn:1", "first"),
+            make_cloud_service("arn:2", "other"),
+            make_cloud_service("arn:1", "second"),
+        ]
+
+        results = CollectingManager()._upsert_cloud_services(
+            resources, self.params, self.job_task_vo
+        )
+
+        cloud_svc_vos = CloudService.objects.filter(reference__resource_id="arn:1")
+
+        self.assertEqual(results[0], CREATED)
+        self.assertEqual(results[1], CREATED)
+        self.assertNotEqual(results[2], CREATED)
+        self.assertEqual(cloud_svc_vos.count(), 1)
+        self.assertEqual(CloudService.objects.count(), 2)
+
+    def test_upsert_cloud_service_matched_with_many_resources(self, *args):
+        for _ in range(2):
+            CloudService.create(
+                {
+                    "cloud_service_id": utils.generate_id("cloud-svc"),
+                    "name": "duplicated",
+                    "provider": "aws",
+                    "cloud_service_group": "EC2",
+                    "cloud_service_type": "Instance",
+                    "reference": {"resource_id": "arn:1"},
+                    "collection_info": {"collector_id": utils.generate_id("collector")},
+                    "workspace_id": self.workspace_id,
+                    "domain_id": self.domain_id,
+                }
+            )
+
+        results = CollectingManager()._upsert_cloud_services(
+            [make_cloud_service("arn:1", "first")], self.params, self.job_task_vo
+        )
+
+        self.job_task_vo.reload()
+
+        self.assertEqual(results, [ERROR])
+        self.assertEqual(CloudService.objects.count(), 2)
+        self.assertEqual(self.job_task_vo.errors[0].error_code, "ERROR_TOO_MANY_MATCH")
+
+    def test_query_with_match_index(self, *args):
+        cloud_svc_vo = CloudService.create(
+            {
+                "cloud_service_id": utils.generate_id("cloud-svc"),
+                "name": "first",
+                "provider": "aws",
+                "cloud_service_group": "EC2",
+                "cloud_service_type": "Instance",
+                "reference": {"resource_id": "arn:1"},
+                "workspace_id": self.workspace_id,
+                "domain_id": self.domain_id,
+            }
+        )
+        resources = [
+            make_cloud_service("arn:1", "first"),
+            make_cloud_service("arn:2", "second"),
+        ]
+
+        match_index = CloudServiceManager().get_match_index(
+            config.get_global("COLLECTING_MATCH_INDEX_KEYS"),
+            self.domain_id,
+            self.workspace_id,
+        )
+        resource_manager = Mock()
+        resource_manager.find_resources_in_batch.side_effect = (
+            lambda keys, values_list, domain_id, workspace_id: {
+                values: [] for values in values_list
+            }
+        )
+
+        match_results = CollectingManager._query_with_match_rules_in_batch(
+            [resource_data["resource"] for resource_data in resources],
+            [resource_data["match_rules"] for resource_data in resources],
+            self.domain_id,
+            self.workspace_id,
+            resource_manager,
+            match_index,
+        )
+
+        # only the resource missed in the index is queried
+        values_list = resource_manager.find_resources_in_batch.call_args.args[1]
+
+        self.assertEqual(
+            match_results[0], ([{"cloud_service_id": cloud_svc_vo.cloud_service_id}], 1)
+        )
+        self.assertEqual(match_results[1], ([], 0))
+        self.assertEqual(len(values_list), 1)
+        self.assertEqual(values_list[0][0], "arn:2")
+
+    def test_upsert_cloud_service_ambiguous_in_match_index(self, *args):
+        for _ in range(2):
+            CloudService.create(
+                {
+                    "cloud_service_id": utils.generate_id("cloud-svc"),
+                    "name": "duplicated",
+                    "provider": "aws",
+                    "cloud_service_group": "EC2",
+                    "cloud_service_type": "Instance",
+                    "reference": {"resource_id": "arn:1"},
+                    "collection_info": {"collector_id": utils.generate_id("collector")},
+                    "workspace_id": self.workspace_id,
+                    "domain_id": self.domain_id,
+                }
+            )
+
+        collecting_mgr = CollectingManager()
+        collecting_mgr._acquire_match_index(self.params)
+
+        try:
+            results = collecting_mgr._upsert_cloud_services(
+                [make_cloud_service("arn:1", "first")], self.params, self.job_task_vo
+            )
+        finally:
+            collecting_mgr._release_match_index(self.params["job_task_id"])
+
+        self.job_task_vo.reload()
+
+        self.assertEqual(results, [ERROR])
+        self.assertEqual(self.job_task_vo.errors[0].error_code, "ERROR_TOO_MANY_MATCH")
+
+    def test_add_created_cloud_services_to_match_index(self, *args):
+        collecting_mgr = CollectingManager()
+        collecting_mgr._acquire_match_index(self.params)
+
+        try:
+            results = collecting_mgr._upsert_cloud_services(
+                [make_cloud_service("arn:1", "first")], self.params, self.job_task_vo
+            )
+            match_index = collecting_mgr._match_index_map[self.params["job_task_id"]]
+            cloud_service_id = match_index.lookup(
+                ("reference.resource_id", "provider"), ("arn:1", "aws")
+            )
+        finally:
+            collecting_mgr._release_match_index(self.params["job_task_id"])
+
+        cloud_svc_vo = CloudService.objects.get(reference__resource_id="arn:1")
+
+        self.assertEqual(results, [CREATED])
+        self.assertEqual(cloud_service_id, cloud_svc_vo.cloud_service_id)
+
+    def test_share_match_index_in_sub_tasks(self, *args):
+        job_task_id = self.params["job_task_id"]
+        load_func = Mock(return_value=object())
+
+        first_index = acquire_match_index(job_task_id, load_func)
+        second_index = acquire_match_index(job_task_id, load_func)
+        release_match_index(job_task_id)
+        release_match_index(job_task_id)
+        third_index = acquire_match_index(job_task_id, load_func)
+        release_match_index(job_task_id)
+
+        self.assertIs(first_index, second_index)
+        self.assertEqual(load_func.call_count, 2)
+        self.assertIsNotNone(third_index)
+
+    def test_acquire_lease_with_redis_time(self, *args):
+        conn = MagicMock()
+        acquire_script = Mock(side_effect=[1, 0])
+        conn.register_script.side_effect = [acquire_script, Mock()]
+
+        with patch(
+            "spaceone.inventory.manager.collecting_manager.get_redis_connection",
+            return_value=conn,
+        ):
+            semaphore = CollectingManager._get_concurrency_semaphore(
+                self.params["job_id"], self.domain_id, 1
+            )
+
+        with patch.object(semaphore, "_start_heartbeat"):
+            first_acquired = semaphore.acquire("holder-1")
+            second_acquired = semaphore.acquire("holder-2")
+
+        self.assertTrue(first_acquired)
+        self.assertFalse(second_acquired)
+        self.assertEqual(acquire_script.call_args.kwargs["args"][:2], ["holder-2", 1])
+        # leases are scored by the scripts with the time of redis
+        conn.zadd.assert_not_called()
+
+    def test_split_duplicated_resources(self, *args):
+        resources = [
+            make_cloud_service("arn:1", "first"),
+            make_cloud_service("arn:2", "other"),
+            make_cloud_service("arn:1", "second"),
+            make_cloud_service("arn:1", "third"),
+            {"resource_type": "inventory.CloudService", "state": "FAILURE"},
+        ]
+
+        rounds = CollectingManager._split_duplicated_resources(resources)
+
+        self.assertEqual(rounds, [[0, 1, 4], [2], [3]])
+
+    def test_get_writer_index(self, *args):
+        writer_indexes = {
+            CollectingManager._get_writer_index(
+                make_cloud_service("arn:1", name), 4
+            )
+            for name in ["first", "second", "third"]
+        }
+
+        self.assertEqual(len(writer_indexes), 1)
+        self.assertIn(writer_indexes.pop(), range(4))
+
+    def test_stop_reading_resources_on_abort(self, *args):
+        closed = threading.Event()
+
+        def read_resources():
+            try:
+                while True:
+                    yield {"resource_type": "inventory.Region", "resource": {}}
+            finally:
+                closed.set()
+
+        with patch.object(
+            CollectingManager,
+            "_upsert_collecting_resource",
+            side_effect=Exception("abort"),
+        ):
+            with self.assertRaises(Exception):
+                CollectingManager()._upsert_collecting_resources_in_pipeline(
+                    read_resources(), self.params, self.job_task_vo, 10, 2
+                )
+
+        self.assertTrue(closed.wait(5))
+
+    def test_reconcile_collection_states_on_abort(self, *args):
+        def read_resources():
+            yield make_cloud_service("arn:1", "first")
+            yield make_cloud_service("arn:2", "second")
+            raise Exception("plugin stream is broken")
+
+        batch_size = config.get_global("COLLECTING_BATCH_SIZE")
+        config.set_global(COLLECTING_BATCH_SIZE=2)
+
+        try:
+            with self.assertRaises(Exception):
+                CollectingManager()._upsert_collecting_resources(
+                    read_resources(), self.params, self.job_task_vo
+                )
+        finally:
+            config.set_global(COLLECTING_BATCH_SIZE=batch_size)
+
+        state_vos = CollectionState.objects.filter(
+            job_task_id=self.params["job_task_id"]
+        )
+
+        self.assertEqual(CloudService.objects.count(), 2)
+        self.assertEqual(state_vos.count(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from spaceone.inventory.lib.collector_rule_engine import compile_collector_rule
+from spaceone.inventory.model.collector_rule_model import (
+    CollectorRule,
+    CollectorRuleCondition,
+)
+
+
+class TestCollectorRuleEngine(unittest.TestCase):
+    def test_compile_contain_condition_with_non_string_value(self):
+        collector_rule_vo = CollectorRule(
+            collector_rule_id="collector-rule-1",
+            order=1,
+            conditions=[
+                CollectorRuleCondition(key="data.port", value=80, operator="contain"),
+                CollectorRuleCondition(
+                    key="data.name", value=404, operator="not_contain"
+                ),
+            ],
+            conditions_policy="ALL",
+            actions={"change_project": "project-a"},
+        )
+
+        compiled_rule = compile_collector_rule(collector_rule_vo)
+
+        self.assertTrue(compiled_rule.match({"data": {"port": 8080, "name": "web"}}))
+        self.assertFalse(compiled_rule.match({"data": {"port": 443, "name": "web"}}))
+        self.assertFalse(
+            compiled_rule.match({"data": {"port": "80", "name": "ERROR-404"}})
+        )
+        self.assertFalse(compiled_rule.match({"data": {"name": "web"}}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.manager.collector_rule_manager import CollectorRuleManager
+from spaceone.inventory.manager.identity_manager import IdentityManager
+from spaceone.inventory.model.collector_rule_model import CollectorRule
+
+
+@patch.object(SpaceConnector, "__init__", return_value=None)
+class TestCollectorRuleManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        create_transaction(meta={"token": utils.random_string()})
+
+        # identity snapshots are kept per domain in the process
+        self.domain_id = utils.generate_id("domain")
+        self.collector_id = utils.generate_id("collector")
+        self.projects = [
+            {
+                "project_id": f"project-{index}",
+                "workspace_id": "workspace-a",
+                "name": f"Project {index}",
+            }
+            for index in range(3)
+        ]
+
+        CollectorRule.create(
+            {
+                "collector_rule_id": utils.generate_id("collector-rule"),
+                "order": 1,
+                "rule_type": "CUSTOM",
+                "conditions_policy": "ALWAYS",
+                "actions": {
+                    "match_project": {"source": "data.project", "target": "name"}
+                },
+                "collector_id": self.collector_id,
+                "resource_group": "DOMAIN",
+                "workspace_id": "*",
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def tearDown(self) -> None:
+        CollectorRule.objects.filter().delete()
+        delete_transaction()
+
+    def _list_projects(self, params: dict, domain_id: str) -> dict:
+        page = params["query"]["page"]
+        start = page["start"] - 1
+
+        return {
+            "results": self.projects[start : start + page["limit"]],
+            "total_count": len(self.projects),
+        }
+
+    def test_match_project_with_identity_snapshot(self, *args):
+        page_size = config.get_global("IDENTITY_SNAPSHOT_PAGE_SIZE")
+        config.set_global(IDENTITY_SNAPSHOT_PAGE_SIZE=2)
+
+        try:
+            with patch.object(
+                IdentityManager, "list_projects", side_effect=self._list_projects
+            ) as list_projects, patch.object(
+                IdentityManager, "list_projects_with_cache"
+            ) as list_projects_with_cache:
+                collector_rule_mgr = CollectorRuleManager()
+                cloud_svc_data_list = [
+                    collector_rule_mgr.change_cloud_service_data(
+                        self.collector_id,
+                        self.domain_id,
+                        {"data": {"project": f"Project {index}"}},
+                    )
+                    for index in [0, 2, 2]
+                ]
+        finally:
+            config.set_global(IDENTITY_SNAPSHOT_PAGE_SIZE=page_size)
+
+        self.assertEqual(
+            [cloud_svc_data["project_id"] for cloud_svc_data in cloud_svc_data_list],
+            ["project-0", "project-2", "project-2"],
+        )
+        self.assertEqual(cloud_svc_data_list[0]["workspace_id"], "workspace-a")
+        # one snapshot is loaded in two pages instead of a query per project
+        self.assertEqual(list_projects.call_count, 2)
+        list_projects_with_cache.assert_not_called()
+
+    def test_refresh_identity_snapshot_once_per_job_task(self, *args):
+        with patch.object(
+            IdentityManager, "list_projects", side_effect=self._list_projects
+        ) as list_projects:
+            CollectorRuleManager().change_cloud_service_data(
+                self.collector_id, self.domain_id, {"data": {"project": "Project 0"}}
+            )
+
+            # the snapshot loaded by the previous job task misses the new project
+            collector_rule_mgr = CollectorRuleManager()
+            self.projects.append(
+                {
+                    "project_id": "project-new",
+                    "workspace_id": "workspace-a",
+                    "name": "New Project",
+                }
+            )
+            new_cloud_svc_data = collector_rule_mgr.change_cloud_service_data(
+                self.collector_id, self.domain_id, {"data": {"project": "New Project"}}
+            )
+            unknown_cloud_svc_data = collector_rule_mgr.change_cloud_service_data(
+                self.collector_id, self.domain_id, {"data": {"project": "Unknown"}}
+            )
+
+        self.assertEqual(new_cloud_svc_data["project_id"], "project-new")
+        self.assertNotIn("project_id", unknown_cloud_svc_data)
+        self.assertEqual(list_projects.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
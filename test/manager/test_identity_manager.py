@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import cache, config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.manager.identity_manager import IdentityManager
+
+
+@patch.object(SpaceConnector, "__init__", return_value=None)
+class TestIdentityManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        create_transaction(meta={"token": utils.random_string()})
+        self.domain_id = utils.generate_id("domain")
+
+    def tearDown(self) -> None:
+        delete_transaction()
+
+    @staticmethod
+    def _dispatch(method: str, params: dict, **kwargs) -> dict:
+        if method == "ProjectGroup.list":
+            return {
+                "results": [
+                    {"project_group_id": "pg-root"},
+                    {"project_group_id": "pg-child", "parent_group_id": "pg-root"},
+                    {"project_group_id": "pg-leaf", "parent_group_id": "pg-child"},
+                    {"project_group_id": "pg-empty", "parent_group_id": "pg-root"},
+                ]
+            }
+        else:
+            return {
+                "results": [
+                    {"project_id": "project-1", "project_group_id": "pg-root"},
+                    {"project_id": "project-2", "project_group_id": "pg-child"},
+                    {"project_id": "project-3", "project_group_id": "pg-leaf"},
+                    {"project_id": "project-4"},
+                ]
+            }
+
+    def test_get_project_group_tree(self, *args):
+        with patch.object(
+            SpaceConnector, "dispatch", side_effect=self._dispatch
+        ) as dispatch:
+            project_group_tree = IdentityManager().get_project_group_tree(
+                self.domain_id
+            )
+
+        self.assertEqual(
+            {
+                project_group_id: sorted(project_ids)
+                for project_group_id, project_ids in project_group_tree.items()
+            },
+            {
+                "pg-root": ["project-1", "project-2", "project-3"],
+                "pg-child": ["project-2", "project-3"],
+                "pg-leaf": ["project-3"],
+                "pg-empty": [],
+            },
+        )
+        # the tree is built from one list call of project groups and projects
+        self.assertEqual(
+            [call.args[0] for call in dispatch.call_args_list],
+            ["ProjectGroup.list", "Project.list"],
+        )
+        self.assertEqual(
+            {call.kwargs["x_domain_id"] for call in dispatch.call_args_list},
+            {self.domain_id},
+        )
+
+    def test_get_project_group_tree_with_cache(self, *args):
+        cache_data = {}
+
+        with patch.object(cache, "is_set", return_value=True), patch.object(
+            cache, "get", side_effect=cache_data.get
+        ), patch.object(
+            cache,
+            "set",
+            side_effect=lambda key, value, expire=None: cache_data.update(
+                {key: value}
+            ),
+        ) as cache_set, patch.object(
+            SpaceConnector, "dispatch", side_effect=self._dispatch
+        ) as dispatch:
+            project_group_trees = [
+                IdentityManager().get_project_group_tree(self.domain_id)
+                for _ in range(2)
+            ]
+
+        self.assertEqual(project_group_trees[0], project_group_trees[1])
+        self.assertEqual(dispatch.call_count, 2)
+        cache_set.assert_called_once_with(
+            f"inventory:project-group-tree:{self.domain_id}",
+            project_group_trees[0],
+            expire=config.get_global("PROJECT_GROUP_TREE_CACHE_TTL"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.manager.job_manager import JobManager
+from spaceone.inventory.model.job_model import Job
+
+
+class TestJobManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        create_transaction(meta={"token": utils.random_string()})
+        self.job_vo = Job.create(
+            {
+                "status": "PLANNING",
+                "collector_id": utils.generate_id("collector"),
+                "plugin_id": utils.generate_id("plugin"),
+                "resource_group": "WORKSPACE",
+                "workspace_id": utils.generate_id("workspace"),
+                "domain_id": self.domain_id,
+            }
+        )
+
+    def tearDown(self) -> None:
+        Job.objects.filter().delete()
+        delete_transaction()
+
+    def test_make_inprogress_by_vo(self):
+        job_vo = JobManager().make_inprogress_by_vo(self.job_vo, 3)
+
+        self.assertEqual(job_vo.status, "IN_PROGRESS")
+        self.assertEqual(job_vo.total_tasks, 3)
+        self.assertEqual(job_vo.remained_tasks, 3)
+
+    def test_make_inprogress_by_vo_after_cancel(self):
+        job_mgr = JobManager()
+
+        # the job is canceled by a new collect while its tasks are planned
+        job_mgr.make_canceled_by_vo(Job.objects.get(job_id=self.job_vo.job_id))
+        job_vo = job_mgr.make_inprogress_by_vo(self.job_vo, 3)
+
+        self.assertIsNone(job_vo)
+        self.assertEqual(Job.objects.get(job_id=self.job_vo.job_id).status, "CANCELED")
+        self.assertEqual(Job.objects.get(job_id=self.job_vo.job_id).total_tasks, 0)
+
+
+    @patch.object(JobManager, "_run_metric_queries")
+    def test_increase_finished_tasks(self, run_metric_queries):
+        job_mgr = JobManager()
+        job_id = self.job_vo.job_id
+        job_mgr.make_inprogress_by_vo(self.job_vo, 3)
+
+        job_mgr.increase_success_tasks(
+            job_id, self.domain_id, {"created_count": 2, "updated_count": 0}
+        )
+        job_mgr.increase_failure_tasks(job_id, self.domain_id, {"updated_count": 1})
+        unfinished_job_vo = Job.objects.get(job_id=job_id)
+
+        job_mgr.increase_success_tasks(job_id, self.domain_id, {"deleted_count": 3})
+        job_vo = Job.objects.get(job_id=job_id)
+
+        self.assertEqual(unfinished_job_vo.status, "IN_PROGRESS")
+        self.assertEqual(unfinished_job_vo.remained_tasks, 1)
+        self.assertEqual(job_vo.status, "FAILURE")
+        self.assertIsNotNone(job_vo.finished_at)
+        self.assertEqual(job_vo.remained_tasks, 0)
+        self.assertEqual(job_vo.success_tasks, 2)
+        self.assertEqual(job_vo.failure_tasks, 1)
+        self.assertEqual(
+            [job_vo.created_count, job_vo.updated_count, job_vo.deleted_count],
+            [2, 1, 3],
+        )
+        run_metric_queries.assert_called_once_with(job_vo.plugin_id, self.domain_id)
+
+    @patch.object(JobManager, "_run_metric_queries")
+    def test_increase_finished_tasks_without_changes(self, run_metric_queries):
+        job_mgr = JobManager()
+        job_mgr.make_inprogress_by_vo(self.job_vo, 1)
+
+        job_mgr.increase_success_tasks(
+            self.job_vo.job_id, self.domain_id, {"created_count": 0}
+        )
+
+        self.assertEqual(Job.objects.get(job_id=self.job_vo.job_id).status, "SUCCESS")
+        run_metric_queries.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,329 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, queue, utils
+from spaceone.core.queue.redis_queue import RedisQueue
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.lib import concurrency
+from spaceone.inventory.manager.job_manager import JobManager
+from spaceone.inventory.manager.job_task_manager import JobTaskManager
+from spaceone.inventory.model.job_task_model import JobTask
+
+
+class TestJobTaskManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        self.token = utils.random_string()
+        create_transaction(
+            meta={"token": self.token},
+            thread_id=str(threading.current_thread().ident),
+        )
+        self.params = {
+            "collector_id": utils.generate_id("collector"),
+            "job_id": utils.generate_id("job"),
+            "job_task_id": utils.generate_id("job-task"),
+            "domain_id": utils.generate_id("domain"),
+            "plugin_info": {},
+            "secret_info": {},
+        }
+
+    def tearDown(self) -> None:
+        JobTask.objects.filter().delete()
+        delete_transaction()
+
+    def test_create_job_tasks(self, *args):
+        job_task_mgr = JobTaskManager()
+        queryset_cls = type(JobTask.objects)
+
+        with patch.object(
+            queryset_cls, "insert", autospec=True, side_effect=queryset_cls.insert
+        ) as insert:
+            job_task_vos = job_task_mgr.create_job_tasks(
+                [
+                    {
+                        "secret_id": f"secret-{index}",
+                        "job_id": self.params["job_id"],
+                        "collector_id": self.params["collector_id"],
+                        "domain_id": self.params["domain_id"],
+                    }
+                    for index in range(3)
+                ]
+            )
+
+        job_task_ids = [job_task_vo.job_task_id for job_task_vo in job_task_vos]
+
+        insert.assert_called_once()
+        self.assertEqual(len(set(job_task_ids)), 3)
+        self.assertEqual(
+            [job_task_vo.secret_id for job_task_vo in job_task_vos],
+            ["secret-0", "secret-1", "secret-2"],
+        )
+        self.assertEqual(
+            JobTask.objects.filter(job_id=self.params["job_id"]).count(), 3
+        )
+
+        job_task_mgr.transaction.execute_rollback()
+
+        self.assertEqual(
+            JobTask.objects.filter(job_id=self.params["job_id"]).count(), 0
+        )
+
+    def test_push_job_tasks(self, *args):
+        with patch.object(
+            concurrency, "_get_queue_connection", return_value=MagicMock()
+        ), patch.object(queue, "put") as queue_put:
+            JobTaskManager().push_job_tasks(
+                [dict(self.params, secret_id=f"secret-{index}") for index in range(3)]
+            )
+
+        tasks = [json.loads(call.args[1]) for call in queue_put.call_args_list]
+
+        self.assertEqual(
+            [task["stages"][0]["params"]["params"]["secret_id"] for task in tasks],
+            ["secret-0", "secret-1", "secret-2"],
+        )
+        self.assertEqual(
+            {task["stages"][0]["params"]["params"]["token"] for task in tasks},
+            {self.token},
+        )
+
+    def test_put_queue_items_with_redis_pipeline(self, *args):
+        queue_cls = MagicMock(spec=RedisQueue)
+        queue_cls.conn = MagicMock()
+        queue_cls.channel = "collector_q"
+
+        with patch.object(
+            concurrency, "_get_queue_connection", return_value=queue_cls
+        ), patch.object(queue, "put") as queue_put:
+            concurrency.put_queue_items(
+                "collector_q", [f"task-{index}" for index in range(5)], chunk_size=2
+            )
+
+        pipe = queue_cls.conn.pipeline.return_value
+
+        queue_put.assert_not_called()
+        self.assertEqual(queue_cls.conn.pipeline.call_count, 3)
+        self.assertEqual(pipe.execute.call_count, 3)
+        self.assertEqual(
+            [call.args for call in pipe.rpush.call_args_list],
+            [("collector_q", f"task-{index}") for index in range(5)],
+        )
+
+    @patch.object(JobTaskManager, "_get_delayed_queue", return_value=None)
+    def test_push_delayed_job_task_without_redis(self, *args):
+        with patch.object(queue, "put") as queue_put:
+            with self.assertLogs(
+                "spaceone.inventory.manager.job_task_manager", level="WARNING"
+            ):
+                JobTaskManager().push_delayed_job_task(self.params, 0.1)
+
+            self.assertEqual(queue_put.call_count, 0)
+
+            for _ in range(50):
+                if queue_put.call_count > 0:
+                    break
+                time.sleep(0.1)
+
+        self.assertEqual(queue_put.call_count, 1)
+
+    def test_push_due_job_tasks_with_limit(self, *args):
+        delayed_queue = MagicMock()
+        delayed_queue.pop_due_items.return_value = ["task"]
+
+        with patch.object(
+            JobTaskManager, "_get_delayed_queue", return_value=delayed_queue
+        ), patch.object(queue, "put") as queue_put:
+            pushed_count = JobTaskManager().push_due_job_tasks(limit=1)
+
+        delayed_queue.pop_due_items.assert_called_once_with(1)
+        queue_put.assert_called_once()
+        self.assertEqual(pushed_count, 1)
+
+    def test_make_inprogress_in_concurrency(self, *args):
+        job_task_vos = [
+            JobTask.create(
+                {
+                    "job_task_id": utils.generate_id("job-task"),
+                    "job_id": self.params["job_id"],
+                    "domain_id": self.params["domain_id"],
+                }
+            )
+            for _ in range(3)
+        ]
+        job_task_mgr = JobTaskManager()
+
+        admitted_flags = [
+            job_task_mgr.make_inprogress_in_concurrency(job_task_vo, 2)
+            for job_task_vo in job_task_vos
+        ]
+        job_task_vos[2].reload()
+        delayed_status = job_task_vos[2].status
+
+        job_task_mgr.make_success_by_vo(job_task_vos[0])
+        is_admitted = job_task_mgr.make_inprogress_in_concurrency(job_task_vos[2], 2)
+        is_readmitted = job_task_mgr.make_inprogress_in_concurrency(job_task_vos[1], 2)
+
+        self.assertEqual(admitted_flags, [True, True, False])
+        self.assertEqual(delayed_status, "PENDING")
+        self.assertTrue(is_admitted)
+        self.assertTrue(is_readmitted)
+        self.assertEqual(job_task_vos[2].status, "IN_PROGRESS")
+
+    def test_decrease_remained_sub_tasks(self, *args):
+        job_task_vo = JobTask.create(
+            {
+                "job_task_id": self.params["job_task_id"],
+                "status": "IN_PROGRESS",
+                "total_sub_tasks": 2,
+                "remained_sub_tasks": 2,
+                "job_id": self.params["job_id"],
+                "domain_id": self.params["domain_id"],
+            }
+        )
+        job_task_mgr = JobTaskManager()
+
+        with patch.object(
+            JobTaskManager,
+            "_update_disconnected_and_deleted_count",
+            return_value={"disconnected_count": 0, "deleted_count": 1},
+        ), patch.object(JobManager, "increase_success_tasks") as increase_success:
+            unfinished_job_task_vo = job_task_mgr.decrease_remained_sub_tasks(
+                job_task_vo, {"created_count": 2, "updated_count": 1}
+            )
+            increase_success.assert_not_called()
+
+            job_task_vo = job_task_mgr.decrease_remained_sub_tasks(
+                job_task_vo, {"created_count": 1}
+            )
+
+        self.assertEqual(unfinished_job_task_vo.remained_sub_tasks, 1)
+        self.assertEqual(unfinished_job_task_vo.created_count, 2)
+        self.assertEqual(job_task_vo.remained_sub_tasks, 0)
+        increase_success.assert_called_once_with(
+            self.params["job_id"],
+            self.params["domain_id"],
+            {"created_count": 3, "updated_count": 1, "deleted_count": 1},
+        )
+        job_task_vo.reload()
+        self.assertEqual(job_task_vo.status, "SUCCESS")
+
+    def test_increase_phase_timings(self, *args):
+        job_task_vo = JobTask.create(
+            {
+                "job_task_id": self.params["job_task_id"],
+                "job_id": self.params["job_id"],
+                "domain_id": self.params["domain_id"],
+            }
+        )
+        job_task_mgr = JobTaskManager()
+
+        job_task_mgr.increase_phase_timings(
+            job_task_vo,
+            {
+                "match": {"time": 1.5, "count": 2},
+                "write": {"time": 0.5, "count": 1},
+            },
+        )
+        job_task_mgr.increase_phase_timings(
+            job_task_vo, {"match": {"time": 1.0, "count": 3}}
+        )
+
+        job_task_vo.reload()
+
+        self.assertEqual(
+            job_task_vo.phase_timings,
+            {
+                "match": {"time": 2.5, "count": 5},
+                "write": {"time": 0.5, "count": 1},
+            },
+        )
+
+    def test_flush_error_buffer_if_due(self, *args):
+        job_task_vo = JobTask.create(
+            {
+                "job_task_id": self.params["job_task_id"],
+                "job_id": self.params["job_id"],
+                "domain_id": self.params["domain_id"],
+            }
+        )
+        job_task_mgr = JobTaskManager()
+        job_task_mgr.create_error_buffer(job_task_vo)
+        flush_interval = config.get_global("JOB_TASK_ERROR_FLUSH_INTERVAL")
+
+        with patch.object(time, "time", return_value=time.time()):
+            job_task_mgr.add_error(job_task_vo, "ERROR_PLUGIN", "plugin error")
+            job_task_mgr.flush_error_buffer_if_due(job_task_vo)
+
+        job_task_vo.reload()
+        buffered_errors = list(job_task_vo.errors)
+
+        with patch.object(time, "time", return_value=time.time() + flush_interval):
+            job_task_mgr.flush_error_buffer_if_due(job_task_vo)
+
+        job_task_vo.reload()
+
+        self.assertEqual(buffered_errors, [])
+        self.assertEqual(len(job_task_vo.errors), 1)
+        self.assertEqual(job_task_vo.errors[0].message, "plugin error")
+
+    def test_flush_error_buffer_over_error_limit(self, *args):
+        job_task_vo = JobTask.create(
+            {
+                "job_task_id": self.params["job_task_id"],
+                "job_id": self.params["job_id"],
+                "domain_id": self.params["domain_id"],
+            }
+        )
+        error_limit = config.get_global("JOB_TASK_ERROR_LIMIT")
+        config.set_global(JOB_TASK_ERROR_LIMIT=5)
+
+        try:
+            job_task_mgr = JobTaskManager()
+            job_task_mgr.create_error_buffer(job_task_vo)
+
+            for _ in range(3):
+                job_task_mgr.add_error(job_task_vo, "ERROR_PLUGIN", "same error")
+
+            for index in range(5):
+                job_task_mgr.add_error(job_task_vo, "ERROR_PLUGIN", f"error {index}")
+
+            job_task_mgr.flush_error_buffer(job_task_vo)
+        finally:
+            config.set_global(JOB_TASK_ERROR_LIMIT=error_limit)
+
+        job_task_vo.reload()
+        errors = {error.message: error for error in job_task_vo.errors}
+
+        self.assertEqual(len(job_task_vo.errors), 4)
+        self.assertEqual(errors["same error"].additional["error_count"], 3)
+        self.assertIn("error 0", errors)
+        self.assertIn("error 1", errors)
+        self.assertEqual(
+            errors["3 more errors were truncated."].error_code, "ERROR_TRUNCATED"
+        )
+        self.assertEqual(job_task_vo.error_overflow_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import fnmatch
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import cache, config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.manager.plugin_manager import PluginManager
+
+
+@patch.object(SpaceConnector, "__init__", return_value=None)
+class TestPluginManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        super().setUpClass()
+
+    def setUp(self) -> None:
+        create_transaction(meta={"token": utils.random_string()})
+
+        self.domain_id = utils.generate_id("domain")
+        self.plugin_id = utils.generate_id("plugin")
+        self.cache_data = {}
+
+        # the endpoint cache needs expire and delete_pattern of a redis cache
+        self.cache_patchers = [
+            patch.object(cache, "is_set", return_value=True),
+            patch.object(cache, "get", side_effect=self.cache_data.get),
+            patch.object(cache, "set", side_effect=self._set_cache),
+            patch.object(cache, "delete_pattern", side_effect=self._delete_pattern),
+        ]
+
+        for cache_patcher in self.cache_patchers:
+            cache_patcher.start()
+
+    def tearDown(self) -> None:
+        for cache_patcher in self.cache_patchers:
+            cache_patcher.stop()
+
+        delete_transaction()
+
+    def _set_cache(self, key: str, value: dict, expire: int = None) -> bool:
+        self.cache_data[key] = value
+        return True
+
+    def _delete_pattern(self, pattern: str) -> None:
+        for key in fnmatch.filter(list(self.cache_data.keys()), pattern):
+            del self.cache_data[key]
+
+    def test_get_endpoint_with_cache(self, *args):
+        response = {"endpoint": "grpc://plugin-a:50051", "updated_version": None}
+
+        with patch.object(
+            SpaceConnector, "dispatch", return_value=response
+        ) as dispatch:
+            plugin_mgr = PluginManager()
+            endpoint_list = [
+                plugin_mgr.get_endpoint(
+                    self.plugin_id, self.domain_id, version="1.0", use_cache=True
+                )
+                for _ in range(3)
+            ]
+
+            self.assertEqual(dispatch.call_count, 1)
+
+            # plugin management APIs resolve the endpoint directly
+            plugin_mgr.get_endpoint(self.plugin_id, self.domain_id, version="1.0")
+
+            self.assertEqual(dispatch.call_count, 2)
+
+        self.assertEqual(
+            endpoint_list, [("grpc://plugin-a:50051", None) for _ in range(3)]
+        )
+
+    def test_get_endpoint_without_cache_ttl(self, *args):
+        endpoint_cache_ttl = config.get_global("PLUGIN_ENDPOINT_CACHE_TTL")
+        config.set_global(PLUGIN_ENDPOINT_CACHE_TTL=0)
+
+        try:
+            with patch.object(
+                SpaceConnector,
+                "dispatch",
+                return_value={"endpoint": "grpc://plugin-a:50051"},
+            ) as dispatch:
+                plugin_mgr = PluginManager()
+                for _ in range(2):
+                    plugin_mgr.get_endpoint(
+                        self.plugin_id, self.domain_id, use_cache=True
+                    )
+        finally:
+            config.set_global(PLUGIN_ENDPOINT_CACHE_TTL=endpoint_cache_ttl)
+
+        self.assertEqual(dispatch.call_count, 2)
+        self.assertEqual(self.cache_data, {})
+
+    def test_delete_endpoint_cache_by_updated_version(self, *args):
+        other_plugin_id = utils.generate_id("plugin")
+
+        with patch.object(
+            SpaceConnector,
+            "dispatch",
+            return_value={"endpoint": "grpc://plugin-a:50051"},
+        ):
+            plugin_mgr = PluginManager()
+            plugin_mgr.get_endpoint(
+                self.plugin_id, self.domain_id, version="1.0", use_cache=True
+            )
+            plugin_mgr.get_endpoint(
+                self.plugin_id, self.domain_id, upgrade_mode="MANUAL", use_cache=True
+            )
+            plugin_mgr.get_endpoint(
+                other_plugin_id, self.domain_id, version="1.0", use_cache=True
+            )
+
+        self.assertEqual(len(self.cache_data), 3)
+
+        with patch.object(
+            SpaceConnector,
+            "dispatch",
+            return_value={
+                "endpoint": "grpc://plugin-b:50051",
+                "updated_version": "2.0",
+            },
+        ) as dispatch:
+            plugin_mgr = PluginManager()
+            endpoint, updated_version = plugin_mgr.get_endpoint(
+                self.plugin_id, self.domain_id, version="1.1", use_cache=True
+            )
+            # the upgraded endpoint is resolved again until the version is updated
+            plugin_mgr.get_endpoint(
+                self.plugin_id, self.domain_id, version="1.0", use_cache=True
+            )
+
+        self.assertEqual(endpoint, "grpc://plugin-b:50051")
+        self.assertEqual(updated_version, "2.0")
+        self.assertEqual(dispatch.call_count, 2)
+        self.assertEqual(
+            list(self.cache_data.keys()),
+            [f"inventory:plugin-endpoint:{self.domain_id}:{other_plugin_id}:1.0:AUTO"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import call, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+
+from spaceone.inventory.model.cloud_service_model import CloudService
+from spaceone.inventory.model.note_model import Note
+from spaceone.inventory.model.record_model import Record
+from spaceone.inventory.service.cleanup_service import CleanupService
+
+
+class TestCleanupService(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        deleted_at = datetime.utcnow() - timedelta(days=100)
+
+        # (cloud_service_id, state, deleted_at)
+        for cloud_service_id, state, cloud_svc_deleted_at in [
+            *[(f"cloud-svc-{index}", "DELETED", deleted_at) for index in range(5)],
+            ("cloud-svc-recent", "DELETED", datetime.utcnow()),
+            ("cloud-svc-active", "ACTIVE", None),
+        ]:
+            CloudService.create(
+                {
+                    "cloud_service_id": cloud_service_id,
+                    "name": cloud_service_id,
+                    "provider": "aws",
+                    "cloud_service_group": "EC2",
+                    "cloud_service_type": "Instance",
+                    "reference": {"resource_id": f"arn:{cloud_service_id}"},
+                    "workspace_id": "workspace-a",
+                    "domain_id": self.domain_id,
+                }
+            )
+            CloudService.objects(cloud_service_id=cloud_service_id).update(
+                set__state=state, set__deleted_at=cloud_svc_deleted_at
+            )
+            Record.create(
+                {
+                    "action": "CREATE",
+                    "cloud_service_id": cloud_service_id,
+                    "updated_by": "COLLECTOR",
+                    "domain_id": self.domain_id,
+                }
+            )
+            Note.create(
+                {
+                    "note": "note",
+                    "cloud_service_id": cloud_service_id,
+                    "workspace_id": "workspace-a",
+                    "domain_id": self.domain_id,
+                }
+            )
+
+    def tearDown(self) -> None:
+        CloudService.objects.filter().delete()
+        Record.objects.filter().delete()
+        Note.objects.filter().delete()
+
+    def test_terminate_resources_in_chunks(self):
+        chunk_size = config.get_global("RESOURCE_TERMINATION_CHUNK_SIZE")
+        config.set_global(RESOURCE_TERMINATION_CHUNK_SIZE=2)
+
+        try:
+            with patch.object(time, "sleep") as sleep:
+                CleanupService().terminate_resources({"domain_id": self.domain_id})
+        finally:
+            config.set_global(RESOURCE_TERMINATION_CHUNK_SIZE=chunk_size)
+
+        chunk_interval = config.get_global("RESOURCE_TERMINATION_CHUNK_INTERVAL")
+        remained_ids = ["cloud-svc-recent", "cloud-svc-active"]
+
+        # 5 terminated cloud services are deleted in 3 chunks with a pause between
+        self.assertEqual(sleep.call_args_list, [call(chunk_interval)] * 2)
+        for model in [CloudService, Record, Note]:
+            self.assertEqual(
+                sorted(model.objects.filter().distinct("cloud_service_id")),
+                sorted(remained_ids),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
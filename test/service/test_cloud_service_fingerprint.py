@@ -0,0 +1,142 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.core.transaction import create_transaction, delete_transaction
+
+from spaceone.inventory.manager.collector_rule_manager import CollectorRuleManager
+from spaceone.inventory.manager.identity_manager import IdentityManager
+from spaceone.inventory.model.cloud_service_model import CloudService
+from spaceone.inventory.service import CloudServiceService
+
+
+@patch.object(CollectorRuleManager, "get_collector_rule_hash", return_value="hash")
+@patch.object(SpaceConnector, "__init__", return_value=None)
+class TestCloudServiceFingerprint(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.workspace_id = utils.generate_id("workspace")
+        cls.metadata = {
+            "collector_id": utils.generate_id("collector"),
+            "job_id": utils.generate_id("job"),
+            "plugin_id": utils.generate_id("plugin"),
+            "secret.secret_id": utils.generate_id("secret"),
+            "secret.provider": "aws",
+            "secret.service_account_id": utils.generate_id("sa"),
+        }
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self) -> None:
+        create_transaction(
+            meta=self.metadata, thread_id=str(threading.current_thread().ident)
+        )
+
+    def tearDown(self) -> None:
+        CloudService.objects.filter().delete()
+        delete_transaction()
+
+    def test_make_fingerprint_with_resolved_identity(self, *args):
+        cloud_svc_service = CloudServiceService()
+        params = {
+            "name": "instance",
+            "provider": "aws",
+            "cloud_service_group": "EC2",
+            "cloud_service_type": "Instance",
+            "data": {"size": 1},
+            "tags": {"Project": "project-a"},
+            "workspace_id": self.workspace_id,
+            "domain_id": self.domain_id,
+        }
+
+        fingerprint = cloud_svc_service._make_fingerprint(params)
+        same_fingerprint = cloud_svc_service._make_fingerprint(dict(params))
+        moved_fingerprint = cloud_svc_service._make_fingerprint(
+            {**params, "project_id": "project-b"}
+        )
+
+        self.assertIsNotNone(fingerprint)
+        self.assertEqual(fingerprint, same_fingerprint)
+        self.assertNotEqual(fingerprint, moved_fingerprint)
+
+    def test_apply_collector_rules_once_for_update(self, *args):
+        cloud_svc_vo = CloudService.create(
+            {
+                "cloud_service_id": utils.generate_id("cloud-svc"),
+                "name": "instance",
+                "provider": "aws",
+                "cloud_service_group": "EC2",
+                "cloud_service_type": "Instance",
+                "reference": {"resource_id": "arn:1"},
+                "workspace_id": self.workspace_id,
+                "domain_id": self.domain_id,
+            }
+        )
+        cloud_svc_service = CloudServiceService()
+        params_list = [
+            {
+                "cloud_service_id": cloud_svc_vo.cloud_service_id,
+                "name": "instance",
+                "provider": "aws",
+                "cloud_service_group": "EC2",
+                "cloud_service_type": "Instance",
+                "data": {"size": 1},
+                "tags": [{"key": "Project", "value": "project-a"}],
+                "workspace_id": self.workspace_id,
+                "domain_id": self.domain_id,
+            }
+        ]
+
+        with patch.object(
+            CollectorRuleManager,
+            "change_cloud_service_data",
+            side_effect=lambda collector_id, domain_id, data: {
+                **data,
+                "project_id": "project-b",
+            },
+        ) as change_cloud_service_data, patch.object(IdentityManager, "get_project"):
+            unchanged_flags = cloud_svc_service.touch_unchanged_resources(params_list)
+            params, _ = cloud_svc_service._make_update_params(
+                params_list[0], cloud_svc_vo
+            )
+
+        resolved_fingerprint = cloud_svc_service._make_fingerprint(
+            {
+                "cloud_service_id": cloud_svc_vo.cloud_service_id,
+                "name": "instance",
+                "provider": "aws",
+                "cloud_service_group": "EC2",
+                "cloud_service_type": "Instance",
+                "data": {"size": 1},
+                "tags": {"Project": "project-a"},
+                "workspace_id": self.workspace_id,
+                "domain_id": self.domain_id,
+                "project_id": "project-b",
+            }
+        )
+
+        self.assertEqual(unchanged_flags, [False])
+        self.assertEqual(change_cloud_service_data.call_count, 1)
+        self.assertEqual(params["project_id"], "project-b")
+        self.assertEqual(params["fingerprint"], resolved_fingerprint)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+
+from spaceone.inventory.service.collector_service import CollectorService
+
+
+@patch.object(SpaceConnector, "__init__", return_value=None)
+class TestCollectorServiceTasks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.inventory")
+        config.set_service_config()
+        connect(
+            "test",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+        )
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.metadata = {"token": utils.random_string()}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def _get_tasks(self, secret_ids: list, get_task) -> list:
+        collector_svc = CollectorService(metadata=self.metadata)
+
+        with patch.object(
+            CollectorService, "_get_secret_ids_from_filter", return_value=secret_ids
+        ), patch.object(CollectorService, "_get_task", side_effect=get_task):
+            return collector_svc._get_tasks(
+                {},
+                "grpc://plugin:50051",
+                utils.generate_id("collector"),
+                "aws",
+                {"plugin_id": utils.generate_id("plugin")},
+                {},
+                self.domain_id,
+            )
+
+    def test_get_tasks_with_one_deadline(self, *args):
+        released = threading.Event()
+        timeout = config.get_global("COLLECT_TASK_TIMEOUT")
+        config.set_global(COLLECT_TASK_TIMEOUT=1)
+
+        def get_task(meta, secret_id, *args):
+            released.wait(5)
+            return {"secret_info": {"secret_id": secret_id}}
+
+        try:
+            started_at = time.time()
+            tasks = self._get_tasks(["secret-1", "secret-2", "secret-3"], get_task)
+            elapsed_time = time.time() - started_at
+        finally:
+            released.set()
+            config.set_global(COLLECT_TASK_TIMEOUT=timeout)
+
+        self.assertLess(elapsed_time, 2)
+        self.assertEqual(
+            [task["error"]["error_code"] for task in tasks],
+            ["ERROR_COLLECTOR_SECRET"] * 3,
+        )
+
+    def test_get_tasks(self, *args):
+        def get_task(meta, secret_id, *args):
+            return {"secret_info": {"secret_id": secret_id}}
+
+        tasks = self._get_tasks(["secret-1", "secret-2"], get_task)
+
+        self.assertEqual(
+            [task["secret_info"]["secret_id"] for task in tasks],
+            ["secret-1", "secret-2"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()